@@ -4,34 +4,564 @@
 # ☆ File Name: DirMapper.py
 # ☆ Date: 2026-01-24
 # ☆
-# ☆ Description: Recursively maps a directory structure into a visual tree.
+# ☆ Description: Maps a directory structure into a visual tree, or
+# ☆ into JSON / NDJSON records. Folders are walked with an explicit
+# ☆ stack, so deep trees never hit the recursion limit, and output is
+# ☆ written in large chunks while the walk is still running.
 # ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
 
 import os
+import sys
+import json
+import time
+import argparse
 
-def map_directory(start_path, indent=""):
+from ignore_rules import IgnoreRules
+from prefetch import ListingPrefetcher, DEFAULT_MAX_BUFFERED
+
+# Lines joined into one write() call
+WRITE_CHUNK_LINES = 4096
+# Buffer size of the --output file
+OUTPUT_BUFFER = 1024 * 1024
+
+SORT_CHOICES = ("none", "name", "dirs", "size")
+FORMAT_CHOICES = ("text", "json", "ndjson")
+
+# Sort keys for raw DirEntry listings; "size" needs folder totals, so it only exists for MapNode
+ENTRY_SORT_KEYS = {
+    "name": lambda entry: entry.name.casefold(),
+    "dirs": lambda entry: (not entry.is_dir(), entry.name.casefold()),
+}
+NODE_SORT_KEYS = {
+    "name": lambda node: node.name.casefold(),
+    "dirs": lambda node: (node.kind != "dir", node.name.casefold()),
+    "size": lambda node: (-node.size, node.name.casefold()),
+}
+
+# Detail of a folder that was reached before (through a symlink) and is not mapped again
+LOOP = "loop"
+
+class MapOptions:
+    """Everything that shapes a map, shared by the streaming walk and build_tree()."""
+
+    def __init__(self, max_depth=None, max_entries=None, sort="none", sizes=False, rules=None,
+                 follow_symlinks=False, file_sizes=False, workers=1, max_buffered=DEFAULT_MAX_BUFFERED):
+        self.max_depth = max_depth
+        self.max_entries = max_entries
+        self.sort = sort
+        self.sizes = sizes
+        self.rules = rules
+        self.follow_symlinks = follow_symlinks
+        # Stat files while streaming so records carry their size (JSON formats)
+        self.file_sizes = file_sizes
+        # Folders listed at once; above 1 a ListingPrefetcher lists ahead of the output
+        self.workers = workers
+        # Entries the prefetcher may hold before they are written
+        self.max_buffered = max_buffered
+
+    @property
+    def needs_totals(self):
+        return self.sizes or self.sort == "size"
+
+    def may_open(self, depth):
+        """Whether sub-folders found at depth are walked. Sized maps walk everything to count it."""
+        return self.needs_totals or self.max_depth is None or depth < self.max_depth
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+def list_entries(path, rules=None):
+    # Get the files and folders of one directory, excluding hidden and ignored ones
+    with os.scandir(path) as it:
+        if not rules:
+            return [entry for entry in it if not entry.name.startswith('.')]
+        return [entry for entry in it
+                if not entry.name.startswith('.') and not rules.ignored(entry.path, entry.name, entry.is_dir())]
+
+def error_text(error):
+    if isinstance(error, PermissionError):
+        return "Permission Denied"
+    return f"Unreadable: {error.strerror}"
+
+def entry_kind(entry, follow_symlinks):
+    # Answered from the listing itself on most systems, no stat; files are checked first as the common case
+    if entry.is_file(follow_symlinks=follow_symlinks):
+        return "file"
+    if entry.is_dir(follow_symlinks=follow_symlinks):
+        return "dir"
+    # Links that are not followed, or whose target is gone
+    if entry.is_symlink():
+        return "symlink"
+    # Sockets, fifos, devices...
+    return "file"
+
+def link_target(path):
     try:
-        # Get a list of files and folders, excluding hidden ones
-        items = [i for i in os.listdir(start_path) if not i.startswith('.')]
-        
-        for index, item in enumerate(items):
-            path = os.path.join(start_path, item)
-            is_last = (index == len(items) - 1)
-            
-            # Use ASCII symbols for the tree branches
-            connector = "└── " if is_last else "├── "
-            print(f"{indent}{connector}{item}")
-            
-            if os.path.isdir(path):
+        return os.readlink(path)
+    except OSError:
+        return "?"
+
+def entry_size(entry, follow_symlinks):
+    try:
+        return entry.stat(follow_symlinks=follow_symlinks).st_size
+    except OSError:
+        return 0
+
+def folder_key(path, entry=None):
+    """(st_dev, st_ino) of a folder, following symlinks; None if it cannot be read."""
+    try:
+        st = entry.stat() if entry is not None else os.stat(path)
+        if not st.st_ino:
+            # Windows DirEntry stats leave st_ino at 0
+            st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+def claim_folder(visited, key):
+    """
+    True the first time a folder is reached. Only used when following symlinks: that is
+    the only way a walk can come back to a folder, so plain walks never pay for the stat.
+    """
+    if visited is None or key is None:
+        return True
+    if key in visited:
+        return False
+    visited.add(key)
+    return True
+
+# ☆ A folder listing is (rules, rows, hidden, error, depth); each row is
+# ☆ (kind, name, path, value, via_link), where value is the size of a file
+# ☆ (when needed), the target of a symlink, or the (st_dev, st_ino) of a
+# ☆ folder (when following symlinks). read_folder() does all the syscalls,
+# ☆ so it is what the prefetch workers run.
+
+def read_folder(path, rules, depth, options):
+    """Lists one folder at the given depth. Safe to call from worker threads."""
+    if rules:
+        rules = rules.for_folder(path)
+    try:
+        entries = list_entries(path, rules)
+    except OSError as e:
+        return rules, (), 0, error_text(e), depth
+
+    hidden = 0
+    # Sized maps sort and trim once the totals are known (build_tree)
+    if not options.needs_totals:
+        if options.sort in ENTRY_SORT_KEYS:
+            entries.sort(key=ENTRY_SORT_KEYS[options.sort])
+        if options.max_entries is not None and len(entries) > options.max_entries:
+            hidden = len(entries) - options.max_entries
+            entries = entries[:options.max_entries]
+
+    follow = options.follow_symlinks
+    want_keys = follow and options.may_open(depth)
+    stat_files = options.file_sizes or options.needs_totals
+    rows = []
+    for entry in entries:
+        kind = entry_kind(entry, follow)
+        if kind == "dir":
+            key = folder_key(entry.path, entry) if want_keys else None
+            rows.append((kind, entry.name, entry.path, key, follow and entry.is_symlink()))
+        elif kind == "file":
+            rows.append((kind, entry.name, entry.path, entry_size(entry, follow) if stat_files else None, False))
+        else:
+            rows.append((kind, entry.name, entry.path, link_target(entry.path), False))
+    return rules, rows, hidden, None, depth
+
+def listing_size(listing):
+    return len(listing[1]) + 1
+
+def sub_folder_jobs(listing, key, options):
+    """Sub-folders worth listing ahead: (key, path, rules, depth) of every folder the walk will open."""
+    rules, rows, hidden, error, depth = listing
+    if not options.may_open(depth):
+        return
+    for index, (kind, name, path, value, via_link) in enumerate(rows):
+        # Symlinked folders may turn out to be loops; the walk lists those itself once it knows
+        if kind == "dir" and not via_link:
+            yield key + (index,), path, rules, depth + 1
+
+def make_prefetcher(options):
+    """A ListingPrefetcher for options.workers > 1, else None (everything is listed in order on this thread)."""
+    if options.workers <= 1:
+        return None
+    return ListingPrefetcher(
+        lambda path, rules, depth: read_folder(path, rules, depth, options),
+        lambda listing, key: sub_folder_jobs(listing, key, options),
+        listing_size,
+        options.workers,
+        options.max_buffered,
+    )
+
+def _lister(options, prefetcher):
+    # take(key, path, rules, depth) -> listing; keys are only meaningful to the prefetcher
+    if prefetcher is not None:
+        return prefetcher.take
+    return lambda key, path, rules, depth: read_folder(path, rules, depth, options)
+
+def _root_visited(start_path, options):
+    if not options.follow_symlinks:
+        return None
+    visited = set()
+    claim_folder(visited, folder_key(start_path))
+    return visited
+
+# ☆ A map is a flat, depth-first stream of items:
+# ☆ (depth, kind, name, is_last, opened, size, files, detail)
+# ☆   depth   1 for the items of the top folder
+# ☆   kind    "dir", "file", "symlink", "error" or "truncated"
+# ☆   opened  True when the folder's items follow right after it
+# ☆   size    bytes (folder totals only when sizes are computed), or None
+# ☆   files   file count of a folder, or None
+# ☆   detail  symlink target, error text, LOOP, or the count of a "truncated" line
+# ☆ Every output format is a plain loop over this stream.
+
+def _stream_folder(listing, key, options, visited, prefetcher):
+    """Yields (item, sub-folder job or None) for every row of one listing."""
+    rules, rows, hidden, error, depth = listing
+    if error is not None:
+        yield (depth, "error", "", True, False, None, None, error), None
+        return
+
+    may_open = options.may_open(depth)
+    last_index = len(rows) - 1
+    for index, (kind, name, path, value, via_link) in enumerate(rows):
+        is_last = index == last_index and not hidden
+        if kind == "dir":
+            if not may_open:
+                yield (depth, kind, name, is_last, False, None, None, None), None
+            elif claim_folder(visited, value):
+                yield (depth, kind, name, is_last, True, None, None, None), (key + (index,), path, rules, depth + 1)
+            else:
+                if prefetcher is not None and not via_link:
+                    prefetcher.drop(key + (index,))
+                yield (depth, kind, name, is_last, False, None, None, LOOP), None
+        elif kind == "file":
+            yield (depth, kind, name, is_last, False, value, None, None), None
+        else:
+            yield (depth, kind, name, is_last, False, None, None, value), None
+
+    if hidden:
+        yield (depth, "truncated", "", True, False, None, None, hidden), None
+
+def stream_items(start_path, options, prefetcher=None):
+    """
+    Items of a map while the folders are being listed; nothing is kept once written. With a
+    prefetcher, listings come from its workers but are still consumed in depth-first order.
+    """
+    take = _lister(options, prefetcher)
+    visited = _root_visited(start_path, options)
+    stack = [_stream_folder(take((), start_path, options.rules, 1), (), options, visited, prefetcher)]
+    while stack:
+        row = next(stack[-1], None)
+        if row is None:
+            stack.pop()
+            continue
+        item, job = row
+        yield item
+        if job is not None:
+            stack.append(_stream_folder(take(*job), job[0], options, visited, prefetcher))
+
+class MapNode:
+    """One item of a sized map. size and files of a folder cover everything below it."""
+
+    __slots__ = ("name", "kind", "size", "files", "children", "detail", "hidden", "hidden_size")
+
+    def __init__(self, name, kind, size=0):
+        self.name = name
+        self.kind = kind
+        self.size = size
+        self.files = 1 if kind == "file" else 0
+        # None for files, links and folders that are not shown opened
+        self.children = [] if kind == "dir" else None
+        # Symlink target, error text or LOOP
+        self.detail = None
+        # Entries cut by --max-entries-per-dir, still counted in size and files
+        self.hidden = 0
+        self.hidden_size = 0
+
+def build_tree(start_path, options, prefetcher=None):
+    """
+    Lists every folder once and returns the root MapNode. Sizes roll up bottom-up as each
+    folder's frame is popped off the stack, so no folder is ever walked twice. Folders below
+    max_depth are still counted but keep no children, and entries past max_entries are only
+    kept as a total, so memory follows what is printed rather than the size of the tree.
+    """
+    key = NODE_SORT_KEYS.get(options.sort)
+    max_depth = options.max_depth
+    max_entries = options.max_entries
+    take = _lister(options, prefetcher)
+    visited = _root_visited(start_path, options)
+    root = MapNode(start_path, "dir")
+    # Frame: (node, pending sub-folders as (node, job), depth)
+    stack = [_open_node(root, take((), start_path, options.rules, 1), (), visited, prefetcher)]
+    while stack:
+        node, pending, depth = stack[-1]
+        child = next(pending, None)
+        if child is not None:
+            child_node, job = child
+            stack.append(_open_node(child_node, take(*job), job[0], visited, prefetcher))
+            continue
+        stack.pop()
+        if node.children:
+            if key:
+                node.children.sort(key=key)
+            if max_depth is not None and depth > max_depth:
+                node.children = None
+            elif max_entries is not None and len(node.children) > max_entries:
+                cut = node.children[max_entries:]
+                node.hidden = len(cut)
+                node.hidden_size = sum(item.size for item in cut)
+                del node.children[max_entries:]
+        elif max_depth is not None and depth > max_depth:
+            node.children = None
+        if stack:
+            parent = stack[-1][0]
+            parent.size += node.size
+            parent.files += node.files
+    return root
+
+def _open_node(node, listing, key, visited, prefetcher):
+    rules, rows, hidden, error, depth = listing
+    if error is not None:
+        error_node = MapNode("", "error")
+        error_node.detail = error
+        node.children.append(error_node)
+    sub_folders = []
+    for index, (kind, name, path, value, via_link) in enumerate(rows):
+        if kind == "dir":
+            child = MapNode(name, kind)
+            if claim_folder(visited, value):
+                sub_folders.append((child, (key + (index,), path, rules, depth + 1)))
+            else:
+                if prefetcher is not None and not via_link:
+                    prefetcher.drop(key + (index,))
+                child.children = None
+                child.detail = LOOP
+        elif kind == "file":
+            child = MapNode(name, kind, value)
+            node.size += value
+            node.files += 1
+        else:
+            child = MapNode(name, kind)
+            child.detail = value
+        node.children.append(child)
+    return node, iter(sub_folders), depth
+
+def node_items(root):
+    """Items of a built tree, in the same order and shape as stream_items()."""
+    stack = [(1, root, iter(enumerate(root.children or ())))]
+    while stack:
+        depth, node, children = stack[-1]
+        row = next(children, None)
+        if row is None:
+            stack.pop()
+            if node.hidden:
+                yield depth, "truncated", "", True, False, node.hidden_size, None, node.hidden
+            continue
+        index, child = row
+        is_last = index == len(node.children) - 1 and not node.hidden
+        opened = child.children is not None
+        if child.kind == "dir":
+            yield depth, "dir", child.name, is_last, opened, child.size, child.files, child.detail
+            if opened:
+                stack.append((depth + 1, child, iter(enumerate(child.children))))
+        elif child.kind == "file":
+            yield depth, "file", child.name, is_last, False, child.size, None, None
+        else:
+            yield depth, child.kind, child.name, is_last, False, None, None, child.detail
+
+def text_lines(items, indent="", sizes=False):
+    """The classic tree drawing."""
+    # prefixes[d - 1] is the indent of items at depth d
+    prefixes = [indent]
+    for depth, kind, name, is_last, opened, size, files, detail in items:
+        prefix = prefixes[depth - 1]
+        # Use ASCII symbols for the tree branches
+        connector = "└── " if is_last else "├── "
+        if kind == "dir":
+            if detail == LOOP:
+                label = f"{name}  [already mapped]"
+            elif sizes:
+                noun = "file" if files == 1 else "files"
+                label = f"{name}  [{files:,} {noun}, {format_size(size)}]"
+            else:
+                label = name
+            if opened:
                 # Add extra indent for sub-folders
                 extension = "    " if is_last else "│   "
-                map_directory(path, indent + extension)
-                
-    except PermissionError:
-        print(f"{indent}└── [Permission Denied]")
+                if len(prefixes) > depth:
+                    prefixes[depth] = prefix + extension
+                else:
+                    prefixes.append(prefix + extension)
+        elif kind == "file":
+            label = f"{name}  [{format_size(size)}]" if sizes else name
+        elif kind == "symlink":
+            label = f"{name} -> {detail}"
+        elif kind == "error":
+            label = f"[{detail}]"
+        else:
+            label = f"[... {detail} more entries, {format_size(size)}]" if sizes else f"[... {detail} more entries]"
+        yield f"{prefix}{connector}{label}"
+
+def item_record(depth, kind, name, size, files, detail, path):
+    record = {"path": path, "name": name, "depth": depth, "type": kind}
+    if size is not None:
+        record["size"] = size
+    if files is not None:
+        record["files"] = files
+    if kind == "symlink":
+        record["target"] = detail
+    elif kind == "error":
+        record["error"] = detail
+    elif kind == "truncated":
+        record["count"] = detail
+    elif detail == LOOP:
+        record["loop"] = True
+    return record
+
+def _with_paths(items):
+    # Adds the "/"-joined path below the top folder to each item; error and truncated lines get their folder's path
+    parents = [""]
+    for depth, kind, name, is_last, opened, size, files, detail in items:
+        parent = parents[depth - 1]
+        path = parent + name if name else parent.rstrip("/")
+        if opened:
+            if len(parents) > depth:
+                parents[depth] = path + "/"
+            else:
+                parents.append(path + "/")
+        yield depth, kind, name, opened, size, files, detail, path
+
+def ndjson_lines(items):
+    """One flat JSON record per line: path, name, depth, type, size, plus files/target/error/count when set."""
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+    for depth, kind, name, opened, size, files, detail, path in _with_paths(items):
+        yield dumps(item_record(depth, kind, name, size, files, detail, path))
+
+def json_lines(items, root_name, root=None):
+    """
+    One nested JSON document, written as it is walked: every opened folder gets a "children"
+    list that is closed as soon as the walk leaves it. One object per line keeps it diffable.
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+    head = {"path": "", "name": root_name, "depth": 0, "type": "dir"}
+    if root is not None:
+        head["size"] = root.size
+        head["files"] = root.files
+    yield dumps(head)[:-1] + ', "children": ['
+    open_depth = 1
+    first = True
+    for depth, kind, name, opened, size, files, detail, path in _with_paths(items):
+        while depth < open_depth:
+            yield "]}"
+            open_depth -= 1
+            first = False
+        text = dumps(item_record(depth, kind, name, size, files, detail, path))
+        if opened:
+            text = text[:-1] + ', "children": ['
+        yield text if first else "," + text
+        first = True if opened else False
+        if opened:
+            open_depth += 1
+    while open_depth > 1:
+        yield "]}"
+        open_depth -= 1
+    yield "]}"
+
+def map_lines(start_path, options=None, fmt="text", indent=""):
+    """
+    Yields the output lines of a map one at a time, depth first. Plain maps stream while they
+    are listed; sizes or sort="size" need folder totals first, so the tree is built, then printed.
+    """
+    options = options or MapOptions()
+    prefetcher = make_prefetcher(options)
+    try:
+        root = None
+        if options.needs_totals:
+            root = build_tree(start_path, options, prefetcher)
+            items = node_items(root)
+        else:
+            items = stream_items(start_path, options, prefetcher)
+        if fmt == "ndjson":
+            yield from ndjson_lines(items)
+        elif fmt == "json":
+            yield from json_lines(items, start_path, root)
+        else:
+            yield from text_lines(items, indent, options.sizes)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+def write_lines(lines, out):
+    # Batch lines so a huge tree costs one write() per few thousand lines instead of one print() each
+    batch = []
+    count = 0
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= WRITE_CHUNK_LINES:
+            out.write("\n".join(batch))
+            out.write("\n")
+            count += len(batch)
+            batch.clear()
+    if batch:
+        out.write("\n".join(batch))
+        out.write("\n")
+        count += len(batch)
+    return count
+
+def map_directory(start_path, indent="", out=None, options=None, fmt="text"):
+    """Writes the map of start_path to out (stdout by default) and returns the number of lines."""
+    return write_lines(map_lines(start_path, options, fmt, indent), out or sys.stdout)
+
+def main():
+    parser = argparse.ArgumentParser(description="Draws the folder tree of a directory")
+    parser.add_argument("path", nargs="?", default=os.getcwd(), help="Folder to map (default: current directory)")
+    parser.add_argument("--max-depth", type=int, help="Only descend this many levels (1 = top folder only)")
+    parser.add_argument("--max-entries-per-dir", type=int, help="Show at most this many items per folder")
+    parser.add_argument("--sort", choices=SORT_CHOICES, default="none",
+                        help="Order of items in each folder: as listed, by name, folders first, or largest first")
+    parser.add_argument("--sizes", action="store_true", help="Show file sizes and folder totals (files, bytes)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN",
+                        help="Skip items matching a .gitignore-style pattern (repeatable), e.g. node_modules/ or *.log")
+    parser.add_argument("--gitignore", action="store_true", help="Also honour the .gitignore file of every folder")
+    parser.add_argument("--follow-symlinks", action="store_true",
+                        help="Descend into symlinked folders (each folder is still mapped only once)")
+    parser.add_argument("--format", choices=FORMAT_CHOICES, default="text",
+                        help="text tree, one nested JSON document, or one JSON record per line")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="List this many folders at once; helps on network shares (default: 1)")
+    parser.add_argument("--max-buffered", type=int, default=DEFAULT_MAX_BUFFERED,
+                        help=f"Entries listed ahead of the output at most, with --workers (default: {DEFAULT_MAX_BUFFERED})")
+    parser.add_argument("-o", "--output", help="Write the map to this file instead of the terminal")
+    args = parser.parse_args()
+
+    options = MapOptions(
+        max_depth=args.max_depth,
+        max_entries=args.max_entries_per_dir,
+        sort=args.sort,
+        sizes=args.sizes,
+        rules=IgnoreRules.from_patterns(args.exclude, args.path, read_gitignore=args.gitignore),
+        follow_symlinks=args.follow_symlinks,
+        file_sizes=args.format != "text",
+        workers=args.workers,
+        max_buffered=args.max_buffered,
+    )
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", buffering=OUTPUT_BUFFER) as out:
+            if args.format == "text":
+                out.write(f"☆ Directory Map for: {args.path}\n\n")
+            lines = map_directory(args.path, out=out, options=options, fmt=args.format)
+        print(f"☆ Wrote {lines:,} lines to {args.output} in {time.perf_counter() - start:.2f}s")
+    else:
+        if args.format == "text":
+            print(f"☆ Directory Map for: {args.path}\n")
+        map_directory(args.path, options=options, fmt=args.format)
 
 if __name__ == "__main__":
-    # Get the current directory where the script is located
-    current_dir = os.getcwd()
-    print(f"☆ Directory Map for: {current_dir}\n")
-    map_directory(current_dir)
\ No newline at end of file
+    main()
@@ -0,0 +1,134 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_mapper.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Times DirMapper with 1..N listing workers on a tree
+# ☆ whose listings are slowed down like a network share, and checks
+# ☆ that every run writes exactly the same map and that unreadable
+# ☆ folders keep their error line in sized maps.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sys
+import argparse
+import hashlib
+import shutil
+import tempfile
+import time
+import zlib
+
+# synthetic_tree lives in the shared folder of the desktop tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from synthetic_tree import make_synthetic_tree
+from DirMapper import MapOptions, make_prefetcher, stream_items, build_tree, node_items, text_lines
+from prefetch import DEFAULT_MAX_BUFFERED
+
+def inject_listing_latency(delay_ms):
+    """Wraps os.scandir with a sleep so a local tree behaves like a high latency network share."""
+    real_scandir = os.scandir
+
+    def slow_scandir(path="."):
+        time.sleep(delay_ms / 1000.0)
+        return real_scandir(path)
+
+    os.scandir = slow_scandir
+
+def check_unreadable_folders(root, every=7):
+    """
+    Denies the listing of about one folder in `every`, then maps root streamed and sized.
+    Both must show one "[Permission Denied]" line per denied folder: sized maps once dropped
+    it and showed the folder as empty. Returns (denied folders, streamed lines, sized lines).
+    """
+    real_scandir = os.scandir
+    denied = set()
+
+    def denying_scandir(path="."):
+        if path != root and zlib.crc32(os.fsencode(path)) % every == 0:
+            denied.add(path)
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    os.scandir = denying_scandir
+    try:
+        counts = []
+        for options in (MapOptions(), MapOptions(sizes=True)):
+            items = node_items(build_tree(root, options)) if options.needs_totals else stream_items(root, options)
+            counts.append(sum(line.endswith("[Permission Denied]") for line in text_lines(items, sizes=options.sizes)))
+    finally:
+        os.scandir = real_scandir
+    return len(denied), counts[0], counts[1]
+
+def timed_map(root, options):
+    """Maps root into a hash instead of a file. Returns (seconds, lines, digest, peak buffered entries, refetches)."""
+    digest = hashlib.sha1()
+    lines = 0
+    start = time.perf_counter()
+    prefetcher = make_prefetcher(options)
+    try:
+        if options.needs_totals:
+            items = node_items(build_tree(root, options, prefetcher))
+        else:
+            items = stream_items(root, options, prefetcher)
+        for line in text_lines(items, sizes=options.sizes):
+            digest.update(line.encode("utf-8"))
+            lines += 1
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+    seconds = time.perf_counter() - start
+    if prefetcher is None:
+        return seconds, lines, digest.hexdigest(), 0, 0
+    return seconds, lines, digest.hexdigest(), prefetcher.peak_buffered, prefetcher.evicted
+
+def main():
+    parser = argparse.ArgumentParser(description="DirMapper parallel listing benchmark")
+    parser.add_argument("--files", type=int, default=20_000, help="Files in the synthetic tree (default: 20000)")
+    parser.add_argument("--files-per-dir", type=int, default=10, help="Files per folder (default: 10)")
+    parser.add_argument("--path", help="Benchmark an existing folder instead of a synthetic tree")
+    parser.add_argument("--workers", default="1,4,8,16", help="Comma-separated worker counts (default: 1,4,8,16)")
+    parser.add_argument("--latency-ms", type=float, default=2.0,
+                        help="Artificial delay per folder listing to mimic a network share (default: 2)")
+    parser.add_argument("--max-buffered", type=int, default=DEFAULT_MAX_BUFFERED,
+                        help=f"Prefetch buffer cap in entries (default: {DEFAULT_MAX_BUFFERED})")
+    parser.add_argument("--sizes", action="store_true", help="Benchmark the sized (build then print) map instead")
+    args = parser.parse_args()
+
+    temp_dir = None
+    root = args.path
+    if not root:
+        temp_dir = tempfile.mkdtemp(prefix="bench_mapper_")
+        root = temp_dir
+        print(f"☆ Building synthetic tree with {args.files:,} files in {root}...")
+        folders, _ = make_synthetic_tree(root, total_files=args.files, files_per_dir=args.files_per_dir)
+        print(f"☆ {folders:,} folders created.")
+
+    try:
+        # Warm the OS cache so only the injected latency differs between runs
+        timed_map(root, MapOptions(sizes=args.sizes))
+        denied, streamed, sized = check_unreadable_folders(root)
+        same = "same" if streamed == sized == denied else "DIFFERS"
+        print(f"☆ Unreadable folders: {denied:,} denied, error lines {streamed:,} streamed / {sized:,} sized ({same})")
+        if args.latency_ms:
+            inject_listing_latency(args.latency_ms)
+
+        print(f"\n{'WORKERS':>8} | {'SECONDS':>8} | {'LINES':>9} | {'SPEEDUP':>7} | {'PEAK BUFFER':>11} | "
+              f"{'REFETCHED':>9} | {'OUTPUT':<7}")
+        print("-" * 80)
+        baseline = None
+        reference = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            options = MapOptions(sizes=args.sizes, workers=workers, max_buffered=args.max_buffered)
+            seconds, lines, digest, peak, refetched = timed_map(root, options)
+            baseline = baseline or seconds
+            reference = reference or digest
+            same = "same" if digest == reference else "DIFFERS"
+            print(f"{workers:>8} | {seconds:>8.2f} | {lines:>9,} | {baseline / seconds:>6.2f}x | {peak:>11,} | "
+                  f"{refetched:>9,} | {same:<7}")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: ignore_rules.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: .gitignore-style pattern matching for DirMapper, so
+# ☆ ignored folders are pruned before they are ever listed.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import re
+
+GITIGNORE_NAME = ".gitignore"
+# Git itself is case sensitive; Windows folders are not
+_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+def translate(pattern):
+    """Turns one gitignore glob into a regex: * and ? stop at "/", ** crosses folders."""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            # A "]" right after "[" or "[!" is part of the set, not its end
+            end = pattern.find("]", i + 3 if pattern.startswith(("[!", "[^"), i) else i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+class IgnoreRule:
+    """
+    One pattern line. Patterns without an inner "/" match the name at any depth below base;
+    others match the path relative to base, which must be spelled the way the walk spells it.
+    """
+
+    __slots__ = ("base", "regex", "negate", "dir_only", "by_name")
+
+    def __init__(self, pattern, base):
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        self.by_name = "/" not in pattern
+        self.base = base
+        self.regex = re.compile(translate(pattern.lstrip("/")) + r"\Z", _FLAGS)
+
+    def matches(self, path, name, is_dir):
+        if self.dir_only and not is_dir:
+            return False
+        if self.by_name:
+            return self.regex.match(name) is not None
+        relative = path[len(self.base):]
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+        return self.regex.match(relative) is not None
+
+def parse_patterns(lines, base):
+    rules = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        # Trailing spaces are ignored unless escaped
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        rules.append(IgnoreRule(line, base))
+    return rules
+
+class IgnoreRules:
+    """
+    The rules in force inside one folder: its own .gitignore on top of every parent's.
+    Rule sets are shared, not copied; for_folder() only builds a new one when a folder
+    actually has a .gitignore. The last matching rule wins, like in git.
+    """
+
+    def __init__(self, rules=(), read_gitignore=False):
+        self.rules = tuple(rules)
+        self.read_gitignore = read_gitignore
+
+    @classmethod
+    def from_patterns(cls, patterns, root, read_gitignore=False):
+        """Rules for the top folder; patterns (e.g. from --exclude) are anchored at root."""
+        return cls(parse_patterns(patterns, os.path.join(root, "")), read_gitignore)
+
+    def __bool__(self):
+        return bool(self.rules) or self.read_gitignore
+
+    def for_folder(self, path):
+        """Rules that apply to the entries of path."""
+        if not self.read_gitignore:
+            return self
+        try:
+            with open(os.path.join(path, GITIGNORE_NAME), encoding="utf-8", errors="replace") as f:
+                added = parse_patterns(f, os.path.join(path, ""))
+        except OSError:
+            return self
+        return IgnoreRules(self.rules + tuple(added), True) if added else self
+
+    def ignored(self, path, name, is_dir):
+        for rule in reversed(self.rules):
+            if rule.matches(path, name, is_dir):
+                return not rule.negate
+        return False
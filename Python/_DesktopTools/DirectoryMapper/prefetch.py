@@ -0,0 +1,190 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: prefetch.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Lists folders ahead of DirMapper on a thread pool, so
+# ☆ slow listings (network shares) overlap while the map is still
+# ☆ written in its normal order.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import heapq
+import threading
+
+DEFAULT_MAX_BUFFERED = 100_000
+
+class ListingPrefetcher:
+    """
+    Runs read_folder(path, rules, depth) on worker threads ahead of a depth-first walk.
+
+    Every folder has an order key: the tuple of row indexes leading to it from the top, so
+    comparing keys gives depth-first order. Workers always start the smallest pending key,
+    i.e. the folder the walk will need next, and queue the sub-folders of every listing they
+    finish (sub_folders(listing, key) tells which). The walk collects listings with take(),
+    in its own order, so the output is the same as a single-threaded walk.
+
+    Finished listings wait in a buffer until taken, holding about max_buffered entries
+    (at most one extra listing per worker). When it is full, workers still start folders
+    the walk needs before the furthest-ahead buffered one, which is then pushed out of the
+    buffer and queued again. That way the buffer always holds what comes next. If the walk
+    needs a folder nobody has started, it lists it itself, so the walk never stalls.
+
+    If read_folder raises in a worker, the error is kept in place of the listing and
+    take() raises it for that folder, like a single-threaded walk would.
+    """
+
+    def __init__(self, read_folder, sub_folders, size_of, workers, max_buffered=DEFAULT_MAX_BUFFERED):
+        self._read_folder = read_folder
+        self._sub_folders = sub_folders
+        self._size_of = size_of
+        self.max_buffered = max(1, max_buffered)
+        # Workers wait on _work_ready, the walk waits on _done; both share one lock
+        self._lock = threading.Lock()
+        self._work_ready = threading.Condition(self._lock)
+        self._done = threading.Condition(self._lock)
+        self._heap = []
+        self._pending = set()
+        self._running = set()
+        # key -> (listing, job, error); job is kept so an evicted listing can be queued again,
+        # error is what read_folder raised (listing is then None)
+        self._results = {}
+        self._buffered = 0
+        self._dropped = set()
+        self._closed = False
+        # Peak of buffered entries and listings thrown away for space, for the benchmark
+        self.peak_buffered = 0
+        self.evicted = 0
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._work_ready.notify_all()
+            self._done.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _push(self, key, path, rules, depth):
+        # Caller holds the lock
+        if key in self._pending or key in self._running or key in self._results:
+            return
+        self._pending.add(key)
+        heapq.heappush(self._heap, (key, path, rules, depth))
+        self._work_ready.notify()
+
+    def _is_dropped(self, key):
+        dropped = self._dropped
+        return bool(dropped) and any(key[:i] in dropped for i in range(1, len(key) + 1))
+
+    def drop(self, key):
+        """Forgets a folder the walk decided not to open, and everything queued below it."""
+        with self._lock:
+            self._dropped.add(key)
+            for other in [k for k in self._results if k[:len(key)] == key]:
+                self._buffered -= self._result_size(self._results.pop(other))
+            self._work_ready.notify_all()
+
+    def _result_size(self, result):
+        listing, _, error = result
+        return 0 if error is not None else self._size_of(listing)
+
+    def _can_start(self):
+        # Caller holds the lock
+        if not self._heap:
+            return False
+        if self._buffered < self.max_buffered:
+            return True
+        # Full: only work the walk needs before something already buffered is worth doing
+        return self._heap[0][0] < max(self._results)
+
+    def _evict(self, added):
+        # Caller holds the lock. Requeues listings further ahead than the one just added until the
+        # buffer fits again; evicting the new one itself would only get it listed again right away
+        while self._buffered > self.max_buffered:
+            key = max(self._results)
+            if key <= added:
+                break
+            result = self._results.pop(key)
+            self._buffered -= self._result_size(result)
+            job = result[1]
+            self.evicted += 1
+            self._push(*job)
+
+    def take(self, key, path, rules, depth):
+        """Listing of one folder; waits for a worker that already started it, or lists it here."""
+        with self._lock:
+            while True:
+                if key in self._results:
+                    result = self._results.pop(key)
+                    self._buffered -= self._result_size(result)
+                    self._work_ready.notify()
+                    listing, _, error = result
+                    if error is not None:
+                        raise error
+                    return listing
+                if key not in self._running:
+                    # Not started yet (or never queued): claim it so no worker lists it twice
+                    self._pending.discard(key)
+                    self._running.add(key)
+                    break
+                self._done.wait()
+        try:
+            listing = self._read_folder(path, rules, depth)
+            with self._lock:
+                for child in self._sub_folders(listing, key):
+                    self._push(*child)
+            return listing
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                self._done.notify_all()
+
+    def _work(self):
+        while True:
+            with self._lock:
+                while not self._closed and not self._can_start():
+                    self._work_ready.wait()
+                if self._closed:
+                    return
+                job = heapq.heappop(self._heap)
+                key, path, rules, depth = job
+                if key not in self._pending or self._is_dropped(key):
+                    # Claimed by take() or dropped meanwhile
+                    self._pending.discard(key)
+                    continue
+                self._pending.discard(key)
+                self._running.add(key)
+            outcome = None
+            try:
+                outcome = self._read_folder(path, rules, depth), None
+            except Exception as e:
+                # Handed to take(), which raises it on the walk's thread
+                outcome = None, e
+            finally:
+                with self._lock:
+                    self._running.discard(key)
+                    if self._is_dropped(key):
+                        self._work_ready.notify()
+                    elif outcome is not None:
+                        self._store(key, job, *outcome)
+                    self._done.notify_all()
+
+    def _store(self, key, job, listing, error):
+        # Caller holds the lock
+        self._results[key] = listing, job, error
+        if error is not None:
+            return
+        self._buffered += self._size_of(listing)
+        for child in self._sub_folders(listing, key):
+            self._push(*child)
+        self._evict(key)
+        self.peak_buffered = max(self.peak_buffered, self._buffered)
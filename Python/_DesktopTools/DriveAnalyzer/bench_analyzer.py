@@ -0,0 +1,118 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_analyzer.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Compares files/sec and peak memory of the drive
+# ☆ analyzer scan against the original os.walk implementation.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sys
+import argparse
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+
+# ☆ synthetic_tree lives in the shared folder next to the scanner
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from custom_drive_analyzer import scan_drive, DEFAULT_WORKERS
+from synthetic_tree import make_synthetic_tree
+
+
+def legacy_scan(drive_path, file_limit=20):
+    """☆ The pre-scandir implementation: os.walk + getsize per file + one list of every file."""
+    file_list = []
+    folder_sizes = defaultdict(int)
+    for root, dirs, files in os.walk(drive_path):
+        for name in files:
+            try:
+                filepath = os.path.join(root, name)
+                file_size = os.path.getsize(filepath)
+                _, extension = os.path.splitext(name)
+                extension = extension.lower() if extension else "None"
+                file_list.append((name, extension, root, file_size))
+                temp_path = root
+                while True:
+                    folder_sizes[temp_path] += file_size
+                    parent = os.path.dirname(temp_path)
+                    if parent == temp_path:
+                        break
+                    temp_path = parent
+            except (OSError, PermissionError):
+                continue
+    file_list.sort(key=lambda x: x[3], reverse=True)
+    return file_list[:file_limit], folder_sizes, len(file_list)
+
+
+def peak_rss_mb():
+    """☆ Peak resident memory of this process, or None where the resource module is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ☆ Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_single(engine, path, workers):
+    """☆ Runs one engine in this process and prints its stats as JSON for the parent to collect."""
+    start = time.perf_counter()
+    if engine == "legacy":
+        _, _, files = legacy_scan(path)
+    else:
+        _, _, files = scan_drive(path, workers=workers)
+    duration = time.perf_counter() - start
+    print(json.dumps({"seconds": duration, "files": files, "peak_rss_mb": peak_rss_mb()}))
+
+
+def measure(engine, path, workers):
+    # ☆ Fresh interpreter per engine so one run's peak memory cannot hide the other's
+    cmd = [sys.executable, os.path.abspath(__file__), "--run", engine, "--path", path, "--workers", str(workers)]
+    out = subprocess.check_output(cmd, text=True)
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive analyzer scan benchmark")
+    parser.add_argument("--files", type=int, default=1_000_000, help="Files in the synthetic tree (default: 1000000)")
+    parser.add_argument("--path", help="Benchmark an existing folder instead of building a synthetic tree")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Workers for the parallel engine")
+    parser.add_argument("--run", choices=["legacy", "scandir"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_single(args.run, args.path, args.workers)
+        return
+
+    temp_dir = None
+    root = args.path
+    if not root:
+        temp_dir = tempfile.mkdtemp(prefix="bench_analyzer_")
+        root = temp_dir
+        print(f"☆ Building synthetic tree with {args.files:,} files in {root} (this takes a while)...")
+        make_synthetic_tree(root, total_files=args.files, file_size=512)
+
+    try:
+        rows = [
+            ("os.walk + getsize", measure("legacy", root, 1)),
+            ("scandir x1", measure("scandir", root, 1)),
+            (f"scandir x{args.workers}", measure("scandir", root, args.workers)),
+        ]
+        print(f"\n{'ENGINE':<20} | {'FILES':>10} | {'SECONDS':>8} | {'FILES/S':>10} | {'PEAK RSS':>10}")
+        print("-" * 70)
+        for label, r in rows:
+            rss = f"{r['peak_rss_mb']:.0f} MB" if r["peak_rss_mb"] is not None else "n/a"
+            print(f"{label:<20} | {r['files']:>10,} | {r['seconds']:>8.2f} | {r['files'] / r['seconds']:>10,.0f} | {rss:>10}")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
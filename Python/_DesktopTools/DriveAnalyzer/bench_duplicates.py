@@ -0,0 +1,84 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_duplicates.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Measures duplicate hashing throughput (MB/s) of the
+# ☆ drive analyzer at several worker counts on synthetic files.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sys
+import argparse
+import random
+import shutil
+import tempfile
+
+# ☆ The analyzer imports the shared scanner, so its folder must be on the path first
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from custom_drive_analyzer import scan_drive
+from duplicates import DuplicateCollector, find_duplicates, HASH_NAME, HEAD_BYTES
+
+
+def make_duplicate_tree(root, groups, copies, file_mb, decoys):
+    """
+    ☆ Writes groups x copies identical files, plus decoys per group that share the size
+    (half of them also share the first HEAD_BYTES), so both hashing stages get work.
+    """
+    size = int(file_mb * 1024 * 1024)
+    rng = random.Random(42)
+    for group in range(groups):
+        folder = os.path.join(root, f"group_{group:04d}")
+        os.makedirs(folder, exist_ok=True)
+        content = rng.randbytes(size)
+        for copy in range(copies):
+            with open(os.path.join(folder, f"copy_{copy}.bin"), "wb") as f:
+                f.write(content)
+        for decoy in range(decoys):
+            head = content[:HEAD_BYTES] if decoy % 2 else rng.randbytes(min(HEAD_BYTES, size))
+            with open(os.path.join(folder, f"decoy_{decoy}.bin"), "wb") as f:
+                f.write(head + rng.randbytes(size - len(head)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duplicate finder hashing benchmark")
+    parser.add_argument("--groups", type=int, default=64, help="Duplicate groups to create (default: 64)")
+    parser.add_argument("--copies", type=int, default=3, help="Identical copies per group (default: 3)")
+    parser.add_argument("--decoys", type=int, default=2, help="Same-size non-duplicates per group (default: 2)")
+    parser.add_argument("--file-mb", type=float, default=8, help="Size of each file in MB (default: 8)")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated hashing worker counts")
+    parser.add_argument("--path", help="Benchmark an existing folder instead of building synthetic files")
+    parser.add_argument("--min-size", type=float, default=1, help="Smallest file to consider in MB (default: 1)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    root = args.path
+    if not root:
+        temp_dir = tempfile.mkdtemp(prefix="bench_duplicates_")
+        root = temp_dir
+        total_mb = args.groups * (args.copies + args.decoys) * args.file_mb
+        print(f"☆ Writing {total_mb:,.0f} MB of synthetic files to {root}...")
+        make_duplicate_tree(root, args.groups, args.copies, args.file_mb, args.decoys)
+
+    try:
+        collector = DuplicateCollector(min_size=int(args.min_size * 1024 * 1024))
+        _, tree, _ = scan_drive(root, duplicates=collector)
+        groups = collector.candidate_groups(tree)
+        # ☆ One untimed pass warms the page cache, so every worker count reads from the same place
+        find_duplicates(groups, workers=1)
+
+        print(f"\n☆ Hash: {HASH_NAME} | candidates: {sum(len(p) for _, p in groups):,} files")
+        print(f"\n{'WORKERS':>8} | {'GROUPS':>8} | {'FULL READS':>10} | {'MB HASHED':>10} | {'SECONDS':>8} | {'MB/S':>8}")
+        print("-" * 68)
+        for workers in (int(w) for w in args.workers.split(",")):
+            report = find_duplicates(groups, workers=workers)
+            print(f"{workers:>8} | {len(report.groups):>8,} | {report.full_hashed:>10,} | "
+                  f"{report.bytes_hashed / (1024 * 1024):>10,.0f} | {report.seconds:>8.2f} | {report.mb_per_second:>8,.0f}")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
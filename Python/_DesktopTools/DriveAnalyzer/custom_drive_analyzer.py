@@ -2,10 +2,11 @@
 # ☆ Author: ☆ MelodyHSong ☆
 # ☆ Language: Python
 # ☆ File Name: custom_drive_analyzer.py
-# ☆ Date: 2025-12-19
+# ☆ Date: 2026-10-18
 # ☆
 # ☆ Description: Analyzes a drive for the largest files and folders.
-# ☆ Features a minimalist stat tracker (no bar) and box-styled tables.
+# ☆ Features a minimalist stat tracker (no bar), box-styled tables,
+# ☆ and a parallel directory scanner.
 # ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
 
 # Pythion-chan is slithering through directories to find the biggest files and folders!
@@ -13,27 +14,334 @@
 # Finally, she presents the findings in elegant box-styled tables for easy reading.
 
 import os
+import re
+import sys
+import argparse
+import heapq
 import shutil
 import time
+from array import array
+from datetime import datetime
 from tqdm import tqdm
-from collections import defaultdict
+from folder_tree import FolderTree
+from histograms import ScanHistograms, STALE_AGE_DAYS
+from export import export_scan
+from duplicates import DuplicateCollector, find_duplicates, DEFAULT_MIN_SIZE, HASH_NAME
+from snapshot import DEFAULT_SNAPSHOT_DIR, snapshot_path_for, save_snapshot, load_snapshot, diff_trees
+from tree_browser import browse
 
-def get_largest_items(file_limit=20, folder_limit=10):
-    # ☆ Prompt user for the drive letter
+# ☆ The parallel scanning engine is shared with FileSearcher and lives in _DesktopTools/_Shared
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from parallel_scanner import ParallelScanner, DEFAULT_WORKERS, is_file_entry, list_directory
+from scan_filter import ScanFilter, add_filter_arguments, exclude_list
+
+# ☆ Extra files kept beyond file_limit, so an incremental run can still fill the table
+# ☆ when some of last run's largest files were deleted.
+FILE_POOL_FACTOR = 4
+
+# ☆ st_blocks is always counted in 512-byte units, whatever the filesystem block size
+STAT_BLOCK_SIZE = 512
+
+def allocated_size(stat_result):
+    """☆ Bytes the file really occupies on disk. Windows has no st_blocks, so the apparent size is used there."""
+    blocks = getattr(stat_result, "st_blocks", None)
+    return stat_result.st_size if blocks is None else blocks * STAT_BLOCK_SIZE
+
+def scan_drive(drive_path, file_limit=20, workers=DEFAULT_WORKERS, pbar=None, previous=None, full=False,
+               disk_usage=False, histograms=None, scan_filter=None, duplicates=None):
+    """
+    Single pass over drive_path. Returns (top_files, tree, total_scanned) where top_files
+    holds only the file_limit largest files as (name, extension, folder, size, allocated)
+    and tree is a rolled-up FolderTree with per-folder totals.
+
+    disk_usage=True is du-style accounting: a hard-linked file counts once, under the
+    lexicographically smallest of its paths, and files and folders are ranked by allocated
+    bytes. Every name of a multi-link file is kept in tree.link_files (saved with the
+    snapshot), so unchanged folders take part in that choice without being listed again.
+
+    histograms (a ScanHistograms) is filled in during the same pass. Snapshot folders carry
+    no per-file sizes or ages, so passing it lists every folder like full=True. The same
+    goes for duplicates (a DuplicateCollector), which is handed every file as it is seen.
+
+    scan_filter (a ScanFilter) prunes excluded folders and other file systems before they
+    are listed; pruned folders do not appear in the tree at all.
+
+    With a previous tree (from load_snapshot), every folder is still stat'ed but only the
+    ones whose mtime changed are listed again; the rest reuse the snapshot's file totals
+    and subfolder names. full=True lists everything and only keeps the folder pairing,
+    so growers/shrinkers can still be reported.
+    """
+    # ☆ Min-heap of (rank_size, name, folder_id, size, allocated): the smallest kept file sits on top
+    pool_limit = file_limit * FILE_POOL_FACTOR
+    top_files = []
+    tree = FolderTree(drive_path)
+    previous_ids = array('q', [0 if previous is not None else -1])
+    # ☆ Only folders that were discovered but not listed yet need a path -> id lookup
+    pending_ids = {drive_path: 0}
+    total_scanned = 0
+    full = full or histograms is not None or duplicates is not None
+    # ☆ Names of multi-link files as (st_dev << 64 | st_ino) -> [(folder_id, name, size, allocated, stat)].
+    # ☆ Their inode is credited once the scan is over, so the owner does not depend on which
+    # ☆ worker reached a folder first. Only files with st_nlink > 1 land here: a handful, not one per file.
+    link_names = {}
+    if disk_usage and previous is not None and previous.link_files is None:
+        # ☆ A snapshot without link records cannot say which reused files are hard links
+        full = True
+
+    if previous is not None:
+        old_offsets, old_children = previous.children_index()
+        old_names = previous.names
+        old_mtimes = previous.mtimes
+        old_pool = {}
+        for rank_size, name, old_id, size, allocated in previous.file_pool:
+            old_pool.setdefault(old_id, []).append((rank_size, name, size, allocated))
+        old_links = {}
+        for old_id, name, link_key, size, allocated, owned in previous.link_files or ():
+            old_links.setdefault(old_id, []).append((name, link_key, size, allocated, owned))
+
+    def old_child_ids(old_id):
+        return old_children[old_offsets[old_id]:old_offsets[old_id + 1]]
+
+    prune = scan_filter.skip_dir if scan_filter is not None and scan_filter.active else None
+
+    def list_folder(task):
+        """☆ Runs in the scanner's workers: returns ((mtime_ns, entries, None) or (mtime_ns, None, reused children), child tasks)."""
+        path, old_id = task
+        mtime = os.stat(path).st_mtime_ns
+        if old_id >= 0 and not full and old_mtimes[old_id] == mtime:
+            # ☆ Same mtime, same direct entries: no listing needed, the snapshot knows the subfolders
+            children = [c for c in old_child_ids(old_id)
+                        if prune is None or not prune(os.path.join(path, old_names[c]))]
+            return (mtime, None, children), [(os.path.join(path, old_names[c]), c) for c in children]
+        entries, sub_dirs = list_directory(path, prune)
+        if old_id < 0:
+            return (mtime, entries, None), [(sub_dir, -1) for sub_dir in sub_dirs]
+        by_name = {old_names[c]: c for c in old_child_ids(old_id)}
+        return (mtime, entries, None), [(sub_dir, by_name.get(os.path.basename(sub_dir), -1)) for sub_dir in sub_dirs]
+
+    def keep_file(rank_size, name, folder_id, file_size, allocated):
+        if len(top_files) < pool_limit:
+            heapq.heappush(top_files, (rank_size, name, folder_id, file_size, allocated))
+        elif pool_limit and rank_size > top_files[0][0]:
+            heapq.heapreplace(top_files, (rank_size, name, folder_id, file_size, allocated))
+
+    scanner = ParallelScanner(workers=workers, lister=list_folder)
+    for (root, old_id), (mtime, entries, reused_children) in scanner.scan((drive_path, 0 if previous is not None else -1)):
+        folder_id = pending_ids.pop(root)
+        tree.mtimes[folder_id] = mtime
+
+        if entries is None:
+            # ☆ Unchanged folder: copy its own totals and largest files from the snapshot
+            for child in reused_children:
+                child_id = tree.add_folder(folder_id, old_names[child])
+                previous_ids.append(child)
+                pending_ids[os.path.join(root, old_names[child])] = child_id
+            link_records = old_links.get(old_id, ()) if disk_usage else ()
+            link_file_names = {record[0] for record in link_records}
+            for rank_size, name, file_size, allocated in old_pool.get(old_id, ()):
+                if name not in link_file_names:
+                    keep_file(rank_size, name, folder_id, file_size, allocated)
+            # ☆ Hard links go back into the ownership choice; take out what the last run credited here
+            owned_files = owned_bytes = owned_allocated = 0
+            for name, link_key, file_size, allocated, owned in link_records:
+                link_names.setdefault(link_key, []).append((folder_id, name, file_size, allocated, None))
+                if owned:
+                    owned_files += 1
+                    owned_bytes += file_size
+                    owned_allocated += allocated
+            batch_count = previous.direct_files[old_id] - owned_files
+            tree.add_files(folder_id, batch_count, previous.direct_bytes[old_id] - owned_bytes,
+                           previous.direct_allocated[old_id] - owned_allocated)
+            tree.reused_folders += 1
+            total_scanned += batch_count
+            if pbar is not None:
+                pbar.update(batch_count)
+            continue
+
+        by_name = {old_names[c]: c for c in old_child_ids(old_id)} if old_id >= 0 else {}
+        batch_count = 0
+        batch_bytes = 0
+        batch_allocated = 0
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_ids[entry.path] = tree.add_folder(folder_id, entry.name)
+                    previous_ids.append(by_name.get(entry.name, -1))
+                    continue
+            except OSError:
+                pass
+            if not is_file_entry(entry):
+                continue
+            try:
+                # ☆ DirEntry caches its stat on Windows; elsewhere this is a single lstat
+                st = entry.stat(follow_symlinks=False)
+                if disk_usage and st.st_nlink == 0:
+                    # ☆ The cached Windows stat leaves st_ino/st_nlink at zero; ask for the real ones
+                    st = os.stat(entry.path, follow_symlinks=False)
+            except OSError:
+                continue
+
+            if disk_usage and st.st_nlink > 1:
+                # ☆ Counted after the scan, under whichever of its names sorts first
+                link_names.setdefault((st.st_dev << 64) | st.st_ino, []).append(
+                    (folder_id, entry.name, st.st_size, allocated_size(st), st))
+                continue
+
+            batch_count += 1
+            file_size = st.st_size
+            allocated = allocated_size(st)
+            keep_file(allocated if disk_usage else file_size, entry.name, folder_id, file_size, allocated)
+            batch_bytes += file_size
+            batch_allocated += allocated
+            if histograms is not None:
+                histograms.add(entry.name, allocated if disk_usage else file_size, st.st_mtime)
+            if duplicates is not None:
+                duplicates.add(file_size, folder_id, entry.name, st, entry.path)
+
+        # ☆ Each folder only records its own files; subfolders are added in rollup()
+        tree.add_files(folder_id, batch_count, batch_bytes, batch_allocated)
+        total_scanned += batch_count
+        if pbar is not None:
+            pbar.update(batch_count)
+
+    tree.link_files = [] if disk_usage else None
+    for link_key, names in link_names.items():
+        paths = [os.path.join(tree.path(folder_id), name) for folder_id, name, _, _, _ in names]
+        owner = min(range(len(names)), key=paths.__getitem__)
+        for index, (folder_id, name, file_size, allocated, _) in enumerate(names):
+            tree.link_files.append((folder_id, name, link_key, file_size, allocated, index == owner))
+        folder_id, name, file_size, allocated, st = names[owner]
+        tree.add_files(folder_id, 1, file_size, allocated)
+        keep_file(allocated, name, folder_id, file_size, allocated)
+        total_scanned += 1
+        if pbar is not None:
+            pbar.update(1)
+        # ☆ Reused names carry no stat, but histograms and duplicates always list every folder
+        if st is not None and histograms is not None:
+            histograms.add(name, allocated, st.st_mtime)
+        if st is not None and duplicates is not None:
+            duplicates.add(file_size, folder_id, name, st, paths[owner])
+
+    tree.rollup()
+    tree.previous_ids = previous_ids
+    tree.file_pool = sorted(top_files, reverse=True)
+
+    largest = []
+    for _, name, folder_id, size, allocated in tree.file_pool[:file_limit]:
+        _, extension = os.path.splitext(name)
+        largest.append((name, extension.lower() if extension else "None", tree.path(folder_id), size, allocated))
+    return largest, tree, total_scanned
+
+def print_change_table(title, rows):
+    """☆ Box table of (folder, delta_bytes, new_total) rows from diff_trees()."""
+    print(f"\n╔{'═'*88}╗")
+    print(f"║ {title:^86} ║")
+    print(f"╠{'═'*60}╦{'═'*12}╦{'═'*14}╣")
+    print(f"║ {'FOLDER PATH':<58} ║ {'CHANGE(GB)':<10} ║ {'SIZE NOW (GB)':<12} ║")
+    print(f"╠{'═'*60}╬{'═'*12}╬{'═'*14}╣")
+    for path, delta, total in rows:
+        print(f"║ {path[:58]:<58} ║ {delta / (1024**3):>+10.2f} ║ {total / (1024**3):>12.2f} ║")
+    if not rows:
+        print(f"║ {'(no changes)':<58} ║ {'':<10} ║ {'':<12} ║")
+    print(f"╚{'═'*60}╩{'═'*12}╩{'═'*14}╝")
+
+def print_histogram_tables(histograms, limit=15):
+    """☆ Box tables for the extension, size and age histograms gathered during the scan."""
+    print(f"\n╔{'═'*75}╗")
+    print(f"║ {'TOP ' + str(limit) + ' FILE TYPES BY SIZE':^73} ║")
+    print(f"╠{'═'*20}╦{'═'*16}╦{'═'*16}╦{'═'*20}╣")
+    print(f"║ {'TYPE':<18} ║ {'FILES':<14} ║ {'SIZE (GB)':<14} ║ {'> ' + str(STALE_AGE_DAYS) + ' DAYS (GB)':<18} ║")
+    print(f"╠{'═'*20}╬{'═'*16}╬{'═'*16}╬{'═'*20}╣")
+    for extension, files, total, stale in histograms.extension_rows(limit):
+        print(f"║ {extension[:18]:<18} ║ {files:>14,} ║ {total / (1024**3):>14.2f} ║ {stale / (1024**3):>18.2f} ║")
+    print(f"╚{'═'*20}╩{'═'*16}╩{'═'*16}╩{'═'*20}╝")
+
+    for title, rows in (("FILES BY SIZE", histograms.size_rows()), ("FILES BY AGE (LAST MODIFIED)", histograms.age_rows())):
+        print(f"\n╔{'═'*54}╗")
+        print(f"║ {title:^52} ║")
+        print(f"╠{'═'*20}╦{'═'*16}╦{'═'*16}╣")
+        print(f"║ {'BUCKET':<18} ║ {'FILES':<14} ║ {'SIZE (GB)':<14} ║")
+        print(f"╠{'═'*20}╬{'═'*16}╬{'═'*16}╣")
+        for label, files, total in rows:
+            print(f"║ {label:<18} ║ {files:>14,} ║ {total / (1024**3):>14.2f} ║")
+        print(f"╚{'═'*20}╩{'═'*16}╩{'═'*16}╝")
+
+def print_skipped_table(scan_filter, limit=15):
+    """☆ Box table of the folders the filter pruned, slowest check first (a slow one is usually a stale mount)."""
+    rows = scan_filter.report_rows()
+    print(f"\n╔{'═'*88}╗")
+    print(f"║ {f'SKIPPED {len(rows)} FOLDERS (NEVER LISTED)':^86} ║")
+    print(f"╠{'═'*60}╦{'═'*14}╦{'═'*12}╣")
+    print(f"║ {'FOLDER PATH':<58} ║ {'REASON':<12} ║ {'CHECK (ms)':<10} ║")
+    print(f"╠{'═'*60}╬{'═'*14}╬{'═'*12}╣")
+    for path, reason, seconds in rows[:limit]:
+        print(f"║ {path[:58]:<58} ║ {reason:<12} ║ {seconds * 1000:>10.3f} ║")
+    if len(rows) > limit:
+        print(f"║ {f'... and {len(rows) - limit} more':<58} ║ {'':<12} ║ {'':<10} ║")
+    print(f"╚{'═'*60}╩{'═'*14}╩{'═'*12}╝")
+
+def print_duplicate_table(report, limit=15):
+    """☆ Box table of confirmed duplicate groups, most reclaimable space first."""
+    print(f"\n╔{'═'*112}╗")
+    print(f"║ {f'DUPLICATE FILES: {report.reclaimable / (1024**3):.2f} GB RECLAIMABLE IN {len(report.groups)} GROUPS':^110} ║")
+    print(f"╠{'═'*12}╦{'═'*8}╦{'═'*15}╦{'═'*73}╣")
+    print(f"║ {'EACH (MB)':<10} ║ {'COPIES':<6} ║ {'RECLAIM (GB)':<13} ║ {'LOCATIONS':<71} ║")
+    print(f"╠{'═'*12}╬{'═'*8}╬{'═'*15}╬{'═'*73}╣")
+    for size, paths in report.groups[:limit]:
+        reclaim = size * (len(paths) - 1)
+        for i, path in enumerate(paths[:3]):
+            if i == 0:
+                print(f"║ {size / (1024**2):>10.1f} ║ {len(paths):>6} ║ {reclaim / (1024**3):>13.2f} ║ {path[-71:]:<71} ║")
+            else:
+                print(f"║ {'':<10} ║ {'':<6} ║ {'':<13} ║ {path[-71:]:<71} ║")
+        if len(paths) > 3:
+            print(f"║ {'':<10} ║ {'':<6} ║ {'':<13} ║ {f'... and {len(paths) - 3} more':<71} ║")
+    if not report.groups:
+        print(f"║ {'':<10} ║ {'':<6} ║ {'':<13} ║ {'(no duplicates found)':<71} ║")
+    print(f"╚{'═'*12}╩{'═'*8}╩{'═'*15}╩{'═'*73}╝")
+    print(f"☆ Hashed {report.head_hashed:,} candidates ({report.full_hashed:,} in full), "
+          f"{report.bytes_hashed / (1024**2):,.0f} MB in {report.seconds:.2f}s "
+          f"= {report.mb_per_second:,.0f} MB/s ({HASH_NAME}).")
+
+def resolve_drive_path(text):
+    """
+    ☆ Turns the prompt answer into the folder to scan. On Windows a bare drive letter
+    (C, C: or C:\\) becomes C:\\; anything else, and every answer on other systems,
+    is taken as a plain path such as / or /mnt/data.
+    """
+    text = text.strip()
+    if os.name == "nt" and re.fullmatch(r"[A-Za-z]:?[\\/]?", text):
+        return text[0].upper() + ":" + os.sep
+    return os.path.abspath(os.path.expanduser(text)) if text else ""
+
+def get_largest_items(file_limit=20, folder_limit=10, workers=DEFAULT_WORKERS,
+                      use_snapshot=True, full=False, snapshot_dir=DEFAULT_SNAPSHOT_DIR, disk_usage=False,
+                      show_histograms=False, drive=None, exports=(), one_file_system=False, excludes=(),
+                      open_browser=False, find_dupes=False, dup_min_size=DEFAULT_MIN_SIZE):
+    # ☆ Prompt user for the drive letter or path
     print("┌────────────────────────────────────────┐")
     print("│      ☆ STORAGE ANALYSIS TOOL ☆         │")
     print("└────────────────────────────────────────┘")
-    user_input = input("☆ Enter drive letter (e.g., C, D, E): ").strip().upper()
+    user_input = drive if drive else input("☆ Enter drive letter or path (e.g., C, D, /): ")
     
     # ☆ Clean and validate drive path
-    drive_path = os.path.normpath(user_input.rstrip(":\\") + ":") + os.sep
+    drive_path = resolve_drive_path(user_input)
     
-    if not os.path.exists(drive_path):
-        print(f"☆ Error: Drive '{drive_path}' not found or inaccessible.")
+    if not drive_path or not os.path.isdir(drive_path):
+        print(f"☆ Error: Drive '{drive_path or user_input.strip()}' not found or inaccessible.")
         return
 
-    file_list = []
-    folder_sizes = defaultdict(int)
+    # ☆ Last run's snapshot of this drive lets unchanged folders skip their listing
+    scan_filter = ScanFilter(drive_path, one_file_system, excludes)
+    filter_key = f"{one_file_system}|{'|'.join(sorted(excludes))}" if scan_filter.active else ""
+    snapshot_file = snapshot_path_for(drive_path, snapshot_dir, disk_usage, filter_key)
+    previous = None
+    if use_snapshot:
+        loaded = load_snapshot(snapshot_file)
+        if loaded is not None and loaded[0].names[0] == drive_path:
+            previous, created = loaded
+            print(f"☆ Comparing against snapshot from {datetime.fromtimestamp(created):%Y-%m-%d %H:%M}")
+
     start_time = time.time()
     
     # ☆ Minimalist Stat Tracker: Shows description, file count, elapsed time, and speed.
@@ -44,63 +352,81 @@ def get_largest_items(file_limit=20, folder_limit=10):
         bar_format='{desc}: {n_fmt}{unit} [{elapsed}, {rate_fmt}]'
     )
 
-    for root, dirs, files in os.walk(drive_path):
-        for name in files:
-            try:
-                filepath = os.path.join(root, name)
-                file_size = os.path.getsize(filepath)
-                
-                _, extension = os.path.splitext(name)
-                extension = extension.lower() if extension else "None"
-                
-                file_list.append((name, extension, root, file_size))
-                
-                # ☆ Aggregate sizes upward
-                temp_path = root
-                while True:
-                    folder_sizes[temp_path] += file_size
-                    parent = os.path.dirname(temp_path)
-                    if parent == temp_path:
-                        break
-                    temp_path = parent
-                
-                pbar.update(1)
-            except (OSError, PermissionError):
-                continue
-    
-    total_scanned = pbar.n
+    histograms = ScanHistograms() if show_histograms else None
+    collector = DuplicateCollector(dup_min_size) if find_dupes else None
+    largest_files, tree, total_scanned = scan_drive(drive_path, file_limit, workers, pbar, previous, full,
+                                                    disk_usage, histograms, scan_filter, collector)
     pbar.close()
     
     duration = max(time.time() - start_time, 0.1)
 
-    # ☆ Sort data
-    file_list.sort(key=lambda x: x[3], reverse=True)
-    sorted_folders = sorted(folder_sizes.items(), key=lambda x: x[1], reverse=True)
+    # ☆ Only files sharing a size with another file are ever read
+    duplicate_report = None
+    if collector is not None:
+        groups = collector.candidate_groups(tree)
+        hash_bar = tqdm(total=sum(len(paths) for _, paths in groups), desc="☆ Hashing same-size files",
+                        unit=" files", dynamic_ncols=True)
+        duplicate_report = find_duplicates(groups, workers, progress=lambda done: hash_bar.update(done - hash_bar.n))
+        hash_bar.close()
+
+    if use_snapshot:
+        try:
+            save_snapshot(snapshot_file, tree)
+        except OSError as e:
+            print(f"☆ Could not save snapshot: {e}")
+
+    # ☆ Full results for dashboards; the tables below are truncated for the terminal
+    for export_path in exports:
+        try:
+            export_scan(export_path, tree, file_limit)
+            print(f"☆ Exported {len(tree):,} folders and {min(file_limit, len(tree.file_pool))} files to {export_path}")
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"☆ Export to {export_path} failed: {e}")
+
+    # ☆ Only the top folders are shown, so select them instead of sorting every folder
+    sorted_folders = [(tree.path(i), tree.total_bytes[i], tree.total_allocated[i])
+                      for i in tree.largest(folder_limit, allocated=disk_usage)]
 
     # --- NICE FORMATTED OUTPUT ---
 
     # ☆ Top Files Table
-    print(f"\n╔{'═'*112}╗")
-    print(f"║ {'TOP ' + str(file_limit) + ' LARGEST FILES':^110} ║")
-    print(f"╠{'═'*32}╦{'═'*10}╦{'═'*12}╦{'═'*55}╣")
-    print(f"║ {'FILE NAME':<30} ║ {'TYPE':<8} ║ {'SIZE (GB)':<10} ║ {'DIRECTORY':<53} ║")
-    print(f"╠{'═'*32}╬{'═'*10}╬{'═'*12}╬{'═'*55}╣")
+    # ☆ SIZE is the apparent size; ON DISK is what the allocated blocks take (smaller for sparse files)
+    print(f"\n╔{'═'*125}╗")
+    print(f"║ {'TOP ' + str(file_limit) + ' LARGEST FILES':^123} ║")
+    print(f"╠{'═'*32}╦{'═'*10}╦{'═'*12}╦{'═'*12}╦{'═'*55}╣")
+    print(f"║ {'FILE NAME':<30} ║ {'TYPE':<8} ║ {'SIZE (GB)':<10} ║ {'ON DISK':<10} ║ {'DIRECTORY':<53} ║")
+    print(f"╠{'═'*32}╬{'═'*10}╬{'═'*12}╬{'═'*12}╬{'═'*55}╣")
     
-    for i in range(min(file_limit, len(file_list))):
-        name, ftype, folder, size = file_list[i]
-        print(f"║ {name[:30]:<30} ║ {ftype[:8]:<8} ║ {size / (1024**3):>10.2f} ║ {folder[:53]:<53} ║")
-    print(f"╚{'═'*32}╩{'═'*10}╩{'═'*12}╩{'═'*55}╝")
+    for i in range(min(file_limit, len(largest_files))):
+        name, ftype, folder, size, allocated = largest_files[i]
+        print(f"║ {name[:30]:<30} ║ {ftype[:8]:<8} ║ {size / (1024**3):>10.2f} ║ {allocated / (1024**3):>10.2f} ║ {folder[:53]:<53} ║")
+    print(f"╚{'═'*32}╩{'═'*10}╩{'═'*12}╩{'═'*12}╩{'═'*55}╝")
 
     # ☆ Top Folders Table
-    print(f"\n╔{'═'*75}╗")
-    print(f"║ {'TOP ' + str(folder_limit) + ' LARGEST FOLDERS':^73} ║")
-    print(f"╠{'═'*62}╦{'═'*12}╣")
-    print(f"║ {'FOLDER PATH':<60} ║ {'SIZE (GB)':<10} ║")
-    print(f"╠{'═'*62}╬{'═'*12}╣")
+    print(f"\n╔{'═'*88}╗")
+    print(f"║ {'TOP ' + str(folder_limit) + ' LARGEST FOLDERS':^86} ║")
+    print(f"╠{'═'*62}╦{'═'*12}╦{'═'*12}╣")
+    print(f"║ {'FOLDER PATH':<60} ║ {'SIZE (GB)':<10} ║ {'ON DISK':<10} ║")
+    print(f"╠{'═'*62}╬{'═'*12}╬{'═'*12}╣")
     for i in range(min(folder_limit, len(sorted_folders))):
-        path, size = sorted_folders[i]
-        print(f"║ {path[:60]:<60} ║ {size / (1024**3):>10.2f} ║")
-    print(f"╚{'═'*62}╩{'═'*12}╝")
+        path, size, allocated = sorted_folders[i]
+        print(f"║ {path[:60]:<60} ║ {size / (1024**3):>10.2f} ║ {allocated / (1024**3):>10.2f} ║")
+    print(f"╚{'═'*62}╩{'═'*12}╩{'═'*12}╝")
+
+    if histograms is not None:
+        print_histogram_tables(histograms)
+
+    if duplicate_report is not None:
+        print_duplicate_table(duplicate_report)
+
+    if scan_filter.skipped:
+        print_skipped_table(scan_filter)
+
+    # ☆ What changed since the last snapshot
+    if previous is not None:
+        growers, shrinkers = diff_trees(previous, tree, folder_limit, allocated=disk_usage)
+        print_change_table(f"TOP {folder_limit} GROWERS SINCE LAST SCAN", growers)
+        print_change_table(f"TOP {folder_limit} SHRINKERS SINCE LAST SCAN", shrinkers)
 
     # ☆ Final Summary Bar and Performance Stats
     try:
@@ -114,12 +440,48 @@ def get_largest_items(file_limit=20, folder_limit=10):
         
         print(f"\n☆ SCAN SUMMARY:")
         print(f"Processed {total_scanned:,} files in {duration:.2f} seconds.")
+        print(f"Apparent size: {tree.total_bytes[0]/(1024**3):.2f} GB | On disk: {tree.total_allocated[0]/(1024**3):.2f} GB")
+        if previous is not None:
+            print(f"Re-listed {len(tree) - tree.reused_folders:,} of {len(tree):,} folders (the rest were unchanged).")
         print(f"Average speed: {total_scanned/duration:.0f} files/sec.\n")
     except Exception:
         pass
 
+    # ☆ Drill into the same in-memory tree, no rescanning needed
+    if open_browser:
+        input("☆ Press Enter to open the folder browser (q to quit it)...")
+        browse(tree)
     
 if __name__ == "__main__": 
-    get_largest_items() 
+    parser = argparse.ArgumentParser(description="Analyzes a drive for the largest files and folders.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent directory readers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="Do not read or write the snapshot used for incremental scans")
+    parser.add_argument("--full", action="store_true",
+                        help="List every folder even if unchanged (still reports growers/shrinkers)")
+    parser.add_argument("--snapshot-dir", default=DEFAULT_SNAPSHOT_DIR,
+                        help=f"Where snapshots are kept (default: {DEFAULT_SNAPSHOT_DIR})")
+    parser.add_argument("--disk-usage", action="store_true",
+                        help="Count hard-linked files once and rank by space actually allocated on disk")
+    parser.add_argument("--histograms", action="store_true",
+                        help="Also break usage down by file type, size and age (lists every folder)")
+    parser.add_argument("--drive", help="Drive letter or path to scan, skipping the prompt (e.g. C or /)")
+    parser.add_argument("--export", action="append", default=[], metavar="PATH",
+                        help="Write every folder and the top files to PATH (.jsonl, .csv or .npz); may be repeated")
+    add_filter_arguments(parser)
+    parser.add_argument("--browse", action="store_true",
+                        help="Open an interactive folder browser over the scan results when done")
+    parser.add_argument("--duplicates", action="store_true",
+                        help="Find duplicate files (same size, then same hash) and the space they waste")
+    parser.add_argument("--dup-min-size", type=float, default=DEFAULT_MIN_SIZE / (1024 * 1024), metavar="MB",
+                        help="Ignore files smaller than this when looking for duplicates (default: 1 MB)")
+    args = parser.parse_args()
+    get_largest_items(workers=args.workers, use_snapshot=not args.no_snapshot,
+                      full=args.full, snapshot_dir=args.snapshot_dir, disk_usage=args.disk_usage,
+                      show_histograms=args.histograms, drive=args.drive, exports=args.export,
+                      one_file_system=args.one_file_system, excludes=exclude_list(args.exclude),
+                      open_browser=args.browse, find_dupes=args.duplicates,
+                      dup_min_size=int(args.dup_min_size * 1024 * 1024)) 
 
     # ☆ End of custom_drive_analyzer.py ☆ 
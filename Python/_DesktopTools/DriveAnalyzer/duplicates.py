@@ -0,0 +1,197 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: duplicates.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Duplicate file finder for the drive analyzer. Files
+# ☆ are grouped by size during the scan, then only same-size files
+# ☆ are hashed, first their opening 64 KiB, then in full.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan only sniffs files that weigh exactly the same, and only
+# reads them all the way through when the first bite tastes identical.
+
+import os
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ☆ xxhash is much faster when installed; blake2b from the standard library otherwise
+try:
+    import xxhash
+
+    def new_hasher():
+        return xxhash.xxh3_128()
+
+    HASH_NAME = "xxh3-128"
+except ImportError:
+    def new_hasher():
+        return hashlib.blake2b(digest_size=16)
+
+    HASH_NAME = "blake2b-128"
+
+HEAD_BYTES = 64 * 1024
+# ☆ Each hashing thread reuses one buffer of this size, so memory stays workers x READ_CHUNK
+READ_CHUNK = 1024 * 1024
+DEFAULT_MIN_SIZE = 1024 * 1024
+DEFAULT_HASH_WORKERS = 4
+# ☆ Files handed to the pool per round; bounds the queued work on drives with many candidates
+HASH_BATCH_FILES = 2048
+
+_buffers = threading.local()
+
+
+def _read_buffer():
+    buffer = getattr(_buffers, "view", None)
+    if buffer is None:
+        buffer = _buffers.view = memoryview(bytearray(READ_CHUNK))
+    return buffer
+
+
+def hash_file(path, limit=None):
+    """☆ Hashes the first limit bytes of path (the whole file if None). Returns (digest, bytes_read) or (None, 0)."""
+    hasher = new_hasher()
+    buffer = _read_buffer()
+    remaining = limit
+    total = 0
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while remaining is None or remaining > 0:
+                view = buffer if remaining is None or remaining >= READ_CHUNK else buffer[:remaining]
+                count = f.readinto(view)
+                if not count:
+                    break
+                hasher.update(view[:count])
+                total += count
+                if remaining is not None:
+                    remaining -= count
+    except OSError:
+        return None, 0
+    return hasher.digest(), total
+
+
+class DuplicateCollector:
+    """
+    ☆ Fed one file at a time by scan_drive(). Only files of at least min_size are kept, as
+    size -> [(folder_id, name, inode_key)], so memory follows the number of large files rather
+    than every file on the drive. Hard links to one inode are collapsed: they share their bytes.
+    """
+
+    def __init__(self, min_size=DEFAULT_MIN_SIZE):
+        self.min_size = max(1, min_size)
+        self.by_size = {}
+        self.files_seen = 0
+
+    def add(self, size, folder_id, name, stat_result, path=None):
+        """☆ path is only read when stat_result has no inode number (the cached Windows DirEntry stat)."""
+        if size < self.min_size:
+            return
+        self.files_seen += 1
+        if not stat_result.st_ino and path is not None:
+            # ☆ Ask for the real inode, as scan_drive does for --disk-usage, or hard links pass as duplicates.
+            # ☆ Only files above min_size get here, so the extra stat stays rare.
+            try:
+                stat_result = os.stat(path, follow_symlinks=False)
+            except OSError:
+                pass
+        inode_key = (stat_result.st_dev, stat_result.st_ino) if stat_result.st_ino else None
+        self.by_size.setdefault(size, []).append((folder_id, name, inode_key))
+
+    def candidate_groups(self, tree):
+        """☆ [(size, [path, ...])] for every size shared by two or more distinct files."""
+        groups = []
+        for size, files in self.by_size.items():
+            if len(files) < 2:
+                continue
+            seen_inodes = set()
+            paths = []
+            for folder_id, name, inode_key in files:
+                if inode_key is not None:
+                    if inode_key in seen_inodes:
+                        continue
+                    seen_inodes.add(inode_key)
+                paths.append(os.path.join(tree.path(folder_id), name))
+            if len(paths) > 1:
+                groups.append((size, paths))
+        return groups
+
+
+class DuplicateReport:
+    """☆ Result of find_duplicates(): the groups plus the hashing statistics used for the MB/s figure."""
+
+    def __init__(self):
+        self.groups = []
+        self.candidates = 0
+        self.head_hashed = 0
+        self.full_hashed = 0
+        self.bytes_hashed = 0
+        self.seconds = 0.0
+
+    @property
+    def reclaimable(self):
+        return sum(size * (len(paths) - 1) for size, paths in self.groups)
+
+    @property
+    def mb_per_second(self):
+        return self.bytes_hashed / (1024 * 1024) / self.seconds if self.seconds else 0.0
+
+
+def _batches(groups, batch_files):
+    """☆ Splits groups into runs of about batch_files files, so at most that many hashes are queued at once."""
+    batch = []
+    count = 0
+    for group in groups:
+        batch.append(group)
+        count += len(group[1])
+        if count >= batch_files:
+            yield batch
+            batch = []
+            count = 0
+    if batch:
+        yield batch
+
+
+def _hash_stage(executor, groups, limit, report, progress=None):
+    """
+    ☆ Hashes every file of every group (first limit bytes, or all of it) across the pool and
+    returns the sub-groups of two or more files that share a digest.
+    """
+    confirmed = []
+    done = 0
+    for batch in _batches(groups, HASH_BATCH_FILES):
+        jobs = [(index, path) for index, (_, paths) in enumerate(batch) for path in paths]
+        by_digest = {}
+        for (index, path), (digest, count) in zip(jobs, executor.map(lambda job: hash_file(job[1], limit), jobs)):
+            report.bytes_hashed += count
+            if digest is not None:
+                by_digest.setdefault((index, digest), []).append(path)
+        confirmed.extend((batch[index][0], paths) for (index, _), paths in by_digest.items() if len(paths) > 1)
+        done += len(jobs)
+        if progress:
+            progress(done)
+    return confirmed
+
+
+def find_duplicates(groups, workers=DEFAULT_HASH_WORKERS, progress=None):
+    """
+    ☆ Confirms duplicates among same-size candidate groups. Stage one hashes the first
+    HEAD_BYTES of each file, which settles most groups; only files that still collide are
+    read in full. Files no larger than HEAD_BYTES are already complete after stage one.
+    progress(files_hashed) is called as batches finish. Returns a DuplicateReport with
+    groups sorted by reclaimable bytes.
+    """
+    report = DuplicateReport()
+    report.candidates = sum(len(paths) for _, paths in groups)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        head_groups = _hash_stage(executor, groups, HEAD_BYTES, report, progress)
+        report.head_hashed = report.candidates
+        small = [group for group in head_groups if group[0] <= HEAD_BYTES]
+        large = [group for group in head_groups if group[0] > HEAD_BYTES]
+        report.full_hashed = sum(len(paths) for _, paths in large)
+        report.groups = small + _hash_stage(executor, large, None, report)
+    report.seconds = time.perf_counter() - start
+    report.groups.sort(key=lambda group: group[0] * (len(group[1]) - 1), reverse=True)
+    return report
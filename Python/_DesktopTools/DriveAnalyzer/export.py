@@ -0,0 +1,125 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: export.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Machine-readable exports of a drive analyzer scan:
+# ☆ JSON Lines, a JSON array, CSV and a columnar NumPy .npz, streamed
+# ☆ row by row.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan writes her findings down one line at a time, so even a
+# drive with millions of folders never has to fit in one giant string.
+
+import os
+import csv
+import json
+
+# ☆ One schema for every format. Folder rows carry totals (subfolders included);
+# ☆ file rows are the top-N largest files, with parent_id pointing at their folder.
+EXPORT_FIELDS = ("kind", "id", "parent_id", "path", "bytes", "allocated", "files")
+EXPORT_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json", ".csv": "csv", ".npz": "npz"}
+WRITE_BUFFER = 1 << 20
+
+
+def iter_export_rows(tree, file_pool):
+    """☆ Yields one tuple per folder, then one per kept file, in EXPORT_FIELDS order."""
+    for folder_id in range(len(tree)):
+        yield ("folder", folder_id, tree.parents[folder_id], tree.path(folder_id),
+               tree.total_bytes[folder_id], tree.total_allocated[folder_id], tree.total_files[folder_id])
+    for _, name, folder_id, size, allocated in file_pool:
+        yield ("file", -1, folder_id, os.path.join(tree.path(folder_id), name), size, allocated, 1)
+
+
+def export_format(path):
+    """☆ Picks the format from the file extension; raises ValueError for unknown ones."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{extension}' (use {', '.join(sorted(EXPORT_FORMATS))})")
+    return EXPORT_FORMATS[extension]
+
+
+def write_jsonl(path, rows):
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with open(path, "w", encoding="utf-8", errors="surrogateescape", buffering=WRITE_BUFFER) as f:
+        for row in rows:
+            f.write(encode(dict(zip(EXPORT_FIELDS, row))))
+            f.write("\n")
+
+
+def write_json(path, rows):
+    """☆ Same objects as write_jsonl, wrapped in one array so json.load() can read the file."""
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with open(path, "w", encoding="utf-8", errors="surrogateescape", buffering=WRITE_BUFFER) as f:
+        separator = "[\n"
+        for row in rows:
+            f.write(separator)
+            f.write(encode(dict(zip(EXPORT_FIELDS, row))))
+            separator = ",\n"
+        f.write("\n]\n" if separator == ",\n" else "[]\n")
+
+
+def write_csv(path, rows):
+    with open(path, "w", encoding="utf-8", errors="surrogateescape", newline="", buffering=WRITE_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_FIELDS)
+        writer.writerows(rows)
+
+
+def _pack_strings(np, strings):
+    """☆ Arrow-style string column: one utf-8 blob plus int64 offsets, no per-string padding or pickling."""
+    offsets = [0]
+    blobs = []
+    total = 0
+    for text in strings:
+        data = text.encode("utf-8", "surrogateescape")
+        blobs.append(data)
+        total += len(data)
+        offsets.append(total)
+    return np.frombuffer(b"".join(blobs), dtype=np.uint8), np.array(offsets, dtype=np.int64)
+
+
+def write_npz(path, tree, file_pool):
+    """
+    ☆ Columnar export. Folders are stored as parallel arrays straight from the tree (names,
+    not full paths: walk folder_parent to rebuild a path); strings use a blob plus offsets.
+    Read it back with numpy.load(path), no pickle needed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("NumPy is required for .npz export (python -m pip install numpy)")
+
+    name_blob, name_offsets = _pack_strings(np, tree.names)
+    file_blob, file_offsets = _pack_strings(np, (name for _, name, _, _, _ in file_pool))
+    np.savez_compressed(
+        path,
+        folder_parent=np.frombuffer(tree.parents, dtype=np.int64 if tree.parents.itemsize == 8 else np.int32),
+        folder_bytes=np.frombuffer(tree.total_bytes, dtype=np.int64),
+        folder_allocated=np.frombuffer(tree.total_allocated, dtype=np.int64),
+        folder_files=np.frombuffer(tree.total_files, dtype=np.int64),
+        folder_direct_bytes=np.frombuffer(tree.direct_bytes, dtype=np.int64),
+        folder_direct_files=np.frombuffer(tree.direct_files, dtype=np.int64),
+        folder_name_blob=name_blob,
+        folder_name_offsets=name_offsets,
+        file_folder=np.array([folder_id for _, _, folder_id, _, _ in file_pool], dtype=np.int64),
+        file_bytes=np.array([size for _, _, _, size, _ in file_pool], dtype=np.int64),
+        file_allocated=np.array([allocated for _, _, _, _, allocated in file_pool], dtype=np.int64),
+        file_name_blob=file_blob,
+        file_name_offsets=file_offsets,
+    )
+
+
+def export_scan(path, tree, file_limit=None):
+    """☆ Writes the rolled-up tree and its largest files (top file_limit, or the whole pool) to path."""
+    file_pool = tree.file_pool if file_limit is None else tree.file_pool[:file_limit]
+    fmt = export_format(path)
+    if fmt == "npz":
+        write_npz(path, tree, file_pool)
+    elif fmt == "csv":
+        write_csv(path, iter_export_rows(tree, file_pool))
+    elif fmt == "json":
+        write_json(path, iter_export_rows(tree, file_pool))
+    else:
+        write_jsonl(path, iter_export_rows(tree, file_pool))
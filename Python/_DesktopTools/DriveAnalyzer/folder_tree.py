@@ -0,0 +1,112 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: folder_tree.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Compact folder tree for the drive analyzer. Folders
+# ☆ are integer ids in parallel arrays; sizes are rolled up bottom-up
+# ☆ once at the end of the scan.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan files every folder under a number instead of its full path,
+# and only adds things up once she has seen the whole drive.
+
+import os
+import sys
+import heapq
+from array import array
+
+
+class FolderTree:
+    """
+    ☆ One entry per folder, addressed by id. A folder only stores its own name and its
+    parent's id, so full paths are rebuilt on demand instead of being kept as dict keys.
+    Ids are handed out parent first, which lets rollup() run as a single reverse sweep.
+    """
+
+    def __init__(self, root_path):
+        self.names = [root_path]
+        self.parents = array('l', [-1])
+        self.direct_bytes = array('q', [0])
+        self.direct_files = array('q', [0])
+        # ☆ Bytes actually allocated on disk (st_blocks); differs from direct_bytes for sparse/compressed files
+        self.direct_allocated = array('q', [0])
+        self.mtimes = array('q', [0])
+        self.total_bytes = None
+        self.total_files = None
+        self.total_allocated = None
+        # ☆ Filled in by an incremental scan: id of the same folder in the previous snapshot (-1 if new)
+        self.previous_ids = None
+        self.reused_folders = 0
+        # ☆ The largest files seen, as (rank_size, name, folder_id, size, allocated); saved with the snapshot
+        self.file_pool = []
+        # ☆ Disk usage scans only: every name of a multi-link file as
+        # ☆ (folder_id, name, inode_key, size, allocated, owned); owned marks the one that was counted
+        self.link_files = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_folder(self, parent_id, name):
+        """☆ Registers a child folder and returns its id. Common names (node_modules, bin, ...) are interned."""
+        self.names.append(sys.intern(name))
+        self.parents.append(parent_id)
+        self.direct_bytes.append(0)
+        self.direct_files.append(0)
+        self.direct_allocated.append(0)
+        self.mtimes.append(0)
+        return len(self.names) - 1
+
+    def add_files(self, folder_id, file_count, byte_count, allocated_bytes=None):
+        """☆ Records the files sitting directly inside a folder (not its subfolders)."""
+        self.direct_files[folder_id] += file_count
+        self.direct_bytes[folder_id] += byte_count
+        self.direct_allocated[folder_id] += byte_count if allocated_bytes is None else allocated_bytes
+
+    def rollup(self):
+        """☆ Post-order aggregation: every folder adds its finished total to its parent exactly once."""
+        totals = array('q', self.direct_bytes)
+        counts = array('q', self.direct_files)
+        allocated = array('q', self.direct_allocated)
+        parents = self.parents
+        for folder_id in range(len(self.names) - 1, 0, -1):
+            parent = parents[folder_id]
+            totals[parent] += totals[folder_id]
+            counts[parent] += counts[folder_id]
+            allocated[parent] += allocated[folder_id]
+        self.total_bytes = totals
+        self.total_files = counts
+        self.total_allocated = allocated
+
+    def path(self, folder_id):
+        """☆ Rebuilds the full path of a folder from the chain of parent ids."""
+        parts = []
+        while folder_id > 0:
+            parts.append(self.names[folder_id])
+            folder_id = self.parents[folder_id]
+        return os.path.join(self.names[0], *reversed(parts))
+
+    def children_index(self):
+        """
+        ☆ Returns (offsets, child_ids) in CSR layout: the children of folder i are
+        child_ids[offsets[i]:offsets[i + 1]]. Built in two linear passes over parents.
+        """
+        count = len(self.names)
+        offsets = array('q', [0]) * (count + 1)
+        for folder_id in range(1, count):
+            offsets[self.parents[folder_id] + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+        child_ids = array('q', [0]) * max(0, count - 1)
+        cursor = array('q', offsets)
+        for folder_id in range(1, count):
+            parent = self.parents[folder_id]
+            child_ids[cursor[parent]] = folder_id
+            cursor[parent] += 1
+        return offsets, child_ids
+
+    def largest(self, limit, allocated=False):
+        """☆ Ids of the limit largest folders by total size, or by space on disk (rollup() must have run)."""
+        totals = self.total_allocated if allocated else self.total_bytes
+        return heapq.nlargest(limit, range(len(self.names)), key=totals.__getitem__)
@@ -0,0 +1,103 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: histograms.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Streaming histograms for the drive analyzer: bytes
+# ☆ and counts by extension, by log2 size bucket and by file age,
+# ☆ filled in during the scan with fixed-size accumulators.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan sorts every file into a few little jars as she passes by,
+# so she never has to walk the drive twice to answer a question.
+
+import os
+import time
+from array import array
+
+# ☆ Upper edges of the age buckets, in days; the last bucket is everything older
+AGE_EDGES_DAYS = (1, 7, 30, 90, 365, 3 * 365)
+AGE_LABELS = ("< 1 day", "1-7 days", "7-30 days", "30-90 days", "90-365 days", "1-3 years", "> 3 years")
+# ☆ Extension rows also split their bytes at this age, e.g. "how much .log is older than 90 days"
+STALE_AGE_DAYS = 90
+# ☆ Sizes up to 2^63 fit in 64 log2 buckets (bucket n holds sizes in [2^(n-1), 2^n))
+SIZE_BUCKETS = 64
+# ☆ Caps the extension table on drives full of random suffixes; the rest is pooled under OTHER_EXTENSION
+MAX_EXTENSIONS = 4096
+OTHER_EXTENSION = "(other)"
+
+_SECONDS_PER_DAY = 86400
+
+
+def size_bucket_label(bucket):
+    """☆ Human label for a log2 bucket, e.g. 21 -> '1-2 MB'."""
+    if bucket == 0:
+        return "0 B"
+    units = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+    low = 1 << (bucket - 1)
+    exponent = (bucket - 1) // 10
+    scale = 1 << (10 * exponent)
+    return f"{low // scale}-{(low * 2) // scale} {units[exponent]}"
+
+
+class ScanHistograms:
+    """
+    ☆ Accumulates files one at a time without keeping them. Every histogram is a flat array
+    of (count, bytes) pairs: SIZE_BUCKETS entries by size, one per age bucket, and per
+    extension one pair per age bucket so any extension can be split by age afterwards.
+    """
+
+    def __init__(self, now=None):
+        self.now = time.time() if now is None else now
+        # ☆ Age thresholds as absolute mtimes, newest first, so bucketing is a few float compares
+        self.age_cutoffs = [self.now - days * _SECONDS_PER_DAY for days in AGE_EDGES_DAYS]
+        self.stale_bucket = AGE_EDGES_DAYS.index(STALE_AGE_DAYS) + 1
+        self.by_size = array('q', [0]) * (2 * SIZE_BUCKETS)
+        self.by_age = array('q', [0]) * (2 * len(AGE_LABELS))
+        self.by_extension = {}
+
+    def add(self, name, size, mtime):
+        """☆ Counts one file of size bytes last modified at mtime (seconds since the epoch)."""
+        bucket = 2 * size.bit_length()
+        self.by_size[bucket] += 1
+        self.by_size[bucket + 1] += size
+
+        age = 0
+        for cutoff in self.age_cutoffs:
+            if mtime >= cutoff:
+                break
+            age += 1
+        self.by_age[2 * age] += 1
+        self.by_age[2 * age + 1] += size
+
+        extension = os.path.splitext(name)[1].lower() or "None"
+        counts = self.by_extension.get(extension)
+        if counts is None:
+            if len(self.by_extension) >= MAX_EXTENSIONS:
+                extension = OTHER_EXTENSION
+                counts = self.by_extension.get(extension)
+            if counts is None:
+                counts = self.by_extension[extension] = array('q', [0]) * (2 * len(AGE_LABELS))
+        counts[2 * age] += 1
+        counts[2 * age + 1] += size
+
+    def extension_rows(self, limit=15):
+        """☆ [(extension, files, bytes, bytes older than STALE_AGE_DAYS)] for the limit largest extensions."""
+        rows = []
+        for extension, counts in self.by_extension.items():
+            files = sum(counts[0::2])
+            total = sum(counts[1::2])
+            stale = sum(counts[2 * self.stale_bucket + 1::2])
+            rows.append((extension, files, total, stale))
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:limit]
+
+    def size_rows(self):
+        """☆ [(label, files, bytes)] for every non-empty size bucket, smallest first."""
+        return [(size_bucket_label(b), self.by_size[2 * b], self.by_size[2 * b + 1])
+                for b in range(SIZE_BUCKETS) if self.by_size[2 * b]]
+
+    def age_rows(self):
+        """☆ [(label, files, bytes)] for every age bucket, newest first."""
+        return [(label, self.by_age[2 * i], self.by_age[2 * i + 1]) for i, label in enumerate(AGE_LABELS)]
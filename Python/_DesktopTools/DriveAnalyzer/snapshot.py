@@ -0,0 +1,156 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: snapshot.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Saves and loads compact drive analyzer snapshots
+# ☆ (per-folder sizes, file counts and mtimes) and diffs two runs.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan keeps a little notebook of every folder she measured,
+# so next time she only has to peek into the ones that changed.
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import hashlib
+import heapq
+from array import array
+
+from folder_tree import FolderTree
+
+SNAPSHOT_MAGIC = b"MHS-DRIVE-SNAPSHOT 2\n"
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".drive_analyzer")
+
+# ☆ The per-folder arrays, stored as little-endian int64 in this order
+ARRAY_FIELDS = ("parents", "direct_bytes", "direct_files", "direct_allocated", "mtimes")
+
+
+def snapshot_path_for(root, snapshot_dir=DEFAULT_SNAPSHOT_DIR, disk_usage=False, filter_key=""):
+    """
+    ☆ One snapshot file per scanned root, e.g. C:\\ -> ~/.drive_analyzer/C.snap. Disk usage
+    runs count hard links once, so their totals are kept apart in C.du.snap, and scans with
+    excludes or --one-file-system get their own file (a short hash of filter_key) because
+    the folders they pruned are missing from the snapshot.
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", root).strip("_") or "root"
+    if filter_key:
+        slug += "." + hashlib.sha1(filter_key.encode("utf-8", "surrogateescape")).hexdigest()[:8]
+    return os.path.join(snapshot_dir, slug + (".du.snap" if disk_usage else ".snap"))
+
+
+def _int64_bytes(values):
+    data = array('q', values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _int64_array(raw):
+    data = array('q')
+    data.frombytes(raw)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+def save_snapshot(path, tree):
+    """
+    ☆ Writes tree and its pool of largest files to path.
+    Layout: magic line, JSON header line, then the int64 arrays and the NUL separated
+    folder names, all gzip compressed. Written to a temp file first so a crash never
+    leaves a half-written snapshot behind.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    header = {
+        "root": tree.names[0],
+        "created": time.time(),
+        "folders": len(tree),
+        "file_pool": [list(item) for item in tree.file_pool],
+    }
+    if tree.link_files is not None:
+        header["link_files"] = [list(item) for item in tree.link_files]
+    temp_path = path + ".tmp"
+    with gzip.open(temp_path, "wb", compresslevel=5) as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for field in ARRAY_FIELDS:
+            f.write(_int64_bytes(getattr(tree, field)))
+        f.write("\0".join(tree.names).encode("utf-8", "surrogateescape"))
+    os.replace(temp_path, path)
+
+
+def load_snapshot(path):
+    """☆ Returns (tree, created_timestamp) with the tree already rolled up, or None if unusable."""
+    try:
+        with gzip.open(path, "rb") as f:
+            if f.readline() != SNAPSHOT_MAGIC:
+                return None
+            header = json.loads(f.readline().decode("utf-8"))
+            count = header["folders"]
+            arrays = {field: _int64_array(f.read(count * 8)) for field in ARRAY_FIELDS}
+            names = f.read().decode("utf-8", "surrogateescape").split("\0")
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    if len(names) != count or any(len(a) != count for a in arrays.values()):
+        return None
+
+    tree = FolderTree(names[0])
+    tree.names = names
+    tree.parents = array('l', arrays["parents"])
+    tree.direct_bytes = arrays["direct_bytes"]
+    tree.direct_files = arrays["direct_files"]
+    tree.direct_allocated = arrays["direct_allocated"]
+    tree.mtimes = arrays["mtimes"]
+    tree.file_pool = [tuple(item) for item in header.get("file_pool", [])]
+    if "link_files" in header:
+        tree.link_files = [tuple(item) for item in header["link_files"]]
+    tree.rollup()
+    return tree, header.get("created", 0.0)
+
+
+def diff_trees(old_tree, new_tree, limit=10, allocated=False):
+    """
+    ☆ Compares two rolled-up trees, using new_tree.previous_ids to pair folders, by total
+    size or (allocated=True) by space on disk.
+    Returns (growers, shrinkers) as [(path, delta_bytes, new_total), ...]. A folder whose
+    change is entirely explained by one child is skipped, so the tables point at where the
+    bytes actually moved instead of listing the same chain of ancestors over and over.
+    """
+    old_totals = old_tree.total_allocated if allocated else old_tree.total_bytes
+    new_totals = new_tree.total_allocated if allocated else new_tree.total_bytes
+    count = len(new_tree)
+    previous_ids = new_tree.previous_ids
+    matched = bytearray(len(old_tree))
+    deltas = array('q', [0]) * count
+    for folder_id in range(count):
+        old_id = previous_ids[folder_id]
+        old_total = 0
+        if old_id >= 0:
+            matched[old_id] = 1
+            old_total = old_totals[old_id]
+        deltas[folder_id] = new_totals[folder_id] - old_total
+
+    passthrough = bytearray(count)
+    for folder_id in range(1, count):
+        parent = new_tree.parents[folder_id]
+        if deltas[folder_id] and deltas[folder_id] == deltas[parent]:
+            passthrough[parent] = 1
+
+    changed = [i for i in range(count) if deltas[i] and not passthrough[i]]
+    growers = [(new_tree.path(i), deltas[i], new_totals[i])
+               for i in heapq.nlargest(limit, changed, key=deltas.__getitem__) if deltas[i] > 0]
+
+    # ☆ Folders that vanished only exist in the old tree; report the top of each deleted subtree
+    removed = [i for i in range(1, len(old_tree))
+               if not matched[i] and matched[old_tree.parents[i]]]
+    shrink_candidates = [(new_tree.path(i), deltas[i], new_totals[i])
+                         for i in heapq.nsmallest(limit, changed, key=deltas.__getitem__) if deltas[i] < 0]
+    shrink_candidates += [(old_tree.path(i) + "  (deleted)", -old_totals[i], 0)
+                          for i in removed if old_totals[i]]
+    shrinkers = heapq.nsmallest(limit, shrink_candidates, key=lambda row: row[1])
+    return growers, shrinkers
@@ -0,0 +1,86 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: test_hard_links.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Checks that --disk-usage counts every hard-linked
+# ☆ file exactly once, under the same path on every run, including
+# ☆ incremental runs that reuse some folders from the snapshot.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Run with: python -m unittest test_hard_links
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from custom_drive_analyzer import scan_drive
+from snapshot import save_snapshot, load_snapshot
+
+
+def direct_files(tree):
+    """☆ {folder path relative to the root: files counted directly in it}"""
+    return {os.path.relpath(tree.path(i), tree.names[0]): tree.direct_files[i] for i in range(len(tree))}
+
+
+@unittest.skipUnless(hasattr(os, "link"), "needs hard links")
+class HardLinkTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="drive_analyzer_links_")
+        self.snap = os.path.join(self.root, "scan.du.snap")
+        self.drive = os.path.join(self.root, "drive")
+        for folder in ("a", "b", "c"):
+            os.makedirs(os.path.join(self.drive, folder))
+        self.write("a/f", 8192)
+        os.link(os.path.join(self.drive, "a", "f"), os.path.join(self.drive, "b", "g"))
+        self.write("c/other", 4096)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write(self, relative, size):
+        with open(os.path.join(self.drive, relative), "wb") as f:
+            f.write(b"\1" * size)
+
+    def rescan(self, previous_tree):
+        save_snapshot(self.snap, previous_tree)
+        previous, _ = load_snapshot(self.snap)
+        return scan_drive(self.drive, previous=previous, disk_usage=True)
+
+    def test_full_scan_owner_is_the_smallest_path(self):
+        for workers in (1, 8, 8, 8):
+            _, tree, total = scan_drive(self.drive, workers=workers, disk_usage=True)
+            self.assertEqual(total, 2)
+            self.assertEqual(direct_files(tree), {".": 0, "a": 1, "b": 0, "c": 1})
+
+    def test_link_in_reused_folder_and_changed_folder_counts_once(self):
+        _, first, _ = scan_drive(self.drive, disk_usage=True)
+        # ☆ b changes, a (holding the counted name) is reused from the snapshot
+        self.write("b/new", 4096)
+        _, tree, total = self.rescan(first)
+        self.assertGreater(tree.reused_folders, 0)
+        self.assertEqual(total, 3)
+        self.assertEqual(direct_files(tree), {".": 0, "a": 1, "b": 1, "c": 1})
+        self.assertEqual(tree.total_files[0], 3)
+
+    def test_owner_in_changed_folder_with_other_name_reused(self):
+        _, first, _ = scan_drive(self.drive, disk_usage=True)
+        # ☆ a (holding the counted name) changes, b is reused with its uncounted name
+        self.write("a/new", 4096)
+        _, tree, total = self.rescan(first)
+        self.assertEqual(total, 3)
+        self.assertEqual(direct_files(tree), {".": 0, "a": 2, "b": 0, "c": 1})
+
+    def test_incremental_matches_full_scan(self):
+        _, first, _ = scan_drive(self.drive, disk_usage=True)
+        self.write("b/new", 4096)
+        _, incremental, _ = self.rescan(first)
+        _, full, _ = scan_drive(self.drive, disk_usage=True)
+        self.assertEqual(direct_files(incremental), direct_files(full))
+        self.assertEqual(list(incremental.total_allocated), list(full.total_allocated))
+
+
+if __name__ == "__main__":
+    unittest.main()
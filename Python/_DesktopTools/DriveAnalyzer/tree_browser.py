@@ -0,0 +1,277 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: tree_browser.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: ncdu-style interactive browser over a scanned
+# ☆ FolderTree. Descend, go back and re-sort without rescanning.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+# Pythion-chan keeps the whole drive map in her head after one scan,
+# so you can wander up and down the folders as long as you like.
+
+import os
+import sys
+import time
+import select
+import argparse
+from array import array
+
+# ☆ The ANSI helpers are shared with NetworkInfo and live in _DesktopTools/_Shared
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from terminal_ansi import (
+    center_ansi, truncate_ansi, safe_write, hide_cursor, show_cursor, get_terminal_dimensions,
+    ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM, CLR_RESET, CLR_BOLD, CLR_DIM, CLR_LIGHT_CYAN,
+    CLR_LIGHT_GREEN, CLR_LIGHT_YELLOW, CLR_MAGENTA,
+)
+
+SORT_SIZE = "size"
+SORT_COUNT = "count"
+SORT_NAME = "name"
+
+BAR_WIDTH = 12
+# ☆ Header (2 lines) + footer (2 lines) around the folder list
+CHROME_LINES = 4
+# ☆ The rest of an arrow key's escape sequence arrives together with the Esc; a lone Esc has nothing behind it
+ESCAPE_WAIT_SECONDS = 0.05
+
+KEY_UP, KEY_DOWN, KEY_PAGE_UP, KEY_PAGE_DOWN = "up", "down", "page_up", "page_down"
+KEY_HOME, KEY_END, KEY_ENTER, KEY_BACK, KEY_QUIT = "home", "end", "enter", "back", "quit"
+
+# ☆ Escape sequences and Windows scan codes mapped to the keys above
+_ESCAPE_KEYS = {
+    "[A": KEY_UP, "[B": KEY_DOWN, "[C": KEY_ENTER, "[D": KEY_BACK,
+    "[5~": KEY_PAGE_UP, "[6~": KEY_PAGE_DOWN, "[H": KEY_HOME, "[F": KEY_END,
+    "[1~": KEY_HOME, "[4~": KEY_END, "OH": KEY_HOME, "OF": KEY_END,
+}
+_WINDOWS_KEYS = {
+    "H": KEY_UP, "P": KEY_DOWN, "M": KEY_ENTER, "K": KEY_BACK,
+    "I": KEY_PAGE_UP, "Q": KEY_PAGE_DOWN, "G": KEY_HOME, "O": KEY_END,
+}
+_PLAIN_KEYS = {
+    "k": KEY_UP, "j": KEY_DOWN, "l": KEY_ENTER, "h": KEY_BACK, "\r": KEY_ENTER, "\n": KEY_ENTER,
+    "\x7f": KEY_BACK, "\x08": KEY_BACK, "q": KEY_QUIT, "\x03": KEY_QUIT, "g": KEY_HOME, "G": KEY_END,
+}
+
+
+def format_size(num_bytes):
+    """☆ Compact human size, e.g. 1.5 GiB."""
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class TreeBrowser:
+    """
+    ☆ View state over a rolled-up FolderTree. Every sort order is prepared once up front:
+    all folders are sorted globally, then dealt into their parent's slot of a CSR children
+    index, which leaves each folder's children already in order. After that a key press
+    only formats the rows on screen, even inside a folder with a million subfolders.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        start = time.perf_counter()
+        self.offsets, _ = tree.children_index()
+        # ☆ rows[sort][folder_id] is the folder's row inside its parent, so re-sorting never searches
+        self.orders, self.rows = {}, {}
+        for sort, key, reverse in ((SORT_SIZE, tree.total_bytes.__getitem__, True),
+                                   (SORT_COUNT, tree.total_files.__getitem__, True),
+                                   (SORT_NAME, lambda i: tree.names[i].lower(), False)):
+            self.orders[sort], self.rows[sort] = self._sorted_children(key, reverse)
+        self.prepare_ms = (time.perf_counter() - start) * 1000
+        self.sort = SORT_SIZE
+        self.current = 0
+        self.cursor = 0
+        self.scroll = 0
+        # ☆ (folder, scroll) for every level above, so going back restores the old position
+        self.history = []
+        self.last_frame_ms = 0.0
+
+    def _sorted_children(self, key, reverse=False):
+        """
+        ☆ Returns (ordered, rows): CSR child ids (same offsets as children_index) with every
+        folder's children sorted by key, and each folder's row among its siblings in that order.
+        """
+        count = len(self.tree)
+        parents = self.tree.parents
+        offsets = self.offsets
+        slots = array('q', offsets)
+        ordered = array('q', bytes(8 * max(0, count - 1)))
+        rows = array('q', bytes(8 * count))
+        for folder_id in sorted(range(1, count), key=key, reverse=reverse):
+            parent = parents[folder_id]
+            ordered[slots[parent]] = folder_id
+            rows[folder_id] = slots[parent] - offsets[parent]
+            slots[parent] += 1
+        return ordered, rows
+
+    def child_count(self, folder_id):
+        return self.offsets[folder_id + 1] - self.offsets[folder_id]
+
+    def child_at(self, folder_id, row):
+        return self.orders[self.sort][self.offsets[folder_id] + row]
+
+    def children(self, folder_id):
+        """☆ Child ids of folder_id in the current sort order (largest first for size and count)."""
+        return self.orders[self.sort][self.offsets[folder_id]:self.offsets[folder_id + 1]]
+
+    def handle_key(self, key, page_size):
+        """☆ Applies one key press; returns False when the browser should close."""
+        last = self.child_count(self.current) - 1
+        if key == KEY_QUIT:
+            return False
+        if key == KEY_UP:
+            self.cursor = max(0, self.cursor - 1)
+        elif key == KEY_DOWN:
+            self.cursor = max(0, min(last, self.cursor + 1))
+        elif key == KEY_PAGE_UP:
+            self.cursor = max(0, self.cursor - page_size)
+        elif key == KEY_PAGE_DOWN:
+            self.cursor = max(0, min(last, self.cursor + page_size))
+        elif key == KEY_HOME:
+            self.cursor = 0
+        elif key == KEY_END:
+            self.cursor = max(0, last)
+        elif key == KEY_ENTER and last >= 0:
+            self.history.append((self.current, self.scroll))
+            self.current = self.child_at(self.current, self.cursor)
+            self.cursor = 0
+            self.scroll = 0
+        elif key == KEY_BACK and self.history:
+            # ☆ Put the cursor back on the folder we came from, even if the sort changed meanwhile
+            came_from = self.current
+            self.current, self.scroll = self.history.pop()
+            self.cursor = self.rows[self.sort][came_from]
+        elif key in self.orders and key != self.sort:
+            selected = self.child_at(self.current, self.cursor) if last >= 0 else None
+            self.sort = key
+            if selected is not None:
+                # ☆ Keep the highlighted folder under the cursor after re-sorting
+                self.cursor = self.rows[key][selected]
+        return True
+
+    def render(self, columns, lines):
+        """☆ Builds one full frame as a string; only the rows that fit on screen are formatted."""
+        start = time.perf_counter()
+        tree = self.tree
+        page_size = max(1, lines - CHROME_LINES)
+        child_total = self.child_count(self.current)
+
+        if self.cursor < self.scroll:
+            self.scroll = self.cursor
+        elif self.cursor >= self.scroll + page_size:
+            self.scroll = self.cursor - page_size + 1
+
+        parent_total = max(1, tree.total_bytes[self.current])
+        out = [
+            center_ansi(f"{CLR_BOLD}{CLR_LIGHT_CYAN}☆ DRIVE BROWSER ☆{CLR_RESET}", columns),
+            truncate_ansi(f"{CLR_BOLD}{tree.path(self.current)}{CLR_RESET}  "
+                          f"{CLR_DIM}{format_size(tree.total_bytes[self.current])} in "
+                          f"{tree.total_files[self.current]:,} files{CLR_RESET}", columns),
+        ]
+
+        name_width = max(10, columns - BAR_WIDTH - 30)
+        for row in range(self.scroll, min(child_total, self.scroll + page_size)):
+            child = self.child_at(self.current, row)
+            total = tree.total_bytes[child]
+            filled = round(BAR_WIDTH * total / parent_total)
+            bar = "█" * filled + "░" * (BAR_WIDTH - filled)
+            line = (f" {format_size(total):>10} {CLR_LIGHT_GREEN}[{bar}]{CLR_RESET} "
+                    f"{tree.total_files[child]:>10,}  /{tree.names[child][:name_width]}")
+            if row == self.cursor:
+                line = f"{CLR_BOLD}{CLR_LIGHT_YELLOW}>{CLR_RESET}{CLR_BOLD}{line}{CLR_RESET}"
+            else:
+                line = " " + line
+            out.append(truncate_ansi(line, columns))
+
+        own_files = tree.direct_files[self.current]
+        if not child_total:
+            out.append(f"  {CLR_DIM}(no subfolders){CLR_RESET}")
+        if own_files and len(out) < lines - 2:
+            out.append(f"  {CLR_DIM}{format_size(tree.direct_bytes[self.current]):>10}  "
+                       f"{own_files:,} files directly in this folder{CLR_RESET}")
+
+        while len(out) < lines - 2:
+            out.append("")
+        position = f"{self.cursor + 1}/{child_total}" if child_total else "0/0"
+        out.append(truncate_ansi(
+            f"{CLR_MAGENTA}↑↓ move  →/Enter open  ←/Backspace back  s size  c count  n name  q quit{CLR_RESET}",
+            columns))
+        self.last_frame_ms = (time.perf_counter() - start) * 1000
+        out.append(truncate_ansi(f"{CLR_DIM}sort: {self.sort}  |  {position}  |  "
+                                 f"{len(tree):,} folders  |  frame {self.last_frame_ms:.1f} ms{CLR_RESET}", columns))
+        # ☆ Clear each line's tail so shorter rows do not leave old text behind
+        return "\033[K\n".join(out) + "\033[K"
+
+
+def read_key():
+    """☆ Blocks for one key press and returns a KEY_* name, a sort name or the raw character."""
+    if sys.platform == "win32":
+        import msvcrt
+        ch = msvcrt.getwch()
+        if ch in ("\x00", "\xe0"):
+            return _WINDOWS_KEYS.get(msvcrt.getwch(), "")
+    else:
+        fd = sys.stdin.fileno()
+        ch = os.read(fd, 1).decode("utf-8", "replace")
+        if ch == "\x1b":
+            if not select.select([fd], [], [], ESCAPE_WAIT_SECONDS)[0]:
+                return KEY_QUIT
+            seq = os.read(fd, 8).decode("utf-8", "replace")
+            return _ESCAPE_KEYS.get(seq, "")
+    return {"s": SORT_SIZE, "c": SORT_COUNT, "n": SORT_NAME}.get(ch, _PLAIN_KEYS.get(ch, ch))
+
+
+def browse(tree):
+    """☆ Runs the interactive browser until q or Esc is pressed. tree must be rolled up."""
+    # ☆ Built before raw mode, so the message prints normally and Ctrl+C still works while it runs
+    if len(tree) > 100_000:
+        print(f"☆ Preparing the browser for {len(tree):,} folders...")
+    browser = TreeBrowser(tree)
+
+    if sys.platform == "win32":
+        # Enable ANSI escape sequence processing on Windows terminals
+        os.system("")
+        restore = None
+    else:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        restore = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    try:
+        hide_cursor()
+        safe_write("\033[2J")
+        while True:
+            columns, lines = get_terminal_dimensions()
+            # ☆ Raw mode does not translate \n, so each line starts from column 0 explicitly
+            frame = browser.render(columns, lines).replace("\n", "\r\n")
+            safe_write(ANSI_CURSOR_HOME + frame + ANSI_CLEAR_BOTTOM)
+            if not browser.handle_key(read_key(), max(1, lines - CHROME_LINES)):
+                break
+    finally:
+        if restore:
+            restore()
+        show_cursor()
+        safe_write("\033[2J" + ANSI_CURSOR_HOME)
+
+
+if __name__ == "__main__":
+    from snapshot import load_snapshot
+
+    parser = argparse.ArgumentParser(description="Browses a saved drive analyzer snapshot without rescanning.")
+    parser.add_argument("snapshot", help="Snapshot file, e.g. ~/.drive_analyzer/C.snap")
+    args = parser.parse_args()
+    loaded = load_snapshot(os.path.expanduser(args.snapshot))
+    if loaded is None:
+        print(f"☆ Error: '{args.snapshot}' is not a readable snapshot.")
+        sys.exit(1)
+    browse(loaded[0])
+
+    # ☆ End of tree_browser.py ☆
@@ -0,0 +1,79 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_searcher.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Measures how much the live progress line costs a
+# ☆ crawl: redraw per folder vs. rate-limited vs. quiet.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sys
+import argparse
+import shutil
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from parallel_scanner import ParallelScanner, DEFAULT_WORKERS
+from progress_reporter import ProgressReporter, DEFAULT_RATE_HZ
+from synthetic_tree import make_synthetic_tree
+
+
+def timed_crawl(root, workers, rate_hz, enabled):
+    """Crawls root the way the searcher does, with the given progress settings. Returns (seconds, redraws)."""
+    scanner = ParallelScanner(workers=workers)
+    progress = ProgressReporter(
+        lambda: f"Scanning... Folders processed: {scanner.folders_processed} | Found: {scanner.files_found}",
+        rate_hz=rate_hz,
+        enabled=enabled,
+    )
+    start = time.perf_counter()
+    for _ in scanner.scan(root):
+        progress.tick()
+    duration = time.perf_counter() - start
+    progress.clear()
+    return duration, progress.redraws
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FileSearcher progress rendering benchmark")
+    parser.add_argument("--files", type=int, default=400_000, help="Files in the synthetic tree (default: 400000)")
+    parser.add_argument("--files-per-dir", type=int, default=2,
+                        help="Files per folder; small values mean many folders (default: 2)")
+    parser.add_argument("--path", help="Benchmark an existing folder instead of a synthetic tree")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    temp_dir = None
+    root = args.path
+    if not root:
+        temp_dir = tempfile.mkdtemp(prefix="bench_searcher_")
+        root = temp_dir
+        print(f"☆ Building synthetic tree with {args.files:,} files in {root}...")
+        folders, _ = make_synthetic_tree(root, total_files=args.files, files_per_dir=args.files_per_dir)
+        print(f"☆ {folders:,} folders created.")
+
+    try:
+        # Warm the OS cache so every mode sees the same disk state
+        timed_crawl(root, args.workers, DEFAULT_RATE_HZ, False)
+        modes = [
+            ("every folder (old)", 0, True),
+            (f"{DEFAULT_RATE_HZ} Hz reporter", DEFAULT_RATE_HZ, True),
+            ("quiet", DEFAULT_RATE_HZ, False),
+        ]
+        rows = [(label,) + timed_crawl(root, args.workers, rate, enabled) for label, rate, enabled in modes]
+
+        baseline = rows[0][1]
+        print(f"\n{'PROGRESS MODE':<20} | {'SECONDS':>8} | {'REDRAWS':>9} | {'SPEEDUP':>7}")
+        print("-" * 54)
+        for label, duration, redraws in rows:
+            print(f"{label:<20} | {duration:>8.2f} | {redraws:>9,} | {baseline / duration:>6.2f}x")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
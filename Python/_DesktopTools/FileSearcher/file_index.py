@@ -0,0 +1,236 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: file_index.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Persistent SQLite filename index for the file searcher.
+# ☆ Built once per drive, then refreshed incrementally by re-listing
+# ☆ only the directories whose modification time changed.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sqlite3
+
+from patterns import compile_patterns
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".file_searcher_index.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    id        INTEGER PRIMARY KEY,
+    path      TEXT NOT NULL UNIQUE,
+    parent_id INTEGER,
+    mtime_ns  INTEGER
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent_id);
+CREATE TABLE IF NOT EXISTS files (
+    dir_id     INTEGER NOT NULL,
+    name       TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    ext        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir_id);
+CREATE INDEX IF NOT EXISTS files_ext ON files(ext);
+"""
+
+# Commit every N re-listed directories so an interrupted build keeps its progress
+COMMIT_EVERY = 2000
+
+
+def split_extension(file_name):
+    """Returns the lowercase extension without dots, matching the searcher's filter."""
+    return os.path.splitext(file_name)[1].lower().replace('.', '')
+
+
+def _prefix_range(root):
+    """Returns the [low, high) string range covering every path below root."""
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _excluded_checker(root, excluded_dirs):
+    """Returns is_excluded(dir_path): True if dir_path is, or lies below, one of excluded_dirs. Cached per folder."""
+    excluded = {os.path.normcase(path) for path in excluded_dirs}
+    cache = {}
+
+    def is_excluded(dir_path):
+        hit = cache.get(dir_path)
+        if hit is None:
+            parent = os.path.dirname(dir_path)
+            hit = os.path.normcase(dir_path) in excluded or (
+                dir_path != root and parent != dir_path and is_excluded(parent)
+            )
+            cache[dir_path] = hit
+        return hit
+
+    return is_excluded
+
+
+class FileIndex:
+    """On-disk filename index keyed by directory path and directory mtime."""
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _delete_subtree(self, dir_id, path, keep_root=False):
+        """Drops a directory, everything below it, and all of their file rows."""
+        low, high = _prefix_range(path)
+        self.conn.execute(
+            "DELETE FROM files WHERE dir_id IN "
+            "(SELECT id FROM dirs WHERE id = ? OR (path >= ? AND path < ?))",
+            (dir_id, low, high),
+        )
+        self.conn.execute("DELETE FROM dirs WHERE path >= ? AND path < ?", (low, high))
+        if keep_root:
+            self.conn.execute("UPDATE dirs SET mtime_ns = NULL WHERE id = ?", (dir_id,))
+        else:
+            self.conn.execute("DELETE FROM dirs WHERE id = ?", (dir_id,))
+
+    def _store_files(self, dir_id, names):
+        rows = [(dir_id, name, name.lower(), split_extension(name)) for name in names]
+        try:
+            self.conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", rows)
+        except UnicodeEncodeError:
+            # Undecodable filenames (surrogate escapes) cannot be stored in SQLite; skip only those
+            for row in rows:
+                try:
+                    self.conn.execute("INSERT INTO files VALUES (?, ?, ?, ?)", row)
+                except UnicodeEncodeError:
+                    continue
+
+    def _relist(self, dir_id, path, mtime_ns):
+        """Re-reads one directory from disk and syncs its file rows and child directory rows."""
+        file_names = []
+        sub_dirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append(entry.path)
+                    elif not entry.is_dir():
+                        # Symlinks to directories are neither descended nor listed, like os.walk
+                        file_names.append(entry.name)
+                except OSError:
+                    continue
+
+        self.conn.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+        self._store_files(dir_id, file_names)
+
+        known = dict(self.conn.execute("SELECT path, id FROM dirs WHERE parent_id = ?", (dir_id,)))
+        current = set(sub_dirs)
+        for child_path, child_id in known.items():
+            if child_path not in current:
+                self._delete_subtree(child_id, child_path)
+        for child_path in sub_dirs:
+            if child_path not in known:
+                try:
+                    # The child may already exist as a separately indexed root; adopt it
+                    cur = self.conn.execute("UPDATE dirs SET parent_id = ? WHERE path = ?", (dir_id, child_path))
+                    if cur.rowcount == 0:
+                        self.conn.execute(
+                            "INSERT INTO dirs (path, parent_id, mtime_ns) VALUES (?, ?, NULL)",
+                            (child_path, dir_id),
+                        )
+                except UnicodeEncodeError:
+                    continue
+
+        self.conn.execute("UPDATE dirs SET mtime_ns = ? WHERE id = ?", (mtime_ns, dir_id))
+
+    def refresh(self, root, full=False, progress=None, skip_dir=None):
+        """
+        Brings the index for root up to date and returns (folders_checked, folders_relisted).
+        Unchanged directories cost a single stat; only changed ones are listed again.
+        With full=True every directory below root is dropped and rebuilt from scratch.
+        Directories for which skip_dir(path) is true are neither stat'ed nor listed; their
+        rows are left as they were, so pass the same paths to search() as excluded_dirs.
+        """
+        root = os.path.abspath(root)
+        row = self.conn.execute("SELECT id FROM dirs WHERE path = ?", (root,)).fetchone()
+        if row and full:
+            self._delete_subtree(row[0], root, keep_root=True)
+        if row is None:
+            cur = self.conn.execute("INSERT INTO dirs (path, parent_id, mtime_ns) VALUES (?, NULL, NULL)", (root,))
+            row = (cur.lastrowid,)
+
+        checked = 0
+        relisted = 0
+        stack = [(row[0], root)]
+        try:
+            while stack:
+                dir_id, path = stack.pop()
+                if skip_dir is not None and path != root and skip_dir(path):
+                    continue
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    if path != root:
+                        self._delete_subtree(dir_id, path)
+                    continue
+
+                checked += 1
+                stored = self.conn.execute("SELECT mtime_ns FROM dirs WHERE id = ?", (dir_id,)).fetchone()
+                if stored is None or stored[0] != mtime_ns:
+                    try:
+                        self._relist(dir_id, path, mtime_ns)
+                        relisted += 1
+                        if relisted % COMMIT_EVERY == 0:
+                            self.conn.commit()
+                    except OSError:
+                        # Unreadable (e.g. PermissionError): mtime stays stale so it is retried next refresh
+                        pass
+
+                stack.extend(self.conn.execute("SELECT id, path FROM dirs WHERE parent_id = ?", (dir_id,)))
+                if progress:
+                    progress(checked, relisted)
+        finally:
+            self.conn.commit()
+        return checked, relisted
+
+    def search(self, root, target_name="", ext_input="any", excluded_dirs=()):
+        """
+        Yields (file_name, full_path) for indexed files below root matching the searcher's filters.
+        ext_input is a patterns.py spec; plain extension sets are answered in SQL, anything
+        else (globs, regexes, compound suffixes) is checked on the rows SQL narrowed down.
+        Files in or below any of excluded_dirs are left out.
+        """
+        matcher = compile_patterns(ext_input)
+        root = os.path.abspath(root)
+        low, high = _prefix_range(root)
+        sql = (
+            "SELECT f.name, f.name_lower, d.path FROM files f JOIN dirs d ON d.id = f.dir_id "
+            "WHERE (d.path = ? OR (d.path >= ? AND d.path < ?))"
+        )
+        params = [root, low, high]
+        if matcher.only_extensions:
+            sql += f" AND f.ext IN ({', '.join('?' * len(matcher.extensions))})"
+            params.extend(sorted(matcher.extensions))
+        if target_name:
+            sql += " AND instr(f.name_lower, ?) > 0"
+            params.append(target_name.lower())
+
+        check = None if matcher.match_all or matcher.only_extensions else matcher.matches
+        # Excluded folders can number in the thousands (every node_modules), too many for SQL parameters
+        is_excluded = _excluded_checker(root, excluded_dirs) if excluded_dirs else None
+        for name, name_lower, dir_path in self.conn.execute(sql, params):
+            if (check is None or check(name_lower)) and (is_excluded is None or not is_excluded(dir_path)):
+                yield name, os.path.join(dir_path, name)
+
+    def has_root(self, root):
+        """Returns True if root has been listed into the index before."""
+        root = os.path.abspath(root)
+        row = self.conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (root,)).fetchone()
+        return bool(row and row[0] is not None)
@@ -2,20 +2,30 @@
 # ☆ Author: ☆ MelodyHSong ☆
 # ☆ Language: Python
 # ☆ File Name: file_searcher.py
-# ☆ Date: 2026-01-09
-# ☆ Version: 1.0.2a
+# ☆ Date: 2026-10-18
+# ☆ Version: 1.1.0a
 # ☆
 # ☆ Description: Advanced file searcher with drive detection, progress 
 # ☆ indicators, relevance ranking, timestamped exports, adjustable 
-# ☆ limits, and a search duration timer.
+# ☆ limits, a search duration timer, and a persistent filename index.
 # ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
 
 import os
-import difflib
+import argparse
+import csv
 import string
 import sys
 import time
 from datetime import datetime
+from file_index import FileIndex, DEFAULT_INDEX_PATH
+from ranking import Ranker
+from patterns import compile_patterns
+
+# The parallel scanning engine is shared with DriveAnalyzer and lives in _DesktopTools/_Shared
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from parallel_scanner import ParallelScanner, DEFAULT_WORKERS, is_file_entry
+from progress_reporter import ProgressReporter
+from scan_filter import ScanFilter, add_filter_arguments, exclude_list
 
 def get_available_drives():
     """Detects available drive letters on Windows or root on Unix-like systems."""
@@ -29,28 +39,45 @@ def get_available_drives():
         drives = ["/"]
     return drives
 
+def new_export_filename():
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"search_results_{timestamp}.txt"
+
+def write_export_header(f, target_name, duration=None):
+    f.write(f"Search Results for: {target_name if target_name else 'All Files'}\n")
+    f.write(f"Date of Search: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    if duration is not None:
+        f.write(f"Search Duration: {duration:.2f} seconds\n")
+    f.write("="*80 + "\n")
+    f.write(f"{'Relevance':<10} | {'File Name':<30} | {'Full Path'}\n")
+    f.write("-" * 80 + "\n")
+
+def write_export_row(f, name, path, relevance):
+    score = "N/A" if relevance is None else f"{relevance:.1%}"
+    f.write(f"{score:<10} | {name[:30]:<30} | {path}\n")
+
 def save_results_to_file(results, target_name, duration):
     """Saves the search results to a text file with a unique timestamped filename."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"search_results_{timestamp}.txt"
+    filename = new_export_filename()
     
     try:
         with open(filename, "w", encoding="utf-8") as f:
-            f.write(f"Search Results for: {target_name if target_name else 'All Files'}\n")
-            f.write(f"Date of Search: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Search Duration: {duration:.2f} seconds\n")
-            f.write("="*80 + "\n")
-            f.write(f"{'Relevance':<10} | {'File Name':<30} | {'Full Path'}\n")
-            f.write("-" * 80 + "\n")
-            for name, path in results:
-                score = "N/A"
-                if target_name:
-                    score = f"{difflib.SequenceMatcher(None, target_name.lower(), name.lower()).ratio():.1%}"
-                f.write(f"{score:<10} | {name[:30]:<30} | {path}\n")
+            write_export_header(f, target_name, duration)
+            for name, path, relevance in results:
+                write_export_row(f, name, path, relevance)
         print(f"\n☆ Results successfully saved to: {filename} ☆")
     except Exception as e:
         print(f"\nError saving file: {e}")
 
+def print_result_header():
+    print(f"{'Relevance':<10} | {'File Name':<30} | {'Full Path'}")
+    print("-" * 100)
+
+def print_result_row(name, path, relevance):
+    score_str = f"{relevance:>9.1%}" if relevance is not None else "   N/A    "
+    display_name = (name[:27] + '...') if len(name) > 30 else name
+    print(f"{score_str} | {display_name:<30} | {path}")
+
 def get_limit_choice():
     """Prompts the user to select how many files to list."""
     print("\nHow many results would you like to see?")
@@ -66,7 +93,258 @@ def get_limit_choice():
             return limit_map[choice]
         print("Invalid choice. Please select 1, 2, 3, or 4.")
 
-def search_files():
+def make_scan_filter(search_path, one_file_system=False, excludes=()):
+    """Returns a ScanFilter for search_path, or None when nothing would be pruned."""
+    if not one_file_system and not excludes:
+        return None
+    return ScanFilter(search_path, one_file_system, excludes)
+
+def prune_for(scan_filter):
+    return scan_filter.skip_dir if scan_filter is not None else None
+
+def excluded_dirs_of(scan_filter):
+    return [path for path, _, _ in scan_filter.skipped] if scan_filter is not None else []
+
+def print_skipped(scan_filter, limit=10, file=None):
+    """Lists the folders the filter pruned, slowest check first (a slow one is usually a stale mount)."""
+    if scan_filter is None or not scan_filter.skipped:
+        return
+    out = file or sys.stdout
+    rows = scan_filter.report_rows()
+    print(f"\nSkipped {len(rows)} folders without listing them:", file=out)
+    for path, reason, seconds in rows[:limit]:
+        print(f"  {reason:<12} {seconds * 1000:>8.3f} ms  {path}", file=out)
+    if len(rows) > limit:
+        print(f"  ... and {len(rows) - limit} more", file=out)
+
+def crawl_matches(search_path, target_name, ext_input, workers=DEFAULT_WORKERS, show_progress=True,
+                  scan_filter=None, progress=None):
+    """
+    Crawls search_path directly with the parallel scanner (no index), yielding (file_name, full_path) as found.
+    Pass a ProgressReporter as progress to clear its line from the caller; otherwise one is made here.
+    """
+    found = 0
+    matcher = compile_patterns(ext_input)
+    target_lower = target_name.lower()
+    scanner = ParallelScanner(workers=workers, prune=prune_for(scan_filter))
+    if progress is None:
+        progress = ProgressReporter(None, enabled=show_progress)
+    # Redrawn a few times per second from the scanner's counters, not once per folder
+    progress.render = lambda: f"Scanning... Folders processed: {scanner.folders_processed} | Found: {found}"
+
+    for root, entries in scanner.scan(search_path):
+        progress.tick()
+
+        for entry in entries:
+            if not is_file_entry(entry):
+                continue
+            file = entry.name
+            file_lower = file.lower()
+            if matcher.matches(file_lower) and (not target_lower or target_lower in file_lower):
+                found += 1
+                yield file, entry.path
+
+def refresh_index(index, search_path, reindex, verbose=True, show_progress=True, scan_filter=None, progress=None):
+    """Brings the index up to date for search_path; verbose controls messages, show_progress the live line."""
+    counts = [0, 0]
+    if progress is None:
+        progress = ProgressReporter(None, enabled=verbose and show_progress)
+    progress.render = lambda: f"Indexing... Folders checked: {counts[0]} | Re-listed: {counts[1]}"
+
+    def on_folder(checked, relisted):
+        counts[0], counts[1] = checked, relisted
+        progress.tick()
+
+    if verbose:
+        if reindex:
+            print("Rebuilding the index from scratch...")
+        elif not index.has_root(search_path):
+            print("No index for this path yet, building it once (later searches will be much faster)...")
+    checked, relisted = index.refresh(search_path, full=reindex, progress=on_folder if progress.enabled else None,
+                                      skip_dir=prune_for(scan_filter))
+    progress.clear()
+    if verbose:
+        print(f"Index up to date: {checked} folders checked, {relisted} re-listed.")
+
+def index_matches(search_path, target_name, ext_input, index_path, reindex, verbose=True, show_progress=True,
+                  scan_filter=None, progress=None):
+    """Refreshes the persistent index for search_path, then yields (file_name, full_path) from it."""
+    with FileIndex(index_path) as index:
+        refresh_index(index, search_path, reindex, verbose, show_progress, scan_filter, progress)
+        yield from index.search(search_path, target_name, ext_input, excluded_dirs_of(scan_filter))
+
+def collect_results(matches, target_name, limit, stream=False, export_file=None, progress=None):
+    """
+    Drains a match generator into the final results and returns
+    (results, match_count, stopped_early, first_found_timestamp).
+    Ranked queries keep a bounded top-K heap; unranked ones stop the scan as soon
+    as limit results exist. With stream=True unranked results are printed (and
+    exported) the moment they are found and are not retained; progress is the
+    reporter drawing the scan line, cleared before each printed result.
+    """
+    results = []
+    first_found = None
+
+    if target_name:
+        ranker = Ranker(target_name, limit)
+        for name, path in matches:
+            if first_found is None:
+                first_found = time.time()
+            ranker.add(name, path)
+        return ranker.results(), ranker.seen, False, first_found
+
+    match_count = 0
+    stopped_early = False
+    for name, path in matches:
+        if first_found is None:
+            first_found = time.time()
+            if stream:
+                if progress:
+                    progress.clear()
+                print_result_header()
+        match_count += 1
+        if stream:
+            if progress:
+                progress.clear()
+            print_result_row(name, path, None)
+            if export_file:
+                write_export_row(export_file, name, path, None)
+        else:
+            results.append((name, path, None))
+        if limit is not None and match_count >= limit:
+            # No ranking needed: nothing found later could displace these, so stop walking
+            stopped_early = True
+            break
+    matches.close()
+    return results, match_count, stopped_early, first_found
+
+def normalize_ext(ext):
+    """Maps the library/CLI extension argument onto a patterns.py spec; no value means any type."""
+    if not ext or not ext.strip():
+        return "any"
+    return ext.strip()
+
+def search(path, name=None, ext=None, limit=None, use_index=True, reindex=False,
+           index_path=DEFAULT_INDEX_PATH, workers=DEFAULT_WORKERS, one_file_system=False, excludes=(),
+           scan_filter=None):
+    """
+    Library entry point. Yields (file_name, full_path, relevance) for files below path.
+    Without a name nothing is ranked (relevance is None): results stream out as they are
+    found and the scan stops after limit. With a name, results come out best first once
+    the scan finishes. Nothing is printed. one_file_system and excludes prune folders
+    before they are listed; pass a ScanFilter instead to read its skip report afterwards.
+    """
+    target_name = (name or "").strip()
+    ext_input = normalize_ext(ext)
+    if scan_filter is None:
+        scan_filter = make_scan_filter(path, one_file_system, excludes)
+    if use_index:
+        matches = index_matches(path, target_name, ext_input, index_path, reindex, verbose=False,
+                                scan_filter=scan_filter)
+    else:
+        matches = crawl_matches(path, target_name, ext_input, workers, show_progress=False,
+                                scan_filter=scan_filter)
+
+    try:
+        if target_name:
+            ranker = Ranker(target_name, limit)
+            for file_name, full_path in matches:
+                ranker.add(file_name, full_path)
+            yield from ranker.results()
+        else:
+            for count, (file_name, full_path) in enumerate(matches, 1):
+                yield file_name, full_path, None
+                if limit is not None and count >= limit:
+                    break
+    finally:
+        matches.close()
+
+class BatchQuery:
+    """One query of a batch run, collecting its own results during the shared traversal."""
+
+    def __init__(self, name, ext, limit=None):
+        self.name = (name or "").strip()
+        self.name_lower = self.name.lower()
+        self.ext_input = normalize_ext(ext)
+        self.matcher = compile_patterns(self.ext_input)
+        self.limit = limit
+        self.ranker = Ranker(self.name, limit) if self.name else None
+        self.unranked = []
+
+    def offer(self, file_name, full_path):
+        if self.ranker is not None:
+            self.ranker.add(file_name, full_path)
+        elif self.limit is None or len(self.unranked) < self.limit:
+            self.unranked.append((file_name, full_path, None))
+
+    def results(self):
+        return self.ranker.results() if self.ranker is not None else self.unranked
+
+def read_batch_file(batch_path, limit=None):
+    """
+    Reads one query per line as 'name,ext'. Quote ext to list several types ("report","pdf,docx").
+    Either part may be empty; blank lines and lines starting with '#' are skipped.
+    """
+    queries = []
+    with open(batch_path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.reader(line for line in f if line.strip() and not line.lstrip().startswith("#")):
+            name = row[0] if row else ""
+            ext = row[1] if len(row) > 1 else None
+            queries.append(BatchQuery(name, ext, limit))
+    return queries
+
+def search_batch(path, queries, use_index=True, reindex=False, index_path=DEFAULT_INDEX_PATH,
+                 workers=DEFAULT_WORKERS, scan_filter=None):
+    """
+    Answers every BatchQuery with a single traversal of path (or a single index refresh).
+    Queries are bucketed by extension so each file is only checked against the queries
+    that could possibly match it.
+    """
+    if use_index:
+        with FileIndex(index_path) as index:
+            refresh_index(index, path, reindex, verbose=False, scan_filter=scan_filter)
+            excluded_dirs = excluded_dirs_of(scan_filter)
+            for query in queries:
+                for file_name, full_path in index.search(path, query.name, query.ext_input, excluded_dirs):
+                    query.offer(file_name, full_path)
+        return queries
+
+    # Plain extension queries are found with one dict lookup per file; globs/regexes are checked directly
+    by_ext = {}
+    general = []
+    for query in queries:
+        if query.matcher.only_extensions:
+            for ext in query.matcher.extensions:
+                by_ext.setdefault(ext, []).append(query)
+        else:
+            general.append(query)
+
+    scanner = ParallelScanner(workers=workers, prune=prune_for(scan_filter))
+    for root, entries in scanner.scan(path):
+        for entry in entries:
+            if not is_file_entry(entry):
+                continue
+            file_name = entry.name
+            file_lower = file_name.lower()
+            clean_ext = os.path.splitext(file_lower)[1][1:]
+            for query in by_ext.get(clean_ext, ()):
+                if query.name_lower in file_lower:
+                    query.offer(file_name, entry.path)
+            for query in general:
+                if query.name_lower in file_lower and query.matcher.matches(file_lower):
+                    query.offer(file_name, entry.path)
+    return queries
+
+def write_batch_csv(queries, out):
+    writer = csv.writer(out)
+    writer.writerow(["query_name", "query_ext", "relevance", "file_name", "full_path"])
+    for query in queries:
+        for file_name, full_path, relevance in query.results():
+            score = "" if relevance is None else f"{relevance:.4f}"
+            writer.writerow([query.name, query.ext_input, score, file_name, full_path])
+
+def search_files(use_index=True, reindex=False, index_path=DEFAULT_INDEX_PATH, workers=DEFAULT_WORKERS,
+                 stream=False, export=False, quiet=False, one_file_system=False, excludes=()):
     while True:
         print("\n" + "="*40)
         print(" ☆ FILE SEARCHER MENU ☆")
@@ -98,7 +376,9 @@ def search_files():
             continue
 
         target_name = input("Enter filename (Leave blank to list all files): ").strip()
-        ext_input = input("Enter file extension (e.g., 'pdf', 'txt') or 'ANY' for all: ").strip().lower()
+        ext_input = input("Enter file extension(s) (e.g., 'pdf', 'pdf,docx', '*.tar.*') or 'ANY' for all: ").strip()
+        if ext_input.lower() in ("any", "*"):
+            ext_input = "any"
 
         if ext_input == "any" and not target_name:
             print("\n[!] Error: You cannot search for 'ANY' extension without a filename.")
@@ -112,31 +392,43 @@ def search_files():
         # Start Timer
         start_time = time.time()
         
-        matches = []
-        dir_count = 0
+        results = []
+        match_count = 0
+        stopped_early = False
+        first_found = None
+        export_file = None
+        export_name = None
+
+        scan_filter = make_scan_filter(search_path, one_file_system, excludes)
+
+        progress = ProgressReporter(None, enabled=not quiet)
 
         try:
-            for root, dirs, files in os.walk(search_path):
-                dir_count += 1
-                sys.stdout.write(f"\rScanning... Folders processed: {dir_count} | Found: {len(matches)}")
-                sys.stdout.flush()
-
-                for file in files:
-                    file_name_part, file_ext = os.path.splitext(file)
-                    clean_ext = file_ext.lower().replace('.', '')
-                    ext_match = (ext_input == "any" or ext_input == clean_ext)
-                    
-                    if ext_match:
-                        if not target_name or (target_name.lower() in file.lower()):
-                            full_path = os.path.join(root, file)
-                            matches.append((file, full_path))
+            if use_index:
+                matches = index_matches(search_path, target_name, ext_input, index_path, reindex,
+                                        show_progress=not quiet, scan_filter=scan_filter, progress=progress)
+                # A forced rebuild only needs to happen once per session
+                reindex = False
+            else:
+                matches = crawl_matches(search_path, target_name, ext_input, workers, show_progress=not quiet,
+                                        scan_filter=scan_filter, progress=progress)
+
+            if stream and export and not target_name:
+                export_name = new_export_filename()
+                export_file = open(export_name, "w", encoding="utf-8")
+                write_export_header(export_file, target_name)
+
+            results, match_count, stopped_early, first_found = collect_results(
+                matches, target_name, limit, stream, export_file, progress
+            )
             
             # End Timer
             end_time = time.time()
             duration = end_time - start_time
             
-            sys.stdout.write("\r" + " " * 70 + "\r")
-            sys.stdout.flush()
+            progress.clear()
+            if export_file:
+                export_file.write(f"\nSearch Duration: {duration:.2f} seconds\n")
 
         except PermissionError:
             print(f"\nWarning: Access denied to some folders in {search_path}.")
@@ -144,33 +436,122 @@ def search_files():
         except KeyboardInterrupt:
             print(f"\nSearch cancelled by user.")
             continue
+        finally:
+            if export_file:
+                export_file.close()
+
+        first_result_str = f"{first_found - start_time:.2f} seconds" if first_found else "n/a"
+        print_skipped(scan_filter)
 
-        if not matches:
+        if not match_count:
             print(f"No matching files found. (Scan took {duration:.2f} seconds)")
+        elif stream and not target_name:
+            # Results were already printed as they arrived
+            print(f"\nSearch Complete! Time taken: {duration:.2f} seconds | First result after: {first_result_str}")
+            if stopped_early:
+                print(f"Stopped after the first {match_count} results (limit reached).")
+            else:
+                print(f"{match_count} results found.")
+            if export_name:
+                print(f"\n☆ Results successfully saved to: {export_name} ☆")
         else:
-            if target_name:
-                matches.sort(
-                    key=lambda x: difflib.SequenceMatcher(None, target_name.lower(), x[0].lower()).ratio(),
-                    reverse=True
-                )
-            
-            results = matches[:limit]
-            
-            print(f"\nSearch Complete! Time taken: {duration:.2f} seconds")
-            print(f"Results (Showing {len(results)} of {len(matches)} found):")
-            print(f"{'Relevance':<10} | {'File Name':<30} | {'Full Path'}")
-            print("-" * 100)
-
-            for name, path in results:
-                score_str = f"{difflib.SequenceMatcher(None, target_name.lower(), name.lower()).ratio():>9.1%}" if target_name else "   N/A    "
-                display_name = (name[:27] + '...') if len(name) > 30 else name
-                print(f"{score_str} | {display_name:<30} | {path}")
-
-            export_choice = input("\nWould you like to export these results to a text file? (y/n): ").strip().lower()
-            if export_choice == 'y':
+            print(f"\nSearch Complete! Time taken: {duration:.2f} seconds | First result after: {first_result_str}")
+            if stopped_early:
+                print(f"Results (Showing the first {len(results)} found, search stopped at the limit):")
+            else:
+                print(f"Results (Showing {len(results)} of {match_count} found):")
+            print_result_header()
+
+            for name, path, relevance in results:
+                print_result_row(name, path, relevance)
+
+            if export:
+                # Ranked results can only be written once the ranking is final
                 save_results_to_file(results, target_name, duration)
+            else:
+                export_choice = input("\nWould you like to export these results to a text file? (y/n): ").strip().lower()
+                if export_choice == 'y':
+                    save_results_to_file(results, target_name, duration)
 
         input("\nPress Enter to return to the menu...")
 
+def run_cli(args):
+    """Non-interactive mode: answers a single query or a whole batch file, then exits."""
+    use_index = not args.no_index
+    if not os.path.exists(args.path):
+        print(f"Error: The path '{args.path}' does not exist.", file=sys.stderr)
+        return 1
+
+    scan_filter = make_scan_filter(args.path, args.one_file_system, exclude_list(args.exclude))
+
+    if args.batch:
+        queries = read_batch_file(args.batch, args.limit)
+        start_time = time.time()
+        search_batch(args.path, queries, use_index, args.reindex, args.index_path, args.workers, scan_filter)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                write_batch_csv(queries, out)
+        else:
+            write_batch_csv(queries, sys.stdout)
+        print(f"☆ Answered {len(queries)} queries in {time.time() - start_time:.2f} seconds with one traversal.",
+              file=sys.stderr)
+        print_skipped(scan_filter, file=sys.stderr)
+        return 0
+
+    results = search(args.path, args.name, args.ext, args.limit, use_index, args.reindex,
+                     args.index_path, args.workers, scan_filter=scan_filter)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            write_export_header(f, args.name)
+            for name, path, relevance in results:
+                write_export_row(f, name, path, relevance)
+    else:
+        print_result_header()
+        for name, path, relevance in results:
+            print_result_row(name, path, relevance)
+    print_skipped(scan_filter, file=sys.stderr)
+    return 0
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Advanced file searcher with a persistent filename index. "
+                    "Runs the interactive menu unless --path is given."
+    )
+    query_group = parser.add_argument_group("non-interactive search")
+    query_group.add_argument("--path", help="Folder or drive to search; skips the interactive menu.")
+    query_group.add_argument("--name", help="Part of the file name to look for (enables relevance ranking).")
+    query_group.add_argument("--ext", help="File types to match, e.g. 'pdf', 'pdf,docx,*.tar.*' or 're:^img_\\d+' (default: any).")
+    query_group.add_argument("--limit", type=int, help="Maximum results per query (default: all).")
+    query_group.add_argument("--batch", metavar="FILE",
+                             help="Answer every 'name,ext' line of FILE in one traversal and print CSV.")
+    query_group.add_argument("--output", metavar="FILE", help="Write results to FILE instead of the terminal.")
+
+    index_group = parser.add_mutually_exclusive_group()
+    index_group.add_argument("--reindex", action="store_true",
+                             help="Force a full rescan of the searched path and rebuild its index entries.")
+    index_group.add_argument("--no-index", action="store_true",
+                             help="Bypass the index entirely and crawl the disk directly.")
+    parser.add_argument("--index-path", default=DEFAULT_INDEX_PATH,
+                        help=f"Location of the SQLite index file (default: {DEFAULT_INDEX_PATH})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent directory readers for --no-index crawls (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print unranked results the moment they are found instead of after the scan.")
+    parser.add_argument("--export", action="store_true",
+                        help="Export results automatically (written as they are found in --stream mode).")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Hide the live progress line while scanning or indexing.")
+    add_filter_arguments(parser)
+
+    args = parser.parse_args()
+    if (args.name or args.ext or args.limit is not None or args.batch or args.output) and not args.path:
+        parser.error("--name, --ext, --limit, --batch and --output require --path")
+    return args
+
 if __name__ == "__main__":
-    search_files()
+    args = parse_args()
+    if args.path:
+        sys.exit(run_cli(args))
+    search_files(use_index=not args.no_index, reindex=args.reindex, index_path=args.index_path,
+                 workers=args.workers, stream=args.stream, export=args.export, quiet=args.quiet,
+                 one_file_system=args.one_file_system, excludes=exclude_list(args.exclude))
@@ -0,0 +1,117 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: patterns.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Compiles a file type filter such as "pdf,docx,*.tar.*"
+# ☆ into one matcher, so many types are checked in a single pass.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import re
+import fnmatch
+
+GLOB_CHARS = set("*?[")
+REGEX_PREFIX = "re:"
+REGEX_OPEN = {"(": ")", "[": "]", "{": "}"}
+
+
+def split_tokens(spec):
+    """
+    Splits a filter spec on commas. Inside a 're:' token a comma only ends the token
+    outside brackets and when not escaped, so 're:\\d{1,3}' stays whole. Empty tokens
+    (a trailing comma, ',,') are dropped.
+    """
+    tokens = []
+    current = []
+    closers = []
+    escaped = False
+    # None until the token's first characters show whether it is a regex
+    in_regex = None
+    lead = ""
+    for char in spec:
+        if in_regex is None and (lead or not char.isspace()):
+            lead += char.lower()
+            if not REGEX_PREFIX.startswith(lead):
+                in_regex = False
+            elif lead == REGEX_PREFIX:
+                in_regex = True
+                current.append(char)
+                continue
+        if in_regex and escaped:
+            escaped = False
+        elif in_regex and char == "\\":
+            escaped = True
+        elif in_regex and closers and char == closers[-1]:
+            closers.pop()
+        elif in_regex and char in REGEX_OPEN and (not closers or closers[-1] != "]"):
+            closers.append(REGEX_OPEN[char])
+        elif char == "," and not closers:
+            tokens.append("".join(current).strip())
+            current = []
+            in_regex = None
+            lead = ""
+            continue
+        current.append(char)
+    tokens.append("".join(current).strip())
+    return [token for token in tokens if token]
+
+
+class FileMatcher:
+    """
+    A compiled file type filter. Comma separated tokens may be:
+      - an extension ('pdf', '.PDF')           -> one set lookup on the last extension
+      - a compound suffix ('tar.gz')            -> one str.endswith over all suffixes
+      - a glob ('*.tar.*', 'IMG_????.jpg')      -> folded into a single regex
+      - a regex prefixed with 're:' ('re:^log_\\d+', commas inside brackets are kept)
+      - 'any' or '*'                            -> everything matches
+    Matching is case-insensitive; pass names already lowercased.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.match_all = False
+        extensions = set()
+        suffixes = []
+        regex_parts = []
+
+        # A blank spec (or only commas) keeps the old meaning of no extension: files without one
+        tokens = split_tokens(spec) or [""]
+        for token in tokens:
+            lowered = token.lower()
+            if lowered in ("any", "*"):
+                self.match_all = True
+            elif lowered.startswith(REGEX_PREFIX):
+                # Regex tokens search anywhere in the name, like re.search
+                regex_parts.append(".*?(?:" + token[len(REGEX_PREFIX):] + ")")
+            elif GLOB_CHARS & set(token):
+                regex_parts.append(fnmatch.translate(lowered))
+            else:
+                ext = lowered.lstrip(".")
+                if "." in ext:
+                    suffixes.append("." + ext)
+                else:
+                    extensions.add(ext)
+
+        self.extensions = frozenset(extensions)
+        self.suffixes = tuple(suffixes)
+        self.regex = re.compile("|".join(regex_parts), re.IGNORECASE | re.DOTALL) if regex_parts else None
+
+    @property
+    def only_extensions(self):
+        """True when the filter is a plain extension set (the index can answer it in SQL)."""
+        return not self.match_all and not self.suffixes and self.regex is None
+
+    def matches(self, name_lower):
+        if self.match_all:
+            return True
+        if self.extensions and os.path.splitext(name_lower)[1][1:] in self.extensions:
+            return True
+        if self.suffixes and name_lower.endswith(self.suffixes):
+            return True
+        return self.regex is not None and self.regex.match(name_lower) is not None
+
+
+def compile_patterns(spec):
+    return FileMatcher(spec)
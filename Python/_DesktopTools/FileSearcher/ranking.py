@@ -0,0 +1,109 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: ranking.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Relevance ranking for the file searcher. Scores
+# ☆ each candidate once, prunes with cheap bounds before running
+# ☆ difflib, and keeps only the top results it needs.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import difflib
+import heapq
+
+# SequenceMatcher turns on its "popular character" junk heuristic at this length,
+# so the closed-form substring score below is only exact for shorter names.
+AUTOJUNK_LENGTH = 200
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def similarity(target_lower, name_lower):
+    """Returns the difflib ratio between the query and a file name (both already lowercased)."""
+    if target_lower in name_lower and len(name_lower) < AUTOJUNK_LENGTH:
+        # The whole query is the longest matching block, so ratio = 2 * len(query) / total length
+        return 2.0 * len(target_lower) / (len(target_lower) + len(name_lower))
+    return difflib.SequenceMatcher(None, target_lower, name_lower).ratio()
+
+
+class Ranker:
+    """
+    Ranks (file_name, full_path) matches against a query by difflib similarity, one match
+    at a time, keeping at most limit results in a min-heap so memory does not grow with the
+    number of matches. Substring matches are scored in O(1) from their lengths. Other
+    candidates must share a trigram with the query, then pass difflib's own length and
+    character-count upper bounds against the current k-th best before the full ratio runs.
+    """
+
+    def __init__(self, target_name, limit=None):
+        self.target = target_name.lower()
+        self.target_trigrams = trigrams(self.target)
+        self.limit = limit
+        self.seen = 0
+        # (score, -position, -seq, name, path); a min-heap whenever limit is set
+        self.best = []
+
+    def _upper_bound(self, name_lower):
+        """Cheapest valid ceiling on the ratio: identical lengths at best (difflib's real_quick_ratio)."""
+        total = len(self.target) + len(name_lower)
+        return 2.0 * min(len(self.target), len(name_lower)) / total if total else 1.0
+
+    def _passes_prefilter(self, name_lower):
+        if not self.target_trigrams:
+            return True
+        return not self.target_trigrams.isdisjoint(trigrams(name_lower))
+
+    def _is_full(self):
+        return self.limit is not None and len(self.best) >= self.limit
+
+    def add(self, name, path):
+        """Offers one match to the ranking."""
+        seq = self.seen
+        self.seen += 1
+        if self.limit == 0:
+            return
+
+        target = self.target
+        name_lower = name.lower()
+        position = name_lower.find(target)
+        if position >= 0 and len(name_lower) < AUTOJUNK_LENGTH:
+            entry = (similarity(target, name_lower), -position, -seq, name, path)
+        else:
+            if not self._passes_prefilter(name_lower):
+                return
+            full = self._is_full()
+            if full and self._upper_bound(name_lower) <= self.best[0][0]:
+                return
+            matcher = difflib.SequenceMatcher(None, target, name_lower)
+            if full and matcher.quick_ratio() <= self.best[0][0]:
+                return
+            # Without a substring hit the "position" sorts after every real one
+            entry = (matcher.ratio(), -len(name_lower), -seq, name, path)
+
+        if self.limit is None:
+            self.best.append(entry)
+        elif not self._is_full():
+            heapq.heappush(self.best, entry)
+        elif entry > self.best[0]:
+            heapq.heapreplace(self.best, entry)
+
+    def results(self):
+        """
+        Returns [(file_name, full_path, score)] best first.
+        Ties keep the earlier substring position first, then discovery order.
+        """
+        ordered = sorted(self.best, reverse=True)
+        return [(name, path, score) for score, _, _, name, path in ordered]
+
+    def rank(self, matches):
+        for name, path in matches:
+            self.add(name, path)
+        return self.results()
+
+
+def rank_matches(matches, target_name, limit=None):
+    """Convenience wrapper: rank matches for target_name, keeping at most limit results."""
+    return Ranker(target_name, limit).rank(matches)
@@ -1,9 +1,10 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 
 a = Analysis(
     ['__main__.py'],
-    pathex=[],
+    pathex=[os.path.join(SPECPATH, os.pardir, '_Shared')],
     binaries=[],
     datas=[('data.json', 'NetworkInfo')],
     hiddenimports=[],
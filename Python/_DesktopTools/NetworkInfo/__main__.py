@@ -13,8 +13,14 @@ import sys
 import argparse
 try:
     from .core import NetworkAnalyzer
+    from .headless import SINK_FORMATS, open_sink, run_headless
+    from .sampler import NetworkSampler
+    from .utils import load_data, get_per_nic_counters
 except (ImportError, ValueError):
     from core import NetworkAnalyzer
+    from headless import SINK_FORMATS, open_sink, run_headless
+    from sampler import NetworkSampler
+    from utils import load_data, get_per_nic_counters
 
 
 
@@ -38,11 +44,104 @@ def main():
         default="8.8.8.8",
         help="Target host to ping for latency measurement (default: 8.8.8.8)",
     )
+    parser.add_argument(
+        "--history",
+        type=int,
+        default=None,
+        help="Samples kept per metric, one per frame (default: history_samples in data.json, 200)",
+    )
+
+    parser.add_argument(
+        "--iface",
+        type=str,
+        default=None,
+        help="Measure only this network interface (default: all interfaces except loopback)",
+    )
+    parser.add_argument(
+        "--per-nic",
+        action="store_true",
+        help="Show a sparkline row per network interface with its rate, errors and drops",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Sample without the HUD and write every sample to --output (stdout by default)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between samples in headless mode (default: 1.0)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Stop headless mode after this many seconds (default: run until Ctrl+C or SIGTERM)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="File to append samples to ('-' for stdout). With the HUD, every frame's sample is logged alongside it",
+    )
+    parser.add_argument(
+        "--format",
+        choices=SINK_FORMATS,
+        default=None,
+        help="Sample format: ndjson or csv (default: csv for a .csv --output, ndjson otherwise)",
+    )
+    parser.add_argument(
+        "--full-redraw",
+        action="store_true",
+        help="Rewrite the whole screen every frame instead of only what changed (compare the HUD out figure)",
+    )
 
     args = parser.parse_args()
 
-    analyzer = NetworkAnalyzer(fps=args.fps, ping_target=args.target)
-    analyzer.run()
+    if args.history is not None and args.history < 1:
+        parser.error("--history must be at least 1")
+    if args.interval <= 0:
+        parser.error("--interval must be greater than 0")
+    if not args.headless and args.output == "-":
+        parser.error("--output - needs --headless; stdout belongs to the HUD")
+
+    if args.iface or args.per_nic:
+        interfaces = sorted(get_per_nic_counters())
+        if not interfaces:
+            parser.error("per-interface counters need psutil (or Linux /proc/net/dev)")
+        if args.iface and args.iface not in interfaces:
+            parser.error(f"unknown interface '{args.iface}' (available: {', '.join(interfaces)})")
+
+    settings = load_data().get("settings", {})
+    sampler = NetworkSampler(args.target, settings.get("ping_interval", 0.8), iface=args.iface)
+    sinks = []
+    if args.headless or args.output:
+        try:
+            sinks.append(open_sink(args.format, args.output))
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot open --output: {e}")
+
+    if args.headless:
+        run_headless(sampler, sinks, interval=args.interval, duration=args.duration)
+        return
+
+    # The HUD is one more consumer of the same sampler as the sinks
+    for sink in sinks:
+        sampler.add_listener(sink.write)
+    analyzer = NetworkAnalyzer(
+        fps=args.fps,
+        ping_target=args.target,
+        history_samples=args.history,
+        full_redraw=args.full_redraw,
+        sampler=sampler,
+        per_nic=args.per_nic,
+    )
+    try:
+        analyzer.run()
+    finally:
+        for sink in sinks:
+            sink.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_graphs.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Times the graph part of a HUD frame (speed, latency
+# ☆ and dual graphs) with the old per-cell renderers and the current
+# ☆ table-driven ones at several terminal sizes.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import re
+import time
+import random
+import argparse
+from typing import List, Tuple
+
+try:
+    from .utils import (
+        CLR_RESET, CLR_BOLD, CLR_DIM, CLR_GREEN, CLR_LIGHT_GREEN, CLR_LIGHT_CYAN,
+        CLR_LIGHT_MAGENTA, CLR_LIGHT_YELLOW, BLOCK_CHARS, truncate_ansi,
+        render_ascii_graph, render_dual_ascii_graph,
+    )
+except (ImportError, ValueError):
+    from utils import (
+        CLR_RESET, CLR_BOLD, CLR_DIM, CLR_GREEN, CLR_LIGHT_GREEN, CLR_LIGHT_CYAN,
+        CLR_LIGHT_MAGENTA, CLR_LIGHT_YELLOW, BLOCK_CHARS, truncate_ansi,
+        render_ascii_graph, render_dual_ascii_graph,
+    )
+
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
+
+
+def legacy_ascii_graph(values: List[float], width: int = 40, height: int = 4, title: str = "", unit: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
+    """The per-cell renderer utils.py used before the lookup tables, kept for comparison."""
+    if not values:
+        values = [0.0]
+
+    padded = values[-width:]
+    if len(padded) < width:
+        padded = [0.0] * (width - len(padded)) + padded
+
+    max_val = max(padded) if max(padded) > 0 else 1.0
+    latest = padded[-1]
+
+    header = f"{CLR_BOLD}{border_color}⎔─ {title} {CLR_RESET}{CLR_DIM}(Current: {latest:.1f}{unit} | Peak: {max_val:.1f}{unit}){CLR_RESET}"
+    header = truncate_ansi(header, width + 2)
+    lines = [header]
+
+    for h in reversed(range(height)):
+        row_str = f"{CLR_BOLD}{border_color}│{CLR_RESET}"
+        threshold_low = h / height
+        threshold_high = (h + 1) / height
+
+        for val in padded:
+            norm = val / max_val if max_val > 0 else 0
+            if norm >= threshold_high:
+                idx = 8
+            elif norm <= threshold_low:
+                idx = 0
+            else:
+                fraction = (norm - threshold_low) * height
+                idx = min(8, max(1, int(fraction * 8)))
+
+            char = BLOCK_CHARS[idx]
+            if idx > 0:
+                row_str += f"{main_color}{char}{CLR_RESET}"
+            else:
+                row_str += " "
+
+        lines.append(row_str)
+
+    footer = f"{CLR_BOLD}{border_color}└{'─' * width}{CLR_RESET}"
+    lines.append(footer)
+    return lines
+
+
+def legacy_dual_ascii_graph(down_values: List[float], up_values: List[float], width: int = 40, height: int = 4, title: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
+    """The per-cell dual renderer utils.py used before the lookup tables, kept for comparison."""
+    p_down = down_values[-width:]
+    p_up = up_values[-width:]
+    if len(p_down) < width:
+        p_down = [0.0] * (width - len(p_down)) + p_down
+    if len(p_up) < width:
+        p_up = [0.0] * (width - len(p_up)) + p_up
+
+    max_down = max(p_down) if max(p_down) > 0 else 1.0
+    max_up = max(p_up) if max(p_up) > 0 else 1.0
+    max_combined = max(max_down, max_up)
+
+    header = f"{CLR_BOLD}{border_color}⎔─ {title} {CLR_RESET}{CLR_DIM}(Peak Down: {max_down:.1f} KB/s | Peak Up: {max_up:.1f} KB/s){CLR_RESET}"
+    header = truncate_ansi(header, width + 2)
+    lines = [header]
+
+    for h in reversed(range(height)):
+        row_str = f"{CLR_BOLD}{border_color}│{CLR_RESET}"
+        threshold_low = h / height
+        threshold_high = (h + 1) / height
+
+        for d_val, u_val in zip(p_down, p_up):
+            d_norm = d_val / max_combined if max_combined > 0 else 0
+            u_norm = u_val / max_combined if max_combined > 0 else 0
+
+            d_idx = 8 if d_norm >= threshold_high else (0 if d_norm <= threshold_low else min(8, max(1, int((d_norm - threshold_low) * height * 8))))
+            u_idx = 8 if u_norm >= threshold_high else (0 if u_norm <= threshold_low else min(8, max(1, int((u_norm - threshold_low) * height * 8))))
+
+            if d_idx > 0 and u_idx > 0:
+                row_str += f"{CLR_LIGHT_YELLOW}█{CLR_RESET}"
+            elif d_idx > 0:
+                row_str += f"{CLR_LIGHT_CYAN}{BLOCK_CHARS[d_idx]}{CLR_RESET}"
+            elif u_idx > 0:
+                row_str += f"{CLR_LIGHT_MAGENTA}{BLOCK_CHARS[u_idx]}{CLR_RESET}"
+            else:
+                row_str += " "
+
+        lines.append(row_str)
+
+    footer = f"{CLR_BOLD}{border_color}└{'─' * width}{CLR_RESET}"
+    lines.append(footer)
+    return lines
+
+
+def graph_layout(cols: int, lines: int) -> Tuple[int, int, int]:
+    """(graph_width, graph_height, graph_count) as NetworkAnalyzer.build_frame() picks them."""
+    graph_width = max(10, min(140, max(20, cols - 6) - 4))
+    if lines >= 28:
+        return graph_width, max(3, min(10, (lines - 17) // 3)), 3
+    if lines >= 21:
+        return graph_width, max(2, (lines - 15) // 3), 3
+    if lines >= 15:
+        return graph_width, max(1, (lines - 13) // 2), 2
+    return graph_width, max(1, lines - 11), 1
+
+
+def sample_history(count: int, seed: int = 7) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """Bursty download/upload traffic plus a noisy latency series, like a busy link."""
+    rng = random.Random(seed)
+    down, up, latency = [], [], []
+    for i in range(count):
+        burst = 4000.0 if (i // 25) % 3 == 0 else 300.0
+        down.append(max(0.0, rng.gauss(burst, burst * 0.3)))
+        up.append(max(0.0, rng.gauss(burst * 0.2, burst * 0.1)))
+        latency.append(max(1.0, rng.gauss(24.0, 6.0)))
+    speed = [d + u for d, u in zip(down, up)]
+    return speed, latency, down, up
+
+
+def build_graphs(single, dual, history, cols: int, lines: int) -> List[str]:
+    """Renders the graphs of one frame the way build_frame() does for a cols x lines terminal."""
+    speed, latency, down, up = history
+    width, height, count = graph_layout(cols, lines)
+    out = single(speed, width=width, height=height, title="SUB-SPACE BANDWIDTH SPEED", unit=" KB/s")
+    if count == 3:
+        out += single(latency, width=width, height=height, title="COSMIC LATENCY", unit=" ms")
+    if count >= 2:
+        out += dual(down, up, width=width, height=height, title="TELEMETRY TRANSMISSION")
+    return out
+
+
+def time_frames(single, dual, history, cols: int, lines: int, frames: int) -> float:
+    """Milliseconds per frame, best of three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(frames):
+            build_graphs(single, dual, history, cols, lines)
+        best = min(best, time.perf_counter() - start)
+    return best / frames * 1000.0
+
+
+def parse_sizes(text: str) -> List[Tuple[int, int]]:
+    sizes = []
+    for part in text.split(","):
+        cols, lines = part.lower().split("x")
+        sizes.append((int(cols), int(lines)))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NetworkInfo graph rendering")
+    parser.add_argument("--sizes", type=str, default="80x24,120x40,160x50,200x60",
+                        help="Terminal sizes as COLSxLINES, comma separated (default: 80x24,120x40,160x50,200x60)")
+    parser.add_argument("--frames", type=int, default=200, help="Frames rendered per timing run (default: 200)")
+    parser.add_argument("--samples", type=int, default=200, help="History length fed to the graphs (default: 200)")
+    args = parser.parse_args()
+
+    history = sample_history(args.samples)
+    print(f"{'terminal':>9} {'graphs':>10} {'legacy ms':>10} {'table ms':>9} {'speedup':>8} {'legacy B':>9} {'table B':>8}")
+    for cols, lines in parse_sizes(args.sizes):
+        width, height, count = graph_layout(cols, lines)
+        old_ms = time_frames(legacy_ascii_graph, legacy_dual_ascii_graph, history, cols, lines, args.frames)
+        new_ms = time_frames(render_ascii_graph, render_dual_ascii_graph, history, cols, lines, args.frames)
+
+        # Both renderers must draw the same picture; only the escape codes around it may differ
+        old_lines = build_graphs(legacy_ascii_graph, legacy_dual_ascii_graph, history, cols, lines)
+        new_lines = build_graphs(render_ascii_graph, render_dual_ascii_graph, history, cols, lines)
+        old_bytes = sum(len(line.encode("utf-8")) for line in old_lines)
+        new_bytes = sum(len(line.encode("utf-8")) for line in new_lines)
+        # The old renderer truncates exact fractions (50% of 5 rows) one eighth low; nothing else may differ
+        differing = sum(ANSI_PATTERN.sub("", a) != ANSI_PATTERN.sub("", b) for a, b in zip(old_lines, new_lines))
+        note = f"  ({differing} rows differ by a boundary eighth)" if differing else ""
+
+        graphs = f"{count}x{width}x{height}"
+        print(f"{cols:>4}x{lines:<4} {graphs:>10} {old_ms:>10.3f} {new_ms:>9.3f} {old_ms / new_ms:>7.1f}x {old_bytes:>9} {new_bytes:>8}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,29 +14,39 @@ import random
 from typing import List, Dict, Any
 
 try:
+    from .ring_buffer import RingBuffer
+    from .sampler import NetworkSample, NetworkSampler
+    from .screen import ScreenWriter
     from .utils import (
-        load_data, save_data, get_net_io_counters, LatencyTracker,
-        format_bytes, render_ascii_graph, render_dual_ascii_graph,
-        get_terminal_dimensions, hide_cursor, show_cursor, safe_write, center_ansi, truncate_ansi,
-        ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM, CLR_RESET, CLR_BOLD, CLR_DIM,
+        load_data, save_data,
+        format_bytes, render_ascii_graph, render_dual_ascii_graph, render_sparkline,
+        get_terminal_dimensions, hide_cursor, show_cursor, center_ansi, truncate_ansi, visible_width,
+        CLR_RESET, CLR_BOLD, CLR_DIM,
         CLR_BLINK, CLR_CYAN, CLR_LIGHT_CYAN, CLR_GREEN, CLR_LIGHT_GREEN,
         CLR_YELLOW, CLR_LIGHT_YELLOW, CLR_RED, CLR_LIGHT_RED,
         CLR_MAGENTA, CLR_LIGHT_MAGENTA, CLR_WHITE
     )
 except (ImportError, ValueError):
+    from ring_buffer import RingBuffer
+    from sampler import NetworkSample, NetworkSampler
+    from screen import ScreenWriter
     from utils import (
-        load_data, save_data, get_net_io_counters, LatencyTracker,
-        format_bytes, render_ascii_graph, render_dual_ascii_graph,
-        get_terminal_dimensions, hide_cursor, show_cursor, safe_write, center_ansi, truncate_ansi,
-        ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM, CLR_RESET, CLR_BOLD, CLR_DIM,
+        load_data, save_data,
+        format_bytes, render_ascii_graph, render_dual_ascii_graph, render_sparkline,
+        get_terminal_dimensions, hide_cursor, show_cursor, center_ansi, truncate_ansi, visible_width,
+        CLR_RESET, CLR_BOLD, CLR_DIM,
         CLR_BLINK, CLR_CYAN, CLR_LIGHT_CYAN, CLR_GREEN, CLR_LIGHT_GREEN,
         CLR_YELLOW, CLR_LIGHT_YELLOW, CLR_RED, CLR_LIGHT_RED,
         CLR_MAGENTA, CLR_LIGHT_MAGENTA, CLR_WHITE
     )
 
+# Most interfaces given a sparkline row in the per-NIC panel
+MAX_NIC_ROWS = 8
+
 
 class NetworkAnalyzer:
-    def __init__(self, fps: int = None, ping_target: str = None):
+    def __init__(self, fps: int = None, ping_target: str = None, history_samples: int = None, full_redraw: bool = False,
+                 sampler: NetworkSampler = None, iface: str = None, per_nic: bool = False):
         self.data = load_data()
         settings = self.data.get("settings", {})
 
@@ -47,24 +57,26 @@ class NetworkAnalyzer:
         self.frame_duration = 1.0 / self.target_fps
         self.running = False
 
-        # Metric history ring buffers
-        self.speed_history: List[float] = []
-        self.latency_history: List[float] = []
-        self.download_history: List[float] = []
-        self.upload_history: List[float] = []
-
-        # Network IO counters
-        self.prev_recv, self.prev_sent = get_net_io_counters()
-        self.last_sample_time = time.perf_counter()
-
-        # Session tracking
-        self.session_total_recv = 0.0
-        self.session_total_sent = 0.0
-        self.peak_download = 0.0
-        self.peak_upload = 0.0
-
-        # Background Ping Tracker thread
-        self.latency_tracker = LatencyTracker(target_host=self.ping_target, interval=0.8)
+        # Metric history ring buffers (one sample per frame; the graphs only draw the newest columns)
+        self.history_samples = max(1, history_samples or settings.get("history_samples", 200))
+        self.speed_history = RingBuffer(self.history_samples)
+        self.latency_history = RingBuffer(self.history_samples)
+        self.download_history = RingBuffer(self.history_samples)
+        self.upload_history = RingBuffer(self.history_samples)
+
+        # Counters, session totals and the background ping thread live in the sampler;
+        # the HUD is one of its listeners (file sinks can be attached next to it)
+        self.sampler = sampler or NetworkSampler(self.ping_target, settings.get("ping_interval", 0.8), iface=iface)
+        self.sampler.add_listener(self.record_sample)
+        self.latency_tracker = self.sampler.latency_tracker
+        self.iface_label = f" [{self.sampler.iface}]" if self.sampler.iface else ""
+
+        # Per-interface sparklines: total KB/s history, latest rates and session error/drop counts
+        self.per_nic = per_nic
+        self.nic_history: Dict[str, RingBuffer] = {}
+        self.nic_latest: Dict[str, Any] = {}
+        self.nic_errors: Dict[str, int] = {}
+        self.nic_drops: Dict[str, int] = {}
 
         # Alien Kaomojis & Messages stickiness control
         self.alien_kaomojis = self.data.get("alien_kaomojis", {})
@@ -82,49 +94,32 @@ class NetworkAnalyzer:
         self.last_term_cols = 0
         self.last_term_lines = 0
 
+        # Differential screen output and the bytes/s it costs (shown in the footer)
+        self.screen = ScreenWriter(full_redraw=full_redraw)
+        self.output_bps = 0.0
 
-    def update_metrics(self):
-        now = time.perf_counter()
-        dt = now - self.last_sample_time
-        if dt <= 0.001:
-            return
-
-        curr_recv, curr_sent = get_net_io_counters()
-
-        # Counter deltas
-        d_recv = max(0, curr_recv - self.prev_recv) if self.prev_recv > 0 else 0
-        d_sent = max(0, curr_sent - self.prev_sent) if self.prev_sent > 0 else 0
 
-        self.prev_recv = curr_recv
-        self.prev_sent = curr_sent
-        self.last_sample_time = now
+    def record_sample(self, sample: NetworkSample):
+        # Store KB/s values in history; full buffers drop their oldest sample
+        self.download_history.push(sample.down_bps / 1024.0)
+        self.upload_history.push(sample.up_bps / 1024.0)
+        self.speed_history.push(sample.total_bps / 1024.0)
 
-        down_bps = d_recv / dt
-        up_bps = d_sent / dt
-        total_bps = down_bps + up_bps
+        lat = sample.latency_ms
+        self.latency_history.push(max(0.0, lat) if lat > 0 else 0.0)
 
-        self.session_total_recv += d_recv
-        self.session_total_sent += d_sent
+        if self.per_nic:
+            for iface, nic in sample.interfaces.items():
+                history = self.nic_history.get(iface)
+                if history is None:
+                    history = self.nic_history[iface] = RingBuffer(self.history_samples)
+                history.push((nic.down_bps + nic.up_bps) / 1024.0)
+                self.nic_errors[iface] = self.nic_errors.get(iface, 0) + nic.errin + nic.errout
+                self.nic_drops[iface] = self.nic_drops.get(iface, 0) + nic.dropin + nic.dropout
+            self.nic_latest = sample.interfaces
 
-        if down_bps > self.peak_download:
-            self.peak_download = down_bps
-        if up_bps > self.peak_upload:
-            self.peak_upload = up_bps
-
-        # Store KB/s values in history
-        self.download_history.append(down_bps / 1024.0)
-        self.upload_history.append(up_bps / 1024.0)
-        self.speed_history.append(total_bps / 1024.0)
-
-        lat = self.latency_tracker.current_latency_ms
-        self.latency_history.append(max(0.0, lat) if lat > 0 else 0.0)
-
-        # Cap history buffer to max 200 samples
-        if len(self.download_history) > 200:
-            self.download_history.pop(0)
-            self.upload_history.pop(0)
-            self.speed_history.pop(0)
-            self.latency_history.pop(0)
+    def update_metrics(self):
+        self.sampler.sample()
 
         # Rotate quote every 1 second for animated HUD updates
         if time.time() - self.quote_timer > self.quote_duration:
@@ -164,8 +159,36 @@ class NetworkAnalyzer:
         return "OPTIMAL", CLR_LIGHT_GREEN, CLR_GREEN, kao, status_msg
 
     def build_frame(self, actual_fps: float) -> str:
+        return "\n".join(self.build_frame_lines(actual_fps))
+
+    def visible_nics(self, term_lines: int) -> List[str]:
+        """Interfaces that get a sparkline row; the rest of the frame keeps the 21 rows its 3-graph layout needs."""
+        if not self.per_nic:
+            return []
+        rows = min(len(self.nic_history), MAX_NIC_ROWS, term_lines - 21 - 1)
+        return sorted(self.nic_history)[:rows] if rows > 0 else []
+
+    def build_nic_lines(self, names: List[str], graph_width: int, main_color: str, border_color: str) -> List[str]:
+        lines = [f"  {CLR_BOLD}{border_color}⎔─ INTERFACES{self.iface_label} {CLR_RESET}{CLR_DIM}(rate | session errors / drops){CLR_RESET}"]
+        for iface in names:
+            nic = self.nic_latest.get(iface)
+            down = format_bytes(nic.down_bps) if nic else format_bytes(0)
+            up = format_bytes(nic.up_bps) if nic else format_bytes(0)
+            stats = (f" {CLR_LIGHT_CYAN}▼{down}{CLR_RESET} {CLR_LIGHT_MAGENTA}▲{up}{CLR_RESET}"
+                     f" {CLR_DIM}err {self.nic_errors.get(iface, 0)} drop {self.nic_drops.get(iface, 0)}{CLR_RESET}")
+            spark_width = max(8, graph_width - 12 - visible_width(stats))
+            spark = render_sparkline(self.nic_history[iface], spark_width, main_color)
+            lines.append(truncate_ansi(f"  {iface[:10]:<10} {spark}{stats}", graph_width + 4))
+        return lines
+
+    def build_frame_lines(self, actual_fps: float) -> List[str]:
         term_cols, term_lines = get_terminal_dimensions()
 
+        # The per-NIC panel takes its rows before the graph layout is picked from what is left
+        nic_names = self.visible_nics(term_lines)
+        if nic_names:
+            term_lines -= len(nic_names) + 1
+
         # Strict horizontal bounding: guarantee box_width + 2 <= term_cols
         max_allowed_box = max(20, term_cols - 6)
         graph_width = max(10, min(140, max_allowed_box - 4))
@@ -207,7 +230,7 @@ class NetworkAnalyzer:
 
             speed_graph = render_ascii_graph(
                 self.speed_history, width=graph_width, height=graph_height,
-                title="SUB-SPACE BANDWIDTH SPEED", unit=" KB/s", main_color=main_color, border_color=border_color
+                title=f"SUB-SPACE BANDWIDTH SPEED{self.iface_label}", unit=" KB/s", main_color=main_color, border_color=border_color
             )
             for line in speed_graph:
                 frame_lines.append(f"  {line}")
@@ -223,18 +246,18 @@ class NetworkAnalyzer:
 
             dual_graph = render_dual_ascii_graph(
                 self.download_history, self.upload_history, width=graph_width, height=graph_height,
-                title="TELEMETRY TRANSMISSION (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
+                title=f"TELEMETRY TRANSMISSION{self.iface_label} (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
             )
             for line in dual_graph:
                 frame_lines.append(f"  {line}")
 
-        elif term_lines >= 20:
+        elif term_lines >= 21:
             # Compact 3 graphs (no empty separator lines)
             graph_height = max(2, (term_lines - 15) // 3)
 
             speed_graph = render_ascii_graph(
                 self.speed_history, width=graph_width, height=graph_height,
-                title="SUB-SPACE BANDWIDTH SPEED", unit=" KB/s", main_color=main_color, border_color=border_color
+                title=f"SUB-SPACE BANDWIDTH SPEED{self.iface_label}", unit=" KB/s", main_color=main_color, border_color=border_color
             )
             for line in speed_graph:
                 frame_lines.append(f"  {line}")
@@ -248,58 +271,63 @@ class NetworkAnalyzer:
 
             dual_graph = render_dual_ascii_graph(
                 self.download_history, self.upload_history, width=graph_width, height=graph_height,
-                title="TELEMETRY TRANSMISSION (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
+                title=f"TELEMETRY TRANSMISSION{self.iface_label} (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
             )
             for line in dual_graph:
                 frame_lines.append(f"  {line}")
 
-        elif term_lines >= 14:
+        elif term_lines >= 15:
             # 2 graphs (Speed & Dual Telemetry)
             graph_height = max(1, (term_lines - 13) // 2)
 
             speed_graph = render_ascii_graph(
                 self.speed_history, width=graph_width, height=graph_height,
-                title="SUB-SPACE BANDWIDTH SPEED", unit=" KB/s", main_color=main_color, border_color=border_color
+                title=f"SUB-SPACE BANDWIDTH SPEED{self.iface_label}", unit=" KB/s", main_color=main_color, border_color=border_color
             )
             for line in speed_graph:
                 frame_lines.append(f"  {line}")
 
             dual_graph = render_dual_ascii_graph(
                 self.download_history, self.upload_history, width=graph_width, height=graph_height,
-                title="TELEMETRY TRANSMISSION (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
+                title=f"TELEMETRY TRANSMISSION{self.iface_label} (Cyan = Down | Magenta = Up)", main_color=main_color, border_color=border_color
             )
             for line in dual_graph:
                 frame_lines.append(f"  {line}")
 
         else:
-            # 1 Compact Graph for narrow height windows
-            graph_height = max(1, term_lines - 10)
+            # 1 Compact Graph for narrow height windows (9 chrome lines + title and axis)
+            graph_height = max(1, term_lines - 11)
             speed_graph = render_ascii_graph(
                 self.speed_history, width=graph_width, height=graph_height,
-                title="BANDWIDTH SPEED", unit=" KB/s", main_color=main_color, border_color=border_color
+                title=f"BANDWIDTH SPEED{self.iface_label}", unit=" KB/s", main_color=main_color, border_color=border_color
             )
             for line in speed_graph:
                 frame_lines.append(f"  {line}")
 
+        if nic_names:
+            frame_lines.extend(self.build_nic_lines(nic_names, graph_width, main_color, border_color))
+
         # Footer Box
         frame_lines.append(f"{CLR_BOLD}{border_color}╚{'═' * box_width}╝{CLR_RESET}")
-        session_down = format_bytes(self.session_total_recv)
-        session_up = format_bytes(self.session_total_sent)
-        peak_d = format_bytes(self.peak_download)
-        footer_msg = f"{CLR_DIM}Session DL: {session_down} | UL: {session_up} | Peak DL: {peak_d} | Adaptive HUD | Ctrl+C to disconnect{CLR_RESET}"
+        session_down = format_bytes(self.sampler.session_total_recv)
+        session_up = format_bytes(self.sampler.session_total_sent)
+        peak_d = format_bytes(self.sampler.peak_download)
+        hud_out = format_bytes(self.output_bps).strip()
+        footer_msg = f"{CLR_DIM}Session DL: {session_down} | UL: {session_up} | Peak DL: {peak_d} | HUD out: {hud_out} | Ctrl+C to disconnect{CLR_RESET}"
         footer_msg = truncate_ansi(footer_msg, term_cols - 4)
         frame_lines.append(f"  {footer_msg}")
 
-        return "\n".join(frame_lines)
+        return frame_lines
 
     def run(self):
         hide_cursor()
         self.running = True
-        self.latency_tracker.start()
+        self.sampler.start()
 
         last_fps_check = time.perf_counter()
         frame_count = 0
         actual_fps = float(self.target_fps)
+        bytes_at_check = self.screen.bytes_written
 
         try:
             while self.running:
@@ -313,8 +341,9 @@ class NetworkAnalyzer:
                     import os
                     if sys.platform == "win32":
                         os.system("cls")
+                        self.screen.invalidate()
                     else:
-                        safe_write("\033[2J\033[H")
+                        self.screen.clear()
 
                 self.update_metrics()
                 frame_count += 1
@@ -322,12 +351,13 @@ class NetworkAnalyzer:
                 now = time.perf_counter()
                 if now - last_fps_check >= 1.0:
                     actual_fps = frame_count / (now - last_fps_check)
+                    self.output_bps = (self.screen.bytes_written - bytes_at_check) / (now - last_fps_check)
+                    bytes_at_check = self.screen.bytes_written
                     frame_count = 0
                     last_fps_check = now
 
-                # Build & safe-write full frame buffer
-                frame_buffer = self.build_frame(actual_fps)
-                safe_write(ANSI_CURSOR_HOME + frame_buffer + ANSI_CLEAR_BOTTOM)
+                # Build the frame and write only the lines that changed since the last one
+                self.screen.draw(self.build_frame_lines(actual_fps), term_lines)
 
                 # Framerate locking sleep
                 elapsed = time.perf_counter() - frame_start
@@ -341,16 +371,11 @@ class NetworkAnalyzer:
             self.cleanup()
 
     def cleanup(self):
-        self.latency_tracker.stop()
+        self.sampler.stop()
         show_cursor()
 
         # Update saved session stats in data.json
-        stats = self.data.get("stats", {})
-        stats["session_peak_download_bps"] = max(stats.get("session_peak_download_bps", 0), self.peak_download)
-        stats["session_peak_upload_bps"] = max(stats.get("session_peak_upload_bps", 0), self.peak_upload)
-        stats["session_total_download_bytes"] = stats.get("session_total_download_bytes", 0) + self.session_total_recv
-        stats["session_total_upload_bytes"] = stats.get("session_total_upload_bytes", 0) + self.session_total_sent
-        self.data["stats"] = stats
+        self.sampler.record_session(self.data)
         save_data(self.data)
 
         # Print clean exit message with alien goodbye kaomoji
@@ -0,0 +1,173 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: headless.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Headless telemetry recorder. Runs the sampler at a
+# ☆ fixed interval without a HUD and writes every sample to an NDJSON
+# ☆ or CSV sink (a file or stdout), for servers without a terminal.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import sys
+import csv
+import json
+import time
+import signal
+from abc import ABC, abstractmethod
+from typing import List, Optional, TextIO
+
+try:
+    from .sampler import NetworkSample, NetworkSampler
+    from .utils import load_data, save_data
+except (ImportError, ValueError):
+    from sampler import NetworkSample, NetworkSampler
+    from utils import load_data, save_data
+
+SINK_FORMATS = ("ndjson", "csv")
+
+
+# Flat fields of a sample; NDJSON records also carry an "interfaces" object
+RECORD_FIELDS = tuple(field for field in NetworkSample._fields if field != "interfaces")
+COUNT_FIELDS = ("packets_recv", "packets_sent", "errin", "errout", "dropin", "dropout")
+
+
+def sample_record(sample: NetworkSample) -> dict:
+    """The flat fields written for a sample, rounded to what the counters can actually resolve."""
+    record = {
+        "timestamp": round(sample.timestamp, 3),
+        "interval": round(sample.interval, 4),
+        "down_bps": round(sample.down_bps, 1),
+        "up_bps": round(sample.up_bps, 1),
+        "total_bps": round(sample.total_bps, 1),
+        "latency_ms": sample.latency_ms,
+        "recv_bytes": sample.recv_bytes,
+        "sent_bytes": sample.sent_bytes,
+    }
+    for field in COUNT_FIELDS:
+        record[field] = getattr(sample, field)
+    return record
+
+
+def interface_records(sample: NetworkSample) -> dict:
+    """{interface: {down_bps, up_bps, packet/error/drop counts}} for the NDJSON sink."""
+    records = {}
+    for iface, nic in sample.interfaces.items():
+        record = {"down_bps": round(nic.down_bps, 1), "up_bps": round(nic.up_bps, 1)}
+        for field in COUNT_FIELDS:
+            record[field] = getattr(nic, field)
+        records[iface] = record
+    return records
+
+
+class SampleSink(ABC):
+    """Writes samples as lines of text to a file (appending) or to stdout when path is None or "-"."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.to_stdout = path in (None, "-")
+        self.is_new = self.to_stdout or not os.path.exists(path) or os.path.getsize(path) == 0
+        # Line buffered: every sample reaches the file (and `tail -f`) as soon as it is taken
+        self.stream: TextIO = sys.stdout if self.to_stdout else open(path, "a", encoding="utf-8", newline="", buffering=1)
+
+    @abstractmethod
+    def write(self, sample: NetworkSample):
+        """Writes one sample; called by the sampler for every sample it takes."""
+
+    def close(self):
+        try:
+            if self.to_stdout:
+                self.stream.flush()
+            else:
+                self.stream.close()
+        except BrokenPipeError:
+            pass
+
+
+class NdjsonSink(SampleSink):
+    def write(self, sample: NetworkSample):
+        record = sample_record(sample)
+        if sample.interfaces:
+            record["interfaces"] = interface_records(sample)
+        self.stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def csv_header(path: str) -> tuple:
+    """The first row of an existing CSV file, () when it is empty."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return tuple(next(csv.reader(f), ()))
+
+
+class CsvSink(SampleSink):
+    def __init__(self, path: Optional[str] = None):
+        # Appending rows under a header with other columns would misalign every one of them
+        if path not in (None, "-") and os.path.exists(path) and os.path.getsize(path) > 0:
+            header = csv_header(path)
+            if header != RECORD_FIELDS:
+                raise ValueError(f"{path} has other columns than this version writes; record to a new file")
+        super().__init__(path)
+        self.writer = csv.writer(self.stream, lineterminator="\n")
+        if self.is_new:
+            self.writer.writerow(RECORD_FIELDS)
+
+    def write(self, sample: NetworkSample):
+        self.writer.writerow(sample_record(sample).values())
+
+
+def open_sink(fmt: Optional[str], path: Optional[str]) -> SampleSink:
+    """Opens a sink; without an explicit format a .csv path means CSV and anything else NDJSON."""
+    if fmt is None:
+        fmt = "csv" if path and path.lower().endswith(".csv") else "ndjson"
+    if fmt not in SINK_FORMATS:
+        raise ValueError(f"unknown sink format: {fmt}")
+    return CsvSink(path) if fmt == "csv" else NdjsonSink(path)
+
+
+def run_headless(sampler: NetworkSampler, sinks: List[SampleSink], interval: float = 1.0,
+                 duration: Optional[float] = None):
+    """
+    Samples every `interval` seconds until Ctrl+C, SIGTERM or `duration` runs out. Sample
+    times are scheduled from the start, so the rate does not drift with the time spent
+    sampling, and the loop sleeps for the whole gap in between. Session stats are saved
+    to data.json on the way out, as the HUD does.
+    """
+    for sink in sinks:
+        sampler.add_listener(sink.write)
+
+    stopping = []
+
+    def request_stop(signum, frame):
+        stopping.append(signum)
+
+    # A service manager stops daemons with SIGTERM; treat it like Ctrl+C
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    sampler.start()
+    start = time.perf_counter()
+    ticks = 0
+    try:
+        while not stopping:
+            ticks += 1
+            deadline = start + ticks * interval
+            if duration is not None and deadline - start > duration + 1e-9:
+                break
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -interval:
+                # Fell behind (suspend, slow disk): skip the missed ticks instead of bursting
+                ticks += int(-delay // interval)
+            if stopping:
+                break
+            sampler.sample()
+    except (KeyboardInterrupt, BrokenPipeError):
+        # BrokenPipeError: the reader of stdout went away (e.g. piped into `head`)
+        pass
+    finally:
+        sampler.stop()
+        for sink in sinks:
+            sink.close()
+        data = load_data()
+        sampler.record_session(data)
+        save_data(data)
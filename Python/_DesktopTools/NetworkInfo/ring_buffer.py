@@ -0,0 +1,101 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: ring_buffer.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Fixed-capacity float history for the metric graphs,
+# ☆ with O(1) push, zero-copy windows of the newest samples and a
+# ☆ running maximum over any window.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+from array import array
+from bisect import bisect_left
+from typing import Union
+
+
+class RingBuffer:
+    """
+    Keeps the newest `capacity` samples. Every sample is written twice, at slot i and
+    slot i + capacity, so the newest n samples are always one contiguous run of the array
+    and window(n) can hand out a memoryview instead of building a list.
+    """
+
+    def __init__(self, capacity: int = 200):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._data = array('d', [0.0]) * (2 * capacity)
+        self._view = memoryview(self._data)
+        self._next = 0      # slot the next sample goes to (0 <= _next < capacity)
+        self._count = 0     # samples held, up to capacity
+        self._pushed = 0    # samples ever pushed; the sequence number of the next one
+
+        # Running max: sequence numbers and values of the samples that are still the
+        # largest of everything after them, values strictly decreasing. Entries before
+        # _max_head have been dropped; the arrays are compacted when that prefix grows.
+        self._max_seq = array('q')
+        self._max_val = array('d')
+        self._max_head = 0
+
+    def push(self, value: float) -> None:
+        """Appends a sample, dropping the oldest once full. O(1), amortised for the running max."""
+        slot = self._next
+        self._data[slot] = value
+        self._data[slot + self.capacity] = value
+        self._next = slot + 1 if slot + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+        seq_list, val_list = self._max_seq, self._max_val
+        while len(seq_list) > self._max_head and val_list[-1] <= value:
+            seq_list.pop()
+            val_list.pop()
+        seq_list.append(self._pushed)
+        val_list.append(value)
+        self._pushed += 1
+
+        # Forget maxima that have left the buffer, then compact once half the arrays are dead
+        oldest = self._pushed - self._count
+        while self._max_seq[self._max_head] < oldest:
+            self._max_head += 1
+        if self._max_head > 64 and self._max_head * 2 > len(self._max_seq):
+            del self._max_seq[:self._max_head]
+            del self._max_val[:self._max_head]
+            self._max_head = 0
+
+    def window(self, width: int) -> memoryview:
+        """
+        The newest min(width, len(self)) samples, oldest first, as a memoryview of the buffer
+        itself (no copy). Read it before the next push; the slots are reused as the ring turns.
+        """
+        count = min(max(0, width), self._count)
+        end = self._next + self.capacity
+        return self._view[end - count:end]
+
+    def max(self, width: int = None) -> float:
+        """Largest of the newest `width` samples (all of them if None); 0.0 when empty."""
+        if not self._count:
+            return 0.0
+        count = self._count if width is None else min(max(1, width), self._count)
+        # The first surviving maximum inside the window is the largest sample in it
+        first = self._pushed - count
+        position = bisect_left(self._max_seq, first, self._max_head)
+        return self._max_val[position]
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+        self._pushed = 0
+        del self._max_seq[:]
+        del self._max_val[:]
+        self._max_head = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self.window(self._count)[index]
+
+    def __iter__(self):
+        return iter(self.window(self._count))
@@ -0,0 +1,176 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: sampler.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Network telemetry sampler shared by the HUD and the
+# ☆ headless recorder. Turns interface byte counters and the latency
+# ☆ thread into samples and hands them to every attached consumer.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+try:
+    from .utils import get_net_io_counters, get_per_nic_counters, is_loopback, InterfaceCounters, LatencyTracker
+except (ImportError, ValueError):
+    from utils import get_net_io_counters, get_per_nic_counters, is_loopback, InterfaceCounters, LatencyTracker
+
+
+class InterfaceSample(NamedTuple):
+    """One interface over one interval: rates in bytes/s, the other fields are counts during the interval."""
+    down_bps: float
+    up_bps: float
+    packets_recv: int
+    packets_sent: int
+    errin: int
+    errout: int
+    dropin: int
+    dropout: int
+
+
+class NetworkSample(NamedTuple):
+    """One measurement: rates in bytes/s over the last interval, latency in ms (-1 when offline)."""
+    timestamp: float        # wall clock (time.time()) when the sample was taken
+    interval: float         # seconds covered by this sample
+    down_bps: float
+    up_bps: float
+    total_bps: float
+    latency_ms: float
+    recv_bytes: int         # bytes received during the interval
+    sent_bytes: int         # bytes sent during the interval
+    packets_recv: int       # packet, error and drop counts during the interval (0 without per-NIC counters)
+    packets_sent: int
+    errin: int
+    errout: int
+    dropin: int
+    dropout: int
+    interfaces: Dict[str, InterfaceSample]  # per interface, loopback left out unless it is the selected one
+
+
+class NetworkSampler:
+    """
+    Owns the byte counters, the session totals and peaks, and the LatencyTracker thread.
+    Consumers (the HUD, file sinks) register with add_listener() and are called with each
+    NetworkSample, so sampling never depends on anything being drawn.
+
+    Counters are read per interface. The sample totals are those of `iface` when one is
+    selected, otherwise the sum of every non-loopback interface; summing per-interface
+    deltas keeps a NIC that appears mid-session from showing up as one huge spike.
+    """
+
+    def __init__(self, ping_target: str = "8.8.8.8", ping_interval: float = 0.8, iface: Optional[str] = None):
+        self.latency_tracker = LatencyTracker(target_host=ping_target, interval=ping_interval)
+        self.listeners: List[Callable[[NetworkSample], None]] = []
+        self.iface = iface
+
+        # Network IO counters (prev_nics is empty where only totals are available)
+        self.prev_nics: Dict[str, InterfaceCounters] = get_per_nic_counters()
+        self.prev_recv, self.prev_sent = (0, 0) if self.prev_nics else get_net_io_counters()
+        self.last_sample_time = time.perf_counter()
+
+        # Session tracking
+        self.session_total_recv = 0.0
+        self.session_total_sent = 0.0
+        self.peak_download = 0.0
+        self.peak_upload = 0.0
+
+    def add_listener(self, listener: Callable[[NetworkSample], None]):
+        self.listeners.append(listener)
+
+    def start(self):
+        self.latency_tracker.start()
+
+    def stop(self):
+        self.latency_tracker.stop()
+
+    def sample(self) -> Optional[NetworkSample]:
+        """
+        Reads the counters, updates the session figures and notifies the listeners. None if
+        called too soon, or if the per-NIC read failed: that sample is skipped and the next one
+        covers both intervals, its deltas and dt measured from the same earlier read.
+        """
+        now = time.perf_counter()
+        dt = now - self.last_sample_time
+        if dt <= 0.001:
+            return None
+
+        nics = get_per_nic_counters() if self.prev_nics else {}
+        if self.prev_nics and not nics:
+            return None
+        if nics:
+            interfaces, totals = self._interface_deltas(nics, dt)
+            d_recv, d_sent = totals.bytes_recv, totals.bytes_sent
+        else:
+            # Totals only (no psutil on Windows): the original byte counter path
+            interfaces, totals = {}, InterfaceCounters(0, 0, 0, 0, 0, 0, 0, 0)
+            curr_recv, curr_sent = get_net_io_counters()
+
+            # Counter deltas
+            d_recv = max(0, curr_recv - self.prev_recv) if self.prev_recv > 0 else 0
+            d_sent = max(0, curr_sent - self.prev_sent) if self.prev_sent > 0 else 0
+
+            self.prev_recv = curr_recv
+            self.prev_sent = curr_sent
+        self.last_sample_time = now
+
+        down_bps = d_recv / dt
+        up_bps = d_sent / dt
+
+        self.session_total_recv += d_recv
+        self.session_total_sent += d_sent
+
+        if down_bps > self.peak_download:
+            self.peak_download = down_bps
+        if up_bps > self.peak_upload:
+            self.peak_upload = up_bps
+
+        sample = NetworkSample(
+            timestamp=time.time(),
+            interval=dt,
+            down_bps=down_bps,
+            up_bps=up_bps,
+            total_bps=down_bps + up_bps,
+            latency_ms=self.latency_tracker.current_latency_ms,
+            recv_bytes=d_recv,
+            sent_bytes=d_sent,
+            packets_recv=totals.packets_recv,
+            packets_sent=totals.packets_sent,
+            errin=totals.errin,
+            errout=totals.errout,
+            dropin=totals.dropin,
+            dropout=totals.dropout,
+            interfaces=interfaces,
+        )
+        for listener in self.listeners:
+            listener(sample)
+        return sample
+
+    def _interface_deltas(self, nics: Dict[str, InterfaceCounters], dt: float):
+        """Per-interface samples since the previous read, and the summed deltas of the selected interfaces."""
+        interfaces = {}
+        summed = [0] * len(InterfaceCounters._fields)
+        prev_nics = self.prev_nics
+        for iface, counters in nics.items():
+            previous = prev_nics.get(iface)
+            if previous is None:
+                continue
+            # A counter that went backwards was reset (driver reload); count nothing for it
+            deltas = [max(0, now - before) for now, before in zip(counters, previous)]
+            selected = iface == self.iface if self.iface else not is_loopback(iface)
+            if selected:
+                summed = [total + delta for total, delta in zip(summed, deltas)]
+            if selected or not is_loopback(iface):
+                interfaces[iface] = InterfaceSample(deltas[0] / dt, deltas[1] / dt, *deltas[2:])
+        self.prev_nics = nics
+        return interfaces, InterfaceCounters(*summed)
+
+    def record_session(self, data: Dict[str, Any]):
+        """Folds this session's totals and peaks into the persistent stats of data.json."""
+        stats = data.get("stats", {})
+        stats["session_peak_download_bps"] = max(stats.get("session_peak_download_bps", 0), self.peak_download)
+        stats["session_peak_upload_bps"] = max(stats.get("session_peak_upload_bps", 0), self.peak_upload)
+        stats["session_total_download_bytes"] = stats.get("session_total_download_bytes", 0) + self.session_total_recv
+        stats["session_total_upload_bytes"] = stats.get("session_total_upload_bytes", 0) + self.session_total_sent
+        data["stats"] = stats
@@ -0,0 +1,137 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: screen.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Differential terminal output for the HUD. Keeps the
+# ☆ lines of the last frame on screen and only rewrites the lines
+# ☆ that changed, counting every byte it sends.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import re
+from typing import Callable, List, Optional
+
+try:
+    from .utils import (
+        safe_write, ANSI_REGEX, ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM, ANSI_CLEAR_LINE, ANSI_CLEAR_SCREEN, CLR_RESET
+    )
+except (ImportError, ValueError):
+    from utils import (
+        safe_write, ANSI_REGEX, ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM, ANSI_CLEAR_LINE, ANSI_CLEAR_SCREEN, CLR_RESET
+    )
+
+# Spans are only used on lines whose characters are one column wide on every terminal
+# (printable ASCII, box drawing and block elements); anything else is rewritten whole.
+NARROW_ONLY = re.compile(r'[^\x1b\x20-\x7e\u2500-\u259f]')
+# A changed line is treated as scrolled one cell left when at least this much of it still matches
+SCROLL_MIN_MATCH = 16
+
+
+def common_run(a: str, i: int, b: str, j: int) -> int:
+    """Length of the longest run where a[i:] and b[j:] agree, found by halving (slice compares run in C)."""
+    lo, hi = 0, min(len(a) - i, len(b) - j)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[i + lo:i + mid] == b[j + lo:j + mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def escape_start(s: str, i: int) -> int:
+    """Moves i back to the start of an escape sequence it would otherwise cut in half."""
+    k = s.rfind("\x1b", 0, i)
+    if k != -1:
+        match = ANSI_REGEX.match(s, k)
+        if match is None or match.end() > i:
+            return k
+    return i
+
+
+def style_at(s: str) -> str:
+    """The escapes that set the style in effect at the end of s, starting from a reset."""
+    start = s.rfind(CLR_RESET)
+    start = 0 if start == -1 else start + len(CLR_RESET)
+    return CLR_RESET + "".join(ANSI_REGEX.findall(s, start))
+
+
+def line_update(row: int, old: str, new: str) -> str:
+    """
+    Escape codes that turn `old` into `new` on screen row `row` (1-based). The part both
+    share at the front is left alone; when the rest of the old line reappears one cell to
+    the left (a graph that moved on by one sample) the terminal deletes that cell itself
+    and only the new tail is sent.
+    """
+    if NARROW_ONLY.search(old) or NARROW_ONLY.search(new):
+        return f"\033[{row}H{CLR_RESET}{new}{ANSI_CLEAR_LINE}"
+
+    p = escape_start(new, common_run(old, 0, new, 0))
+    col = len(ANSI_REGEX.sub("", new[:p])) + 1
+
+    if p < len(old) and old[p] != "\x1b":
+        q = p + common_run(old, p + 1, new, p)
+        q = escape_start(new, q)
+        if q - p >= SCROLL_MIN_MATCH:
+            tail_col = len(ANSI_REGEX.sub("", new[:q])) + 1
+            return (f"\033[{row};{col}H\033[P\033[{row};{tail_col}H"
+                    f"{style_at(new[:q])}{new[q:]}{ANSI_CLEAR_LINE}")
+
+    return f"\033[{row};{col}H{style_at(new[:p])}{new[p:]}{ANSI_CLEAR_LINE}"
+
+
+class ScreenWriter:
+    """
+    Draws whole frames but writes only what differs from the previous one: each changed
+    line is patched in place by line_update(), and rows left over from a taller frame are
+    erased. Unchanged frames write nothing at all. With full_redraw every frame is
+    written out in full instead, which is what the HUD did before (kept for comparison).
+    """
+
+    def __init__(self, write: Callable[[str], None] = safe_write, full_redraw: bool = False):
+        self.write = write
+        self.full_redraw = full_redraw
+        self.previous: List[str] = []
+        self.bytes_written = 0
+
+    def clear(self) -> None:
+        """Blanks the screen; the next draw() repaints every line (used after a resize)."""
+        self.previous = []
+        self._send(ANSI_CLEAR_SCREEN)
+
+    def invalidate(self) -> None:
+        """Forgets what is on screen, so the next draw() repaints every line."""
+        self.previous = []
+
+    def draw(self, lines: List[str], height: Optional[int] = None) -> int:
+        """
+        Brings the screen from the previous frame to `lines`. Returns the bytes written. Rows
+        are addressed absolutely, so lines past `height` (the terminal's rows) are dropped:
+        the terminal would otherwise draw them all over its last row.
+        """
+        if height is not None and len(lines) > height:
+            lines = lines[:max(0, height)]
+        if self.full_redraw:
+            return self._send(ANSI_CURSOR_HOME + "\n".join(lines) + ANSI_CLEAR_BOTTOM)
+
+        previous = self.previous
+        known = len(previous)
+        parts = []
+        for row, line in enumerate(lines):
+            if row >= known:
+                parts.append(f"\033[{row + 1}H{CLR_RESET}{line}{ANSI_CLEAR_LINE}")
+            elif previous[row] != line:
+                parts.append(line_update(row + 1, previous[row], line))
+        if len(lines) < known:
+            parts.append(f"\033[{len(lines) + 1}H{ANSI_CLEAR_BOTTOM}")
+        self.previous = list(lines)
+        if not parts:
+            return 0
+        return self._send("".join(parts))
+
+    def _send(self, text: str) -> int:
+        self.write(text)
+        count = len(text.encode("utf-8"))
+        self.bytes_written += count
+        return count
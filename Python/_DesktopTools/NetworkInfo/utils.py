@@ -14,35 +14,31 @@ import json
 import time
 
 import socket
-import shutil
 import subprocess
 import threading
-from typing import Tuple, List, Dict, Any
-
-# ANSI Color and Control Codes
-CLR_RESET = "\033[0m"
-CLR_BOLD = "\033[1m"
-CLR_DIM = "\033[2m"
-CLR_BLINK = "\033[5m"
-
-CLR_CYAN = "\033[36m"
-CLR_LIGHT_CYAN = "\033[96m"
-CLR_GREEN = "\033[32m"
-CLR_LIGHT_GREEN = "\033[92m"
-CLR_YELLOW = "\033[33m"
-CLR_LIGHT_YELLOW = "\033[93m"
-CLR_RED = "\033[31m"
-CLR_LIGHT_RED = "\033[91m"
-CLR_MAGENTA = "\033[35m"
-CLR_LIGHT_MAGENTA = "\033[95m"
-CLR_BLUE = "\033[34m"
-CLR_WHITE = "\033[97m"
-
-# Terminal control
-ANSI_HIDE_CURSOR = "\033[?25l"
-ANSI_SHOW_CURSOR = "\033[?25h"
-ANSI_CURSOR_HOME = "\033[H"
-ANSI_CLEAR_BOTTOM = "\033[J"
+from functools import lru_cache
+from typing import Tuple, List, Dict, Any, NamedTuple, Sequence, Union
+
+# psutil is optional; it is looked up once here rather than retried on every sample
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from .ring_buffer import RingBuffer
+except (ImportError, ValueError):
+    from ring_buffer import RingBuffer
+
+# ANSI colours and width-aware text helpers, shared with DriveAnalyzer in _DesktopTools/_Shared
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_Shared"))
+from terminal_ansi import (
+    CLR_RESET, CLR_BOLD, CLR_DIM, CLR_BLINK, CLR_CYAN, CLR_LIGHT_CYAN, CLR_GREEN, CLR_LIGHT_GREEN,
+    CLR_YELLOW, CLR_LIGHT_YELLOW, CLR_RED, CLR_LIGHT_RED, CLR_MAGENTA, CLR_LIGHT_MAGENTA, CLR_BLUE,
+    CLR_WHITE, ANSI_HIDE_CURSOR, ANSI_SHOW_CURSOR, ANSI_CURSOR_HOME, ANSI_CLEAR_BOTTOM,
+    ANSI_CLEAR_LINE, ANSI_CLEAR_SCREEN, ANSI_REGEX, visible_width, truncate_ansi, center_ansi,
+    safe_write, hide_cursor, show_cursor, get_terminal_dimensions,
+)
 
 BLOCK_CHARS = [" ", " ", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
 
@@ -54,95 +50,6 @@ if hasattr(sys.stdout, "reconfigure"):
         pass
 
 
-import re
-import unicodedata
-
-ANSI_REGEX = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
-
-
-def visible_width(s: str) -> int:
-    """Calculates true visual column width of a string in terminal (handling ANSI and Emojis)."""
-    clean = ANSI_REGEX.sub('', s)
-    w = 0
-    for ch in clean:
-        code = ord(ch)
-        if code >= 0x1F000:
-            w += 2
-        elif unicodedata.east_asian_width(ch) in ('W', 'F'):
-            w += 2
-        else:
-            w += 1
-    return w
-
-
-def truncate_ansi(s: str, max_width: int) -> str:
-    """Truncates ANSI-formatted string to a maximum visual column width while preserving ANSI sequences."""
-    if visible_width(s) <= max_width:
-        return s
-    curr_w = 0
-    res = []
-    in_ansi = False
-    ansi_buf = ""
-    for ch in s:
-        if ch == '\x1b':
-            in_ansi = True
-            ansi_buf = ch
-            continue
-        if in_ansi:
-            ansi_buf += ch
-            if ch.isalpha():
-                in_ansi = False
-                res.append(ansi_buf)
-                ansi_buf = ""
-            continue
-
-        w = visible_width(ch)
-        if curr_w + w > max_width:
-            break
-        curr_w += w
-        res.append(ch)
-    return "".join(res) + CLR_RESET
-
-
-def center_ansi(s: str, total_width: int) -> str:
-    """Pads string centered according to its visual column width, truncating if necessary."""
-    s = truncate_ansi(s, total_width)
-    v_len = visible_width(s)
-    if v_len >= total_width:
-        return s
-    pad_total = total_width - v_len
-    left_pad = pad_total // 2
-    right_pad = pad_total - left_pad
-    return ' ' * left_pad + s + ' ' * right_pad
-
-
-def safe_write(text: str):
-    """Safely writes UTF-8 text to stdout across all platforms without charmap encoding crashes."""
-    try:
-        sys.stdout.write(text)
-        sys.stdout.flush()
-    except UnicodeEncodeError:
-        try:
-            sys.stdout.buffer.write(text.encode("utf-8", errors="replace"))
-            sys.stdout.buffer.flush()
-        except Exception:
-            pass
-
-
-def hide_cursor():
-    safe_write(ANSI_HIDE_CURSOR)
-
-
-def show_cursor():
-    safe_write(ANSI_SHOW_CURSOR)
-
-
-def get_terminal_dimensions() -> Tuple[int, int]:
-    """Returns (columns, lines) of current terminal window."""
-    size = shutil.get_terminal_size(fallback=(80, 24))
-    return size.columns, size.lines
-
-
 def get_data_file_path() -> str:
     """Returns absolute path to data.json, supporting PyInstaller bundles."""
     if hasattr(sys, "_MEIPASS"):
@@ -180,12 +87,12 @@ def save_data(data: Dict[str, Any], filepath: str = None):
 
 def get_net_io_counters() -> Tuple[int, int]:
     """Returns (bytes_received, bytes_sent). Tries psutil first, falls back to native OS calls."""
-    try:
-        import psutil
-        io = psutil.net_io_counters()
-        return io.bytes_recv, io.bytes_sent
-    except Exception:
-        pass
+    if psutil is not None:
+        try:
+            io = psutil.net_io_counters()
+            return io.bytes_recv, io.bytes_sent
+        except Exception:
+            pass
 
     # Windows PowerShell / CIM fallback
     if sys.platform == "win32":
@@ -206,25 +113,101 @@ def get_net_io_counters() -> Tuple[int, int]:
 
     # Linux /proc/net/dev fallback
     elif sys.platform.startswith("linux"):
-        try:
+        counters = _proc_net_dev.read()
+        if counters:
             recv_total = 0
             sent_total = 0
-            with open("/proc/net/dev", "r", encoding="utf-8") as f:
-                lines = f.readlines()[2:]  # Skip header lines
-                for line in lines:
-                    if ":" in line:
-                        iface, data = line.split(":", 1)
-                        if iface.strip() == "lo":
-                            continue  # Ignore loopback interface
-                        cols = data.split()
-                        if len(cols) >= 9:
-                            recv_total += int(cols[0])
-                            sent_total += int(cols[8])
+            for iface, c in counters.items():
+                if not is_loopback(iface):
+                    recv_total += c.bytes_recv
+                    sent_total += c.bytes_sent
             return recv_total, sent_total
+
+    return 0, 0
+
+
+class InterfaceCounters(NamedTuple):
+    """Cumulative counters of one network interface (field names as in psutil)."""
+    bytes_recv: int
+    bytes_sent: int
+    packets_recv: int
+    packets_sent: int
+    errin: int
+    errout: int
+    dropin: int
+    dropout: int
+
+
+def is_loopback(iface: str) -> bool:
+    return iface == "lo" or iface.startswith("lo0") or "loopback" in iface.lower()
+
+
+class ProcNetDevReader:
+    """
+    Parses /proc/net/dev into {interface: InterfaceCounters}. The file stays open and is
+    rewound with seek(0) for every read; procfs regenerates its contents on each read, so
+    this costs one read() instead of an open/read/close per sample.
+    """
+
+    def __init__(self, path: str = "/proc/net/dev"):
+        self.path = path
+        self.handle = None
+
+    def read(self) -> Dict[str, InterfaceCounters]:
+        try:
+            if self.handle is None:
+                self.handle = open(self.path, "r", encoding="utf-8")
+            self.handle.seek(0)
+            text = self.handle.read()
+        except OSError:
+            self.close()
+            return {}
+
+        counters = {}
+        for line in text.splitlines()[2:]:  # Skip header lines
+            iface, sep, data = line.partition(":")
+            if not sep:
+                continue
+            cols = data.split()
+            if len(cols) >= 12:
+                # Receive: bytes packets errs drop ...; Transmit starts at column 8
+                counters[iface.strip()] = InterfaceCounters(
+                    int(cols[0]), int(cols[8]), int(cols[1]), int(cols[9]),
+                    int(cols[2]), int(cols[10]), int(cols[3]), int(cols[11]),
+                )
+        return counters
+
+    def close(self):
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except OSError:
+                pass
+            self.handle = None
+
+
+_proc_net_dev = ProcNetDevReader()
+
+
+def get_per_nic_counters() -> Dict[str, InterfaceCounters]:
+    """
+    Cumulative counters per interface, loopback included. Uses psutil when installed and
+    /proc/net/dev on Linux otherwise; returns {} where neither is available (Windows without
+    psutil), in which case only the get_net_io_counters() totals exist.
+    """
+    if psutil is not None:
+        try:
+            return {
+                iface: InterfaceCounters(c.bytes_recv, c.bytes_sent, c.packets_recv, c.packets_sent,
+                                         c.errin, c.errout, c.dropin, c.dropout)
+                for iface, c in psutil.net_io_counters(pernic=True).items()
+            }
         except Exception:
             pass
 
-    return 0, 0
+    if sys.platform.startswith("linux"):
+        return _proc_net_dev.read()
+    return {}
 
 
 class LatencyTracker(threading.Thread):
@@ -287,61 +270,116 @@ def format_bytes(bytes_per_sec: float) -> str:
         return f"{bytes_per_sec / (1024 * 1024 * 1024):6.2f} GB/s"
 
 
-def render_ascii_graph(values: List[float], width: int = 40, height: int = 4, title: str = "", unit: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
-    """Generates Alien ASCII graph rows using unicode block chars with dynamic width/height."""
-    if not values:
-        values = [0.0]
+# The graph renderers take plain lists or a RingBuffer of samples
+GraphValues = Union[Sequence[float], RingBuffer]
 
-    padded = values[-width:]
-    if len(padded) < width:
-        padded = [0.0] * (width - len(padded)) + padded
+# Graph cells are drawn from a column's "level code": 2 * eighths-of-a-row filled, plus 1 if a
+# fraction is left over. The code alone decides every row's block, so rows come from lookup tables.
+DUAL_CELLS = tuple(
+    (CLR_LIGHT_YELLOW, "█") if d and u else
+    (CLR_LIGHT_CYAN, BLOCK_CHARS[d]) if d else
+    (CLR_LIGHT_MAGENTA, BLOCK_CHARS[u]) if u else
+    (None, " ")
+    for d in range(9) for u in range(9)
+)
 
-    max_val = max(padded) if max(padded) > 0 else 1.0
+
+@lru_cache(maxsize=32)
+def graph_index_tables(height: int) -> Tuple[Tuple[int, ...], ...]:
+    """For each row (top first), a table mapping level code -> BLOCK_CHARS index for that row."""
+    tables = []
+    for h in reversed(range(height)):
+        base = 8 * h
+        row = []
+        for code in range(16 * height + 2):
+            level, partial = divmod(code, 2)
+            if level > base or (level == base and partial):
+                row.append(min(8, max(1, level - base)))
+            else:
+                row.append(0)
+        tables.append(tuple(row))
+    return tuple(tables)
+
+
+@lru_cache(maxsize=32)
+def graph_glyph_tables(height: int) -> Tuple[Tuple[str, ...], ...]:
+    """graph_index_tables() with the block characters already looked up (usable with str.translate)."""
+    return tuple(tuple(BLOCK_CHARS[i] for i in row) for row in graph_index_tables(height))
+
+
+def graph_window(values: GraphValues, width: int) -> Tuple[Sequence[float], float]:
+    """
+    The last width values, left-padded with zeros, and the largest of them. A RingBuffer
+    hands out a view of its own storage and its tracked maximum, so a full window costs no copy.
+    """
+    if isinstance(values, RingBuffer):
+        window = values.window(width)
+        peak = values.max(width)
+    else:
+        window = values[-width:]
+        peak = max(window) if len(window) else 0.0
+    if len(window) < width:
+        window = [0.0] * (width - len(window)) + list(window)
+        peak = max(peak, 0.0)
+    return window, peak
+
+
+def level_codes(values: List[float], scale_max: float, height: int) -> List[int]:
+    """Normalises a series once per frame into one level code per column."""
+    top = 8 * height
+    scale = top / scale_max if scale_max > 0 else 0.0
+    codes = []
+    append = codes.append
+    for val in values:
+        # The nudge keeps exact fractions (50% of 5 rows) from truncating to the block below
+        eighths = val * scale + 1e-9
+        if eighths <= 2e-9:
+            append(0)
+        elif eighths >= top:
+            append(2 * top)
+        else:
+            whole = int(eighths)
+            append(2 * whole + (eighths - whole > 2e-9))
+    return codes
+
+
+def render_ascii_graph(values: GraphValues, width: int = 40, height: int = 4, title: str = "", unit: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
+    """Generates Alien ASCII graph rows using unicode block chars with dynamic width/height."""
+    padded, peak = graph_window(values, width)
+
+    max_val = peak if peak > 0 else 1.0
     latest = padded[-1]
 
     header = f"{CLR_BOLD}{border_color}⎔─ {title} {CLR_RESET}{CLR_DIM}(Current: {latest:.1f}{unit} | Peak: {max_val:.1f}{unit}){CLR_RESET}"
     header = truncate_ansi(header, width + 2)
     lines = [header]
 
-    for h in reversed(range(height)):
-        row_str = f"{CLR_BOLD}{border_color}│{CLR_RESET}"
-        threshold_low = h / height
-        threshold_high = (h + 1) / height
-
-        for val in padded:
-            norm = val / max_val if max_val > 0 else 0
-            if norm >= threshold_high:
-                idx = 8
-            elif norm <= threshold_low:
-                idx = 0
-            else:
-                fraction = (norm - threshold_low) * height
-                idx = min(8, max(1, int(fraction * 8)))
-
-            char = BLOCK_CHARS[idx]
-            if idx > 0:
-                row_str += f"{main_color}{char}{CLR_RESET}"
-            else:
-                row_str += " "
-
-        lines.append(row_str)
+    # Level codes as characters, so each row is a single str.translate() through its glyph table
+    codes = "".join(map(chr, level_codes(padded, max_val, height)))
+    # One color run per row: blank cells look the same with or without the color applied
+    left = f"{CLR_BOLD}{border_color}│{CLR_RESET}{main_color}"
+    for glyphs in graph_glyph_tables(height):
+        lines.append(left + codes.translate(glyphs) + CLR_RESET)
 
     footer = f"{CLR_BOLD}{border_color}└{'─' * width}{CLR_RESET}"
     lines.append(footer)
     return lines
 
 
-def render_dual_ascii_graph(down_values: List[float], up_values: List[float], width: int = 40, height: int = 4, title: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
+def render_sparkline(values: GraphValues, width: int, color: str = CLR_LIGHT_GREEN) -> str:
+    """One-row graph of the last width values, scaled to their own peak."""
+    padded, peak = graph_window(values, width)
+    codes = "".join(map(chr, level_codes(padded, peak if peak > 0 else 1.0, 1)))
+    return f"{color}{codes.translate(graph_glyph_tables(1)[0])}{CLR_RESET}"
+
+
+def render_dual_ascii_graph(down_values: GraphValues, up_values: GraphValues, width: int = 40, height: int = 4, title: str = "", main_color: str = CLR_LIGHT_GREEN, border_color: str = CLR_GREEN) -> List[str]:
     """Renders Alien dual graph for Download vs Upload."""
-    p_down = down_values[-width:]
-    p_up = up_values[-width:]
-    if len(p_down) < width:
-        p_down = [0.0] * (width - len(p_down)) + p_down
-    if len(p_up) < width:
-        p_up = [0.0] * (width - len(p_up)) + p_up
-
-    max_down = max(p_down) if max(p_down) > 0 else 1.0
-    max_up = max(p_up) if max(p_up) > 0 else 1.0
+    p_down, peak_down = graph_window(down_values, width)
+    p_up, peak_up = graph_window(up_values, width)
+
+    max_down = peak_down if peak_down > 0 else 1.0
+    max_up = peak_up if peak_up > 0 else 1.0
     max_combined = max(max_down, max_up)
 
     curr_down = format_bytes(p_down[-1])
@@ -351,28 +389,22 @@ def render_dual_ascii_graph(down_values: List[float], up_values: List[float], wi
     header = truncate_ansi(header, width + 2)
     lines = [header]
 
-    for h in reversed(range(height)):
-        row_str = f"{CLR_BOLD}{border_color}│{CLR_RESET}"
-        threshold_low = h / height
-        threshold_high = (h + 1) / height
-
-        for d_val, u_val in zip(p_down, p_up):
-            d_norm = d_val / max_combined if max_combined > 0 else 0
-            u_norm = u_val / max_combined if max_combined > 0 else 0
-
-            d_idx = 8 if d_norm >= threshold_high else (0 if d_norm <= threshold_low else min(8, max(1, int((d_norm - threshold_low) * height * 8))))
-            u_idx = 8 if u_norm >= threshold_high else (0 if u_norm <= threshold_low else min(8, max(1, int((u_norm - threshold_low) * height * 8))))
-
-            if d_idx > 0 and u_idx > 0:
-                row_str += f"{CLR_LIGHT_YELLOW}█{CLR_RESET}"
-            elif d_idx > 0:
-                row_str += f"{CLR_LIGHT_CYAN}{BLOCK_CHARS[d_idx]}{CLR_RESET}"
-            elif u_idx > 0:
-                row_str += f"{CLR_LIGHT_MAGENTA}{BLOCK_CHARS[u_idx]}{CLR_RESET}"
-            else:
-                row_str += " "
-
-        lines.append(row_str)
+    down_codes = level_codes(p_down, max_combined, height)
+    up_codes = level_codes(p_up, max_combined, height)
+    left = f"{CLR_BOLD}{border_color}│{CLR_RESET}"
+    for indexes in graph_index_tables(height):
+        parts = [left]
+        current = None
+        # d * 9 + u picks the cell; the color escape is only written where the color changes
+        for d, u in zip(map(indexes.__getitem__, down_codes), map(indexes.__getitem__, up_codes)):
+            color, char = DUAL_CELLS[d * 9 + u]
+            if color is not None and color is not current:
+                parts.append(color)
+                current = color
+            parts.append(char)
+        if current is not None:
+            parts.append(CLR_RESET)
+        lines.append("".join(parts))
 
     footer = f"{CLR_BOLD}{border_color}└{'─' * width}{CLR_RESET}"
     lines.append(footer)
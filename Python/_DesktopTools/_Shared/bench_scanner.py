@@ -0,0 +1,88 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: bench_scanner.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Measures ParallelScanner throughput for several
+# ☆ worker counts against a plain os.walk baseline.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import argparse
+import shutil
+import tempfile
+import time
+
+from parallel_scanner import ParallelScanner
+from synthetic_tree import make_synthetic_tree
+
+
+def inject_listing_latency(delay_ms):
+    """Wraps os.scandir with a sleep so a local tree behaves like a high latency network share."""
+    real_scandir = os.scandir
+
+    def slow_scandir(path="."):
+        time.sleep(delay_ms / 1000.0)
+        return real_scandir(path)
+
+    os.scandir = slow_scandir
+
+
+def time_os_walk(root):
+    start = time.perf_counter()
+    folders = files = 0
+    for _, _, names in os.walk(root):
+        folders += 1
+        files += len(names)
+    return time.perf_counter() - start, folders, files
+
+
+def time_scanner(root, workers):
+    scanner = ParallelScanner(workers=workers)
+    start = time.perf_counter()
+    for _ in scanner.scan(root):
+        pass
+    return time.perf_counter() - start, scanner.folders_processed, scanner.files_found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ParallelScanner worker scaling benchmark")
+    parser.add_argument("--path", help="Scan an existing folder instead of a synthetic tree (e.g. a network share)")
+    parser.add_argument("--files", type=int, default=100_000, help="Files in the synthetic tree (default: 100000)")
+    parser.add_argument("--workers", default="1,2,4,8,16", help="Comma separated worker counts to try")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Artificial delay per directory listing to mimic a network share (default: 0)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    root = args.path
+    if not root:
+        temp_dir = tempfile.mkdtemp(prefix="bench_scanner_")
+        root = temp_dir
+        print(f"☆ Building synthetic tree with {args.files:,} files in {root}...")
+        make_synthetic_tree(root, total_files=args.files)
+
+    try:
+        # Warm the OS cache once so every run below sees the same conditions
+        time_os_walk(root)
+        if args.latency_ms:
+            inject_listing_latency(args.latency_ms)
+
+        duration, folders, files = time_os_walk(root)
+        print(f"\n{'ENGINE':<14} | {'SECONDS':>8} | {'FOLDERS/S':>10} | {'FILES/S':>10} | {'SPEEDUP':>7}")
+        print("-" * 62)
+        print(f"{'os.walk':<14} | {duration:>8.2f} | {folders / duration:>10,.0f} | {files / duration:>10,.0f} | {1.0:>6.2f}x")
+        baseline = duration
+
+        for workers in (int(w) for w in args.workers.split(",")):
+            duration, folders, files = time_scanner(root, workers)
+            label = f"scanner x{workers}"
+            print(f"{label:<14} | {duration:>8.2f} | {folders / duration:>10,.0f} | {files / duration:>10,.0f} | {baseline / duration:>6.2f}x")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: parallel_scanner.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Work-stealing directory scanner built on os.scandir.
+# ☆ N worker threads list directories concurrently and hand back
+# ☆ (dir, entries) batches to a single consumer.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import queue
+import threading
+from collections import deque
+
+DEFAULT_WORKERS = 8
+
+# Completed batches waiting for the consumer; bounds memory when the consumer is slower than the disk
+RESULT_QUEUE_SIZE = 1024
+
+_DONE = object()
+
+
+class _WorkerError:
+    """Carries an unexpected exception from a worker thread to scan(), which re-raises it."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def list_directory(path, prune=None):
+    """
+    Returns every os.DirEntry of path plus the subdirectories to descend into (symlinks are not followed).
+    Subdirectories for which prune(path, entry) is true are dropped from both lists, so they are never listed.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    sub_dirs = []
+    pruned = set()
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if prune is not None and prune(entry.path, entry):
+                    pruned.add(entry.path)
+                    continue
+                sub_dirs.append(entry.path)
+        except OSError:
+            continue
+    if pruned:
+        entries = [entry for entry in entries if entry.path not in pruned]
+    return entries, sub_dirs
+
+
+def is_file_entry(entry):
+    """Follows symlinks like os.walk: a link to a directory is not a file; a link to a file, or a broken link, is."""
+    try:
+        return not entry.is_dir()
+    except OSError:
+        return True
+
+
+class ParallelScanner:
+    """
+    Scans a directory tree with a pool of worker threads. Each worker keeps its own
+    deque of pending folders (LIFO, depth first) and steals from the oldest end of a
+    busy worker's deque when it runs dry. os.scandir releases the GIL while waiting
+    on the disk, so several listings are in flight at once.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, on_error=None, lister=None, prune=None):
+        self.workers = max(1, int(workers))
+        self.on_error = on_error
+        # lister(task) -> (result, child_tasks); by default tasks are paths and results their DirEntry lists
+        self._counts_files = lister is None
+        if lister is None:
+            lister = list_directory if prune is None else (lambda path: list_directory(path, prune))
+        self.lister = lister
+        # Progress counters, only touched by the consuming thread
+        self.folders_processed = 0
+        self.files_found = 0
+
+        self._deques = []
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._work_ready = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._results = None
+
+    def scan(self, root):
+        """
+        Yields (dir_path, entries) for root and every folder below it. A parent is always yielded
+        before its children. With a custom lister, root and the yielded pairs are its own
+        (task, result) values and files_found is left to the caller.
+        """
+        self.folders_processed = 0
+        self.files_found = 0
+        if self.workers == 1:
+            batches = self._scan_inline(root)
+        else:
+            batches = self._scan_threaded(root)
+
+        for dir_path, entries in batches:
+            self.folders_processed += 1
+            if self._counts_files:
+                self.files_found += sum(1 for entry in entries if is_file_entry(entry))
+            yield dir_path, entries
+
+    def _scan_inline(self, root):
+        """Single-threaded path for workers=1, without any queue or thread overhead."""
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                entries, sub_dirs = self.lister(path)
+            except OSError as e:
+                if self.on_error:
+                    self.on_error(e)
+                continue
+            yield path, entries
+            stack.extend(reversed(sub_dirs))
+
+    def _scan_threaded(self, root):
+        self._deques = [deque() for _ in range(self.workers)]
+        self._deques[0].append(root)
+        self._pending = 1
+        self._stop.clear()
+        self._results = queue.Queue(maxsize=RESULT_QUEUE_SIZE)
+
+        threads = [threading.Thread(target=self._worker, args=(i,), daemon=True) for i in range(self.workers)]
+        for t in threads:
+            t.start()
+
+        try:
+            while True:
+                item = self._results.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _WorkerError):
+                    raise item.error
+                if isinstance(item, OSError):
+                    if self.on_error:
+                        self.on_error(item)
+                    continue
+                yield item
+        finally:
+            # Also reached when the consumer stops early: release every worker, then reap them
+            self._stop.set()
+            with self._work_ready:
+                self._work_ready.notify_all()
+            while any(t.is_alive() for t in threads):
+                try:
+                    self._results.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+    def _next_path(self, index):
+        """Pops local work first, then tries to steal; blocks until work appears or the scan is over."""
+        own = self._deques[index]
+        while not self._stop.is_set():
+            try:
+                return own.pop()
+            except IndexError:
+                pass
+            for offset in range(1, self.workers):
+                victim = self._deques[(index + offset) % self.workers]
+                try:
+                    return victim.popleft()
+                except IndexError:
+                    continue
+            with self._work_ready:
+                if self._pending == 0:
+                    return None
+                if not any(self._deques):
+                    self._work_ready.wait(0.05)
+        return None
+
+    def _emit(self, item):
+        while not self._stop.is_set():
+            try:
+                self._results.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                continue
+
+    def _worker(self, index):
+        own = self._deques[index]
+        while True:
+            path = self._next_path(index)
+            if path is None:
+                return
+            sub_dirs = []
+            try:
+                entries, sub_dirs = self.lister(path)
+                # Emit before queueing the children so parents always reach the consumer first
+                self._emit((path, entries))
+            except OSError as e:
+                sub_dirs = []
+                self._emit(e)
+            except Exception as e:
+                # A bug in a lister or prune callback: scan() re-raises it instead of waiting forever
+                sub_dirs = []
+                self._emit(_WorkerError(e))
+            finally:
+                # Always account for this folder, so _pending reaches 0 and the pool drains
+                with self._work_ready:
+                    own.extend(reversed(sub_dirs))
+                    self._pending += len(sub_dirs) - 1
+                    if self._pending == 0:
+                        self._work_ready.notify_all()
+                        finished = True
+                    else:
+                        if sub_dirs:
+                            self._work_ready.notify(len(sub_dirs))
+                        finished = False
+            if finished:
+                self._emit(_DONE)
+                return
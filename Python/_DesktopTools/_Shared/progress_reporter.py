@@ -0,0 +1,58 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: progress_reporter.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Single-line terminal progress that redraws at a
+# ☆ fixed wall-clock rate instead of once per scanned folder.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import sys
+import time
+
+DEFAULT_RATE_HZ = 10
+
+
+class ProgressReporter:
+    """
+    Calls render() and redraws the progress line at most rate_hz times per second.
+    tick() is meant to be called from the hot loop: between redraws it costs one clock read.
+    The counters themselves live in the scanner; render() just formats them.
+    """
+
+    def __init__(self, render, rate_hz=DEFAULT_RATE_HZ, enabled=True, stream=None, width=70):
+        self.render = render
+        self.interval = 1.0 / rate_hz if rate_hz else 0.0
+        self.enabled = enabled
+        self.stream = stream or sys.stdout
+        self.width = width
+        self.redraws = 0
+        self._next_draw = 0.0
+        self._drawn = False
+
+    def tick(self):
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if now >= self._next_draw:
+            self._next_draw = now + self.interval
+            self.draw()
+
+    def draw(self):
+        """Redraws the line right now, regardless of the rate limit."""
+        if not self.enabled:
+            return
+        self.stream.write("\r" + self.render()[:self.width].ljust(self.width))
+        self.stream.flush()
+        self.redraws += 1
+        self._drawn = True
+
+    def clear(self):
+        """Blanks the progress line so regular output can be printed over it."""
+        if self._drawn:
+            self.stream.write("\r" + " " * self.width + "\r")
+            self.stream.flush()
+            # The line reappears at the next scheduled redraw, so streaming many results
+            # between ticks does not turn into one redraw per result
+            self._drawn = False
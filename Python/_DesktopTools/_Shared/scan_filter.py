@@ -0,0 +1,143 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: scan_filter.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Decides which subdirectories a scan may enter:
+# ☆ stays on one file system (like du -x / find -xdev) and prunes
+# ☆ excluded paths and glob patterns before they are ever listed.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+import re
+import time
+import fnmatch
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+GLOB_CHARS = set("*?[")
+SEPARATORS = {os.sep, "/"} | ({os.altsep} if os.altsep else set())
+
+SKIP_EXCLUDED = "excluded"
+SKIP_MOUNT = "mount point"
+SKIP_DEVICE = "other device"
+
+
+def read_mount_points(mountinfo_path=MOUNTINFO_PATH):
+    """
+    Returns every mount point listed by the kernel (Linux only, empty elsewhere). Bind mounts
+    keep the same st_dev, and a stale network mount can hang on stat, so known mount points
+    are recognised by path before anything touches them.
+    """
+    try:
+        with open(mountinfo_path, encoding="utf-8", errors="surrogateescape") as f:
+            lines = f.readlines()
+    except OSError:
+        return frozenset()
+    mounts = set()
+    for line in lines:
+        fields = line.split()
+        if len(fields) > 4:
+            # Spaces and friends are escaped as octal, e.g. "/mnt/my\040disk"
+            mounts.add(re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[4]))
+    return frozenset(mounts)
+
+
+class ScanFilter:
+    """
+    Prunes directories at listing time, so skipped subtrees are never read. Exclude tokens
+    containing a path separator are matched against the full directory path (an absolute
+    path without wildcards must match exactly); other tokens against the folder name,
+    e.g. "node_modules", ".git", "*.cache" or "/home/*/Downloads". Matching follows the
+    platform's case rules. Every skip is recorded with the time its check took, so slow or
+    stale mounts show up in the report.
+    """
+
+    def __init__(self, root, one_file_system=False, excludes=()):
+        self.root = os.path.abspath(root)
+        self.one_file_system = one_file_system
+        self.root_dev = os.stat(self.root).st_dev if one_file_system else None
+        self.mount_points = read_mount_points() - {self.root} if one_file_system else frozenset()
+
+        self.excluded_paths = set()
+        self.excluded_names = set()
+        path_globs = []
+        name_globs = []
+        for token in excludes:
+            token = token.strip()
+            if not token:
+                continue
+            is_glob = bool(GLOB_CHARS & set(token))
+            if SEPARATORS & set(token.rstrip("/" + os.sep)):
+                if is_glob:
+                    path_globs.append(fnmatch.translate(os.path.normcase(token)))
+                else:
+                    self.excluded_paths.add(os.path.normcase(os.path.abspath(token)))
+            elif is_glob:
+                name_globs.append(fnmatch.translate(os.path.normcase(token)))
+            else:
+                self.excluded_names.add(os.path.normcase(token.rstrip("/" + os.sep)))
+        self.path_regex = re.compile("|".join(path_globs)) if path_globs else None
+        self.name_regex = re.compile("|".join(name_globs)) if name_globs else None
+
+        # (path, reason, seconds spent deciding); list.append is atomic, so worker threads share it safely
+        self.skipped = []
+
+    @property
+    def active(self):
+        return bool(self.one_file_system or self.excluded_paths or self.excluded_names
+                    or self.path_regex or self.name_regex)
+
+    def _is_excluded(self, path):
+        name = os.path.normcase(os.path.basename(path))
+        if name in self.excluded_names or (self.name_regex and self.name_regex.match(name)):
+            return True
+        full = os.path.normcase(path)
+        return full in self.excluded_paths or bool(self.path_regex and self.path_regex.match(full))
+
+    def skip_dir(self, path, entry=None):
+        """
+        True if the directory at path must not be entered. entry (an os.DirEntry) saves a stat when given.
+        Each skip is recorded with the time the whole decision took: microseconds for a name or a
+        listed mount point, the st_dev probe for anything else.
+        """
+        start = time.perf_counter()
+        if self._is_excluded(path):
+            self.skipped.append((path, SKIP_EXCLUDED, time.perf_counter() - start))
+            return True
+        if not self.one_file_system:
+            return False
+        if path in self.mount_points:
+            self.skipped.append((path, SKIP_MOUNT, time.perf_counter() - start))
+            return True
+
+        try:
+            st = entry.stat(follow_symlinks=False) if entry is not None else None
+            if st is None or st.st_dev == 0:
+                # Windows DirEntry stats carry no st_dev
+                st = os.lstat(path)
+        except OSError:
+            return False
+        if st.st_dev != self.root_dev:
+            self.skipped.append((path, SKIP_DEVICE, time.perf_counter() - start))
+            return True
+        return False
+
+    def report_rows(self):
+        """Skipped directories as (path, reason, seconds), slowest check first."""
+        return sorted(self.skipped, key=lambda row: (-row[2], row[0]))
+
+
+def add_filter_arguments(parser):
+    """Adds --one-file-system and --exclude to an argparse parser."""
+    parser.add_argument("--one-file-system", "-x", action="store_true",
+                        help="Stay on the file system of the scanned path (skip /proc, network and bind mounts).")
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN",
+                        help="Skip folders by name, glob or path, e.g. node_modules, '*.cache', /mnt/backup "
+                             "(repeatable, or comma separated).")
+
+
+def exclude_list(values):
+    """Flattens repeated and comma separated --exclude values."""
+    return [token.strip() for value in values for token in value.split(",") if token.strip()]
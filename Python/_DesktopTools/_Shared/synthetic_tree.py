@@ -0,0 +1,48 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: synthetic_tree.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: Builds throwaway directory trees of a chosen shape
+# ☆ for the desktop tool benchmarks.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import os
+
+EXTENSIONS = ["txt", "pdf", "log", "jpg", "py", "dll", "json", "mp4"]
+
+
+def make_synthetic_tree(root, total_files=100_000, files_per_dir=50, fanout=8, file_size=0):
+    """
+    Creates roughly total_files files under root, files_per_dir per folder, with every
+    folder holding up to fanout subfolders. Files get file_size bytes plus a small
+    per-file variation so size based tools have something to sort.
+    Returns (folders_created, files_created).
+    """
+    os.makedirs(root, exist_ok=True)
+    folders = [root]
+    created_dirs = 1
+    created_files = 0
+    cursor = 0
+
+    while created_files < total_files:
+        parent = folders[cursor]
+        cursor += 1
+        for d in range(fanout):
+            path = os.path.join(parent, f"dir_{d:02d}")
+            os.makedirs(path, exist_ok=True)
+            folders.append(path)
+            created_dirs += 1
+
+            for f in range(min(files_per_dir, total_files - created_files)):
+                ext = EXTENSIONS[(created_files + f) % len(EXTENSIONS)]
+                with open(os.path.join(path, f"file_{f:04d}.{ext}"), "wb") as fh:
+                    size = file_size + (created_files + f) % 997 if file_size else 0
+                    if size:
+                        fh.write(b"\0" * size)
+            created_files += min(files_per_dir, total_files - created_files)
+            if created_files >= total_files:
+                break
+
+    return created_dirs, created_files
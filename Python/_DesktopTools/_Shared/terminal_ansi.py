@@ -0,0 +1,127 @@
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+# ☆ Author: ☆ MelodyHSong ☆
+# ☆ Language: Python
+# ☆ File Name: terminal_ansi.py
+# ☆ Date: 2026-10-18
+# ☆
+# ☆ Description: ANSI colours, cursor control and width-aware text
+# ☆ helpers shared by the NetworkInfo HUD and the DriveAnalyzer browser.
+# ☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆☆
+
+import re
+import sys
+import shutil
+import unicodedata
+from typing import Tuple
+
+# ANSI Color and Control Codes
+CLR_RESET = "\033[0m"
+CLR_BOLD = "\033[1m"
+CLR_DIM = "\033[2m"
+CLR_BLINK = "\033[5m"
+
+CLR_CYAN = "\033[36m"
+CLR_LIGHT_CYAN = "\033[96m"
+CLR_GREEN = "\033[32m"
+CLR_LIGHT_GREEN = "\033[92m"
+CLR_YELLOW = "\033[33m"
+CLR_LIGHT_YELLOW = "\033[93m"
+CLR_RED = "\033[31m"
+CLR_LIGHT_RED = "\033[91m"
+CLR_MAGENTA = "\033[35m"
+CLR_LIGHT_MAGENTA = "\033[95m"
+CLR_BLUE = "\033[34m"
+CLR_WHITE = "\033[97m"
+
+# Terminal control
+ANSI_HIDE_CURSOR = "\033[?25l"
+ANSI_SHOW_CURSOR = "\033[?25h"
+ANSI_CURSOR_HOME = "\033[H"
+ANSI_CLEAR_BOTTOM = "\033[J"
+ANSI_CLEAR_LINE = "\033[K"
+ANSI_CLEAR_SCREEN = "\033[2J\033[H"
+
+ANSI_REGEX = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
+
+
+def visible_width(s: str) -> int:
+    """Calculates true visual column width of a string in terminal (handling ANSI and Emojis)."""
+    clean = ANSI_REGEX.sub('', s)
+    w = 0
+    for ch in clean:
+        code = ord(ch)
+        if code >= 0x1F000:
+            w += 2
+        elif unicodedata.east_asian_width(ch) in ('W', 'F'):
+            w += 2
+        else:
+            w += 1
+    return w
+
+
+def truncate_ansi(s: str, max_width: int) -> str:
+    """Truncates ANSI-formatted string to a maximum visual column width while preserving ANSI sequences."""
+    if visible_width(s) <= max_width:
+        return s
+    curr_w = 0
+    res = []
+    in_ansi = False
+    ansi_buf = ""
+    for ch in s:
+        if ch == '\x1b':
+            in_ansi = True
+            ansi_buf = ch
+            continue
+        if in_ansi:
+            ansi_buf += ch
+            if ch.isalpha():
+                in_ansi = False
+                res.append(ansi_buf)
+                ansi_buf = ""
+            continue
+
+        w = visible_width(ch)
+        if curr_w + w > max_width:
+            break
+        curr_w += w
+        res.append(ch)
+    return "".join(res) + CLR_RESET
+
+
+def center_ansi(s: str, total_width: int) -> str:
+    """Pads string centered according to its visual column width, truncating if necessary."""
+    s = truncate_ansi(s, total_width)
+    v_len = visible_width(s)
+    if v_len >= total_width:
+        return s
+    pad_total = total_width - v_len
+    left_pad = pad_total // 2
+    right_pad = pad_total - left_pad
+    return ' ' * left_pad + s + ' ' * right_pad
+
+
+def safe_write(text: str):
+    """Safely writes UTF-8 text to stdout across all platforms without charmap encoding crashes."""
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except UnicodeEncodeError:
+        try:
+            sys.stdout.buffer.write(text.encode("utf-8", errors="replace"))
+            sys.stdout.buffer.flush()
+        except Exception:
+            pass
+
+
+def hide_cursor():
+    safe_write(ANSI_HIDE_CURSOR)
+
+
+def show_cursor():
+    safe_write(ANSI_SHOW_CURSOR)
+
+
+def get_terminal_dimensions() -> Tuple[int, int]:
+    """Returns (columns, lines) of current terminal window."""
+    size = shutil.get_terminal_size(fallback=(80, 24))
+    return size.columns, size.lines